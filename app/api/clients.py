@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Path, Query
 from typing import List, Dict
-from app.services.client_services import get_all_clients, get_client_by_id, get_client_portfolio, get_client_summary, get_client_performance_analysis
+from app.services.client_services import get_all_clients_async, get_client_by_id_async, get_client_portfolio_async, get_client_summary, get_client_performance_analysis
+from app.core.concurrency import run_blocking
 from app.core.config import settings
 from app.services.portfolio_chart_service import get_portfolio_chart_ai_summary
 from openai import OpenAI
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 async def fetch_all_clients():
     """모든 고객 목록을 반환합니다."""
     try:
-        clients = get_all_clients()
+        clients = await get_all_clients_async()
         return clients
     except Exception as e:
         logger.error(f"Error in fetch_all_clients: {e}")
@@ -23,7 +24,7 @@ async def fetch_all_clients():
 async def fetch_client_detail(client_id: str = Path(..., description="고객 ID")):
     """특정 고객의 상세 정보를 반환합니다."""
     try:
-        client = get_client_by_id(client_id)
+        client = await get_client_by_id_async(client_id)
         if not client:
             raise HTTPException(status_code=404, detail=f"Client with id {client_id} not found")
         return client
@@ -37,7 +38,7 @@ async def fetch_client_detail(client_id: str = Path(..., description="고객 ID"
 async def fetch_client_portfolio(client_id: str = Path(..., description="고객 ID")):
     """특정 고객의 포트폴리오를 반환합니다."""
     try:
-        portfolio = get_client_portfolio(client_id)
+        portfolio = await get_client_portfolio_async(client_id)
         return portfolio
     except Exception as e:
         logger.error(f"Error in fetch_client_portfolio: {e}")
@@ -50,7 +51,7 @@ async def fetch_client_summary(
 ):
     """특정 고객의 종합 정보를 반환합니다."""
     try:
-        summary = get_client_summary(client_id, period_end_date)
+        summary = await run_blocking(get_client_summary, client_id, period_end_date)
         if "error" in summary:
             raise HTTPException(status_code=404, detail=summary["error"])
         return summary
@@ -67,7 +68,7 @@ async def fetch_client_performance(
 ):
     """특정 고객의 성과 분석을 반환합니다."""
     try:
-        performance = get_client_performance_analysis(client_id, period_end_date)
+        performance = await run_blocking(get_client_performance_analysis, client_id, period_end_date)
         if "error" in performance:
             raise HTTPException(status_code=404, detail=performance["error"])
         return performance
@@ -84,7 +85,7 @@ async def fetch_client_portfolio_chart_ai_summary(client_id: str = Path(..., des
     """
     try:
         # .env에서 OPENAI_API_KEY를 읽어 OpenAIClient 인스턴스 생성
-        summary = get_portfolio_chart_ai_summary(client_id)
+        summary = await run_blocking(get_portfolio_chart_ai_summary, client_id)
         return {"ai_summary": summary}
     except Exception as e:
         logger.error(f"Error in fetch_client_portfolio_chart_ai_summary: {e}")
@@ -2,7 +2,7 @@
 기업 섹터 정보 API
 """
 from fastapi import APIRouter, HTTPException
-from app.services.company_sector_service import get_company_sector_by_ticker
+from app.services.company_sector_service import get_company_sector_by_ticker_async
 import logging
 
 router = APIRouter()
@@ -24,7 +24,7 @@ async def get_company_sector(ticker: str):
         ticker = ticker.upper()
         
         # 섹터 정보 조회
-        result = get_company_sector_by_ticker(ticker)
+        result = await get_company_sector_by_ticker_async(ticker)
         
         if result.get("sector") is None and "message" in result:
             raise HTTPException(status_code=404, detail=result["message"])
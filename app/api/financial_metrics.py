@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Optional
-from app.services.crawler import get_financial_metrics_from_sec
+from app.services.crawler import get_financial_metrics_from_fmp_async
 
 router = APIRouter()
 
@@ -13,7 +13,8 @@ async def get_financial_metrics(symbol: str, end_date: Optional[str] = Query(Non
     - end_date: 해당 날짜를 기준으로 연도 계산 (선택사항)
     """
     try:
-        result = get_financial_metrics_from_sec(symbol.upper(), end_date)
+        # end_date는 호환성을 위해 유지 (FMP는 최근 2년치를 반환)
+        result = await get_financial_metrics_from_fmp_async(symbol.upper())
         
         if "error" in result:
             raise HTTPException(status_code=404, detail=result["error"])
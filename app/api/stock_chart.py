@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List
 from app.services.stock_chart import StockChartService
+from app.core.concurrency import run_blocking
 
 router = APIRouter()
 
@@ -18,7 +19,8 @@ async def get_stock_chart_summary(
     - **end_date**: 종료일 (YYYY-MM-DD)
     """
     try:
-        result = StockChartService.get_chart_summary(
+        result = await run_blocking(
+            StockChartService.get_chart_summary,
             ticker=symbol,
             start_date=start_date,
             end_date=end_date
@@ -52,7 +54,8 @@ async def get_combined_chart_get(
         chart_types_list = [ct.strip() for ct in chart_types.split(",")]
         ma_periods_list = [int(mp.strip()) for mp in ma_periods.split(",")]
         
-        result = StockChartService.get_combined_chart(
+        result = await run_blocking(
+            StockChartService.get_combined_chart,
             ticker=symbol,
             start_date=start_date,
             end_date=end_date,
@@ -0,0 +1,68 @@
+import asyncio
+import os
+import time
+
+# Settings 필수 값 (실제 DB/외부 API에는 접속하지 않음)
+for key in ("DB_HOST", "DB_NAME", "DB_USER", "DB_PASSWORD", "FRED_API_KEY", "OPENAI_API_KEY", "FMP_API_KEY"):
+    os.environ.setdefault(key, "test")
+
+import httpx
+from fastapi import FastAPI
+
+from app.api import clients, stock_chart
+
+BLOCKING_SECONDS = 0.5
+CONCURRENT_REQUESTS = 4
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(clients.router, prefix="/api/v1")
+    app.include_router(stock_chart.router, prefix="/api/v1")
+    return app
+
+
+async def _fire_concurrently(app: FastAPI, urls):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(url) for url in urls))
+        return responses, time.perf_counter() - start
+
+
+def test_blocking_client_summary_requests_overlap(monkeypatch):
+    def slow_summary(client_id, period_end_date):
+        time.sleep(BLOCKING_SECONDS)  # 동기 DB/yfinance 호출을 흉내냄
+        return {"client_id": client_id}
+
+    monkeypatch.setattr(clients, "get_client_summary", slow_summary)
+
+    urls = [f"/api/v1/clients/{i}/summary" for i in range(CONCURRENT_REQUESTS)]
+    responses, elapsed = asyncio.run(_fire_concurrently(_build_app(), urls))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert [r.json()["client_id"] for r in responses] == [str(i) for i in range(CONCURRENT_REQUESTS)]
+    # 직렬 처리라면 BLOCKING_SECONDS * CONCURRENT_REQUESTS(2초) 이상 걸림
+    assert elapsed < BLOCKING_SECONDS * 2
+
+
+def test_blocking_stock_chart_requests_overlap(monkeypatch):
+    def slow_chart_summary(ticker, start_date, end_date):
+        time.sleep(BLOCKING_SECONDS)
+        return {"ticker": ticker}
+
+    monkeypatch.setattr(stock_chart.StockChartService, "get_chart_summary", staticmethod(slow_chart_summary))
+
+    urls = [
+        f"/api/v1/stock-chart/summary?symbol=T{i}&start_date=2023-01-01&end_date=2023-06-30"
+        for i in range(CONCURRENT_REQUESTS)
+    ]
+    responses, elapsed = asyncio.run(_fire_concurrently(_build_app(), urls))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert elapsed < BLOCKING_SECONDS * 2
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, "-q"])
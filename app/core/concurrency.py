@@ -0,0 +1,40 @@
+# async 라우터에서 동기(블로킹) 작업을 실행하기 위한 공용 스레드 풀
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.core.config import settings
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """동시 실행 수가 BLOCKING_EXECUTOR_WORKERS로 제한된 프로세스 공용 스레드 풀"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BLOCKING_EXECUTOR_WORKERS,
+                    thread_name_prefix="blocking"
+                )
+    return _executor
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    동기 함수(동기 SQLAlchemy, requests, pandas/모델 연산 등)를 공용 스레드 풀에서 실행하고 결과를 기다립니다.
+    이벤트 루프는 그동안 다른 요청을 처리합니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_blocking_executor():
+    """스레드 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
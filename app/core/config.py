@@ -13,6 +13,70 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
 
+    # 커넥션 풀 설정 (프로세스당 엔진 1개를 모든 서비스가 공유)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # 풀에서 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 300
+
+    # async 라우터용 실행 설정
+    BLOCKING_EXECUTOR_WORKERS: int = 16  # 동기 작업을 오프로딩하는 스레드 풀 크기
+    HTTP_CLIENT_TIMEOUT: float = 30.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 50
+
+    # 주가 시계열 인메모리 캐시 (티커별 전체 히스토리, LRU)
+    PRICE_CACHE_ENABLED: bool = True
+    PRICE_CACHE_MAX_MB: int = 256
+
+    # 주차 단위 감성 결과 인메모리 캐시 ((종목, 주차)별 주간 점수 + top3 기사, LRU)
+    WEEKLY_SENTIMENT_CACHE_ENABLED: bool = True
+    WEEKLY_SENTIMENT_CACHE_MAX_WEEKS: int = 5000
+
+    # KeyBERT 후보 구문 임베딩 인메모리 캐시 ((모델, 구문)별 벡터, LRU, 768차원 기준 약 3KB/구문)
+    KEYWORD_PHRASE_CACHE_ENABLED: bool = True
+    KEYWORD_PHRASE_CACHE_MAX_PHRASES: int = 50000
+
+    # 서버 시작 후 백그라운드에서 미리 로드할 모델 (쉼표 구분, 예: "spacy_en,keybert,bart_summarizer")
+    # 비어 있으면 모든 모델은 처음 사용할 때 로드
+    MODEL_WARMUP: str = ""
+
+    # 임베딩/모델 추론 설정
+    # 추론 백엔드: SUMMARIZER_BACKEND = torch | int8 | onnx, EMBEDDING_BACKEND = torch | int8 (CPU 전용 최적화)
+    # onnx는 optimum[onnxruntime] 필요, export 결과는 ONNX_EXPORT_DIR (비어 있으면 <cache_dir>/onnx)에 저장
+    SUMMARIZER_BACKEND: str = "torch"
+    EMBEDDING_BACKEND: str = "torch"
+    ONNX_EXPORT_DIR: str = ""
+    EMBEDDING_BATCH_SIZE: int = 64  # 제목 임베딩 배치 크기
+    EMBEDDING_MAX_CONCURRENCY: int = 1  # 공유 임베딩 모델에서 동시에 encode 하는 요청 수
+    TORCH_NUM_THREADS: int = 0  # torch intra-op 스레드 수 (0이면 torch 기본값)
+
+    # 클러스터링 전 제목 임베딩 차원 축소 (none | pca | umap)
+    # 기사 수가 CLUSTER_REDUCTION_MIN_ARTICLES 이상인 주차에만 적용 (시장 전체 주차 등)
+    CLUSTER_REDUCTION: str = "none"
+    CLUSTER_REDUCTION_DIM: int = 15
+    CLUSTER_REDUCTION_MIN_ARTICLES: int = 200
+    CLUSTER_REDUCTION_SEED: int = 42
+
+    # 키워드 추출용 spaCy 분석 (nlp.pipe)
+    SPACY_N_PROCESS: int = 1  # 1보다 크면 기사가 많을 때 멀티프로세스 파싱
+    SPACY_BATCH_SIZE: int = 32
+
+    # BART 요약 배치 설정
+    SUMMARY_BATCH_SIZE: int = 4  # 한 번에 generate 하는 텍스트 수 (같은 길이 설정끼리, 토큰 길이순 정렬)
+    SUMMARY_MAX_LENGTH_BUCKET: int = 0  # >0이면 max_length를 이 단위로 올려 더 많은 기사를 한 배치로 묶음
+
+    # 기사 요약(BART 영문 + GPT 번역) 영구 캐시 (article_summary_cache 테이블)
+    SUMMARY_CACHE_ENABLED: bool = True
+
+    # 기사 제목 임베딩 디스크 저장소 (비어 있으면 <cache_dir>/embeddings)
+    EMBEDDING_STORE_ENABLED: bool = True
+    EMBEDDING_STORE_DIR: str = ""
+    EMBEDDING_STORE_DTYPE: str = "float32"  # float16이면 디스크/메모리 절반 (클러스터링 결과가 약간 달라질 수 있음)
+    EMBEDDING_STORE_MAX_SEGMENTS: int = 32  # 세그먼트가 이보다 많아지면 추가 후 자동으로 1개로 합침 (0이면 자동 compact 안 함)
+
+    # 주가/지수 mmap 스냅샷 경로 (python -m app.services.price_store export 로 생성, 비어 있으면 DB 사용)
+    PRICE_STORE_DIR: str = ""
+
     # API KEY 설정
     FRED_API_KEY: str
     OPENAI_API_KEY: str = Field(..., env="OPENAI_API_KEY")
@@ -0,0 +1,24 @@
+# 외부 API(FMP 등) 호출용 공용 비동기 HTTP 클라이언트
+import httpx
+from app.core.config import settings
+
+_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """커넥션을 재사용하는 프로세스 공용 httpx.AsyncClient (최초 호출 시 생성)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.HTTP_CLIENT_TIMEOUT,
+            limits=httpx.Limits(max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS)
+        )
+    return _client
+
+
+async def close_http_client():
+    """애플리케이션 종료 시 클라이언트 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,116 @@
+# Prometheus 메트릭: SQL 쿼리 계측(SQLAlchemy 이벤트) + HTTP 라우트 계측(미들웨어)
+import sys
+import time
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "SQL 문 실행 시간",
+    ["caller"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+DB_QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "SQL 문이 반환/변경한 행 수",
+    ["caller"],
+    buckets=(0, 1, 10, 100, 1000, 10000, 100000, 1000000)
+)
+DB_QUERY_ERRORS = Counter("db_query_errors_total", "실패한 SQL 문 수", ["caller"])
+
+HTTP_REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수", ["method", "route"])
+
+EMBEDDING_BATCH_LATENCY = Histogram(
+    "embedding_batch_duration_seconds",
+    "임베딩 배치 1개 encode 시간",
+    ["model"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+EMBEDDING_TEXTS = Counter("embedding_texts_total", "임베딩한 텍스트 수", ["model"])
+
+_UNKNOWN_CALLER = "unknown"
+_SERVICE_PACKAGES = ("app.services", "app.api", "app.master")
+CALLER_OPTION = "metrics_caller"
+
+
+def caller_option(caller: str) -> dict:
+    """
+    쿼리의 caller 라벨을 직접 지정하는 execution_options
+    AsyncEngine(asyncpg)은 greenlet 안에서 cursor를 실행해 스택에 서비스 함수가 보이지 않으므로
+    비동기 쿼리는 conn.execute(..., execution_options=caller_option("module.function"))로 넘깁니다.
+    """
+    return {CALLER_OPTION: caller}
+
+
+def _find_caller() -> str:
+    """
+    호출 스택에서 가장 가까운 서비스/라우터 함수를 'module.function' 형태로 반환
+    (동기 엔진 전용. 비동기 엔진 경로에서는 찾지 못하므로 caller_option 사용)
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_SERVICE_PACKAGES):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return _UNKNOWN_CALLER
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+    context._query_caller = context.execution_options.get(CALLER_OPTION) or _find_caller()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    caller = getattr(context, "_query_caller", _UNKNOWN_CALLER)
+    DB_QUERY_LATENCY.labels(caller).observe(time.perf_counter() - context._query_start_time)
+    # server-side cursor(stream_results) 등 행 수를 알 수 없으면 -1
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        DB_QUERY_ROWS.labels(caller).observe(cursor.rowcount)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    DB_QUERY_ERRORS.labels(getattr(context, "_query_caller", _UNKNOWN_CALLER)).inc()
+
+
+def _route_template(request) -> str:
+    """요청 경로에 매칭되는 라우트 템플릿 (예: /api/v1/clients/{client_id}), 없으면 'unmatched'"""
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", request.url.path)
+    return "unmatched"
+
+
+async def prometheus_middleware(request, call_next):
+    """라우트별 처리 시간 히스토그램과 처리 중 요청 수를 기록하는 HTTP 미들웨어"""
+    method = request.method
+    route = _route_template(request)
+    in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method, route)
+    in_flight.inc()
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        HTTP_REQUEST_LATENCY.labels(method, route, status).observe(time.perf_counter() - start)
+        in_flight.dec()
+
+
+def render_metrics():
+    """Prometheus 텍스트 포맷 (본문, content-type)"""
+    return generate_latest(), CONTENT_TYPE_LATEST
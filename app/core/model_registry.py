@@ -0,0 +1,127 @@
+# ML 모델 레지스트리: 모델을 처음 사용할 때 1회만 로드 (프로세스 공용, 스레드 안전)
+import logging
+import os
+import resource
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """현재 프로세스 상주 메모리(RSS). /proc이 없으면 최대 RSS로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except Exception:
+        return None
+
+
+class _ModelEntry:
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.model = None
+        self.loaded = False
+        self.load_seconds = None
+        self.rss_delta_bytes = None
+        self.loaded_at = None
+        self.last_error = None
+
+
+class ModelRegistry:
+    """
+    이름 -> 로더 함수 등록 후 get(name)으로 모델을 얻습니다.
+    - 첫 호출 시에만 로더 실행 (모델별 lock, 동시에 요청해도 1회만 로드)
+    - 로드 시간과 로드 전후 RSS 증가량 기록 (다른 모델과 동시에 로드되면 RSS 값은 근사치)
+    - 로드 실패는 캐시하지 않음 (다음 호출에서 재시도)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._warmup_thread = None
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _ModelEntry(name, loader)
+
+    def get(self, name: str):
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 모델: {name}")
+        if entry.loaded:
+            return entry.model
+
+        with entry.lock:
+            if not entry.loaded:
+                logger.info(f"모델 로딩 시작: {name}")
+                rss_before = _current_rss_bytes()
+                start = time.perf_counter()
+                try:
+                    model = entry.loader()
+                except Exception as e:
+                    entry.last_error = str(e)
+                    logger.error(f"모델 로딩 실패: {name}: {e}")
+                    raise
+                entry.load_seconds = time.perf_counter() - start
+                rss_after = _current_rss_bytes()
+                if rss_before is not None and rss_after is not None:
+                    entry.rss_delta_bytes = rss_after - rss_before
+                entry.model = model
+                entry.loaded_at = time.time()
+                entry.last_error = None
+                entry.loaded = True
+                logger.info(f"모델 로딩 완료: {name} ({entry.load_seconds:.1f}s)")
+        return entry.model
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.loaded
+
+    def warm_up(self, names: Iterable[str]):
+        """지정한 모델을 순서대로 로드합니다. (실패한 모델은 건너뜀)"""
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.warning(f"모델 warm-up 실패: {name}: {e}")
+
+    def warm_up_in_background(self, names: Iterable[str]):
+        """서버가 요청을 받기 시작한 뒤 백그라운드 스레드에서 모델을 미리 로드합니다."""
+        names = [name for name in names if name in self._entries]
+        if not names:
+            return None
+        self._warmup_thread = threading.Thread(
+            target=self.warm_up, args=(names,), name="model-warmup", daemon=True
+        )
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def stats(self) -> dict:
+        rss = _current_rss_bytes()
+        return {
+            "process_rss_mb": round(rss / (1024 * 1024), 1) if rss is not None else None,
+            "warmup_running": bool(self._warmup_thread and self._warmup_thread.is_alive()),
+            "models": {
+                name: {
+                    "loaded": entry.loaded,
+                    "load_seconds": round(entry.load_seconds, 3) if entry.load_seconds is not None else None,
+                    "rss_delta_mb": round(entry.rss_delta_bytes / (1024 * 1024), 1) if entry.rss_delta_bytes is not None else None,
+                    "loaded_at": entry.loaded_at,
+                    "last_error": entry.last_error,
+                }
+                for name, entry in self._entries.items()
+            },
+        }
+
+
+# 프로세스 공용 레지스트리
+model_registry = ModelRegistry()
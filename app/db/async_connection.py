@@ -0,0 +1,53 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from app.core.config import settings
+from app.db.connection import get_database_url
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 전역 비동기 엔진 (asyncpg, 최초 호출 시 1회 생성)
+_async_engine = None
+_async_engine_lock = asyncio.Lock()
+
+
+def get_async_database_url() -> str:
+    """동기 DSN(psycopg2)을 asyncpg 드라이버 DSN으로 변환합니다. (Cloud SQL ?host= 소켓 경로 포함)"""
+    url = get_database_url()
+    if url.startswith("postgresql+psycopg2://"):
+        return "postgresql+asyncpg://" + url[len("postgresql+psycopg2://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    return url
+
+
+async def get_async_engine() -> AsyncEngine:
+    """프로세스 공용 비동기 SQLAlchemy 엔진을 반환합니다. (최초 호출 시 생성)"""
+    global _async_engine
+    if _async_engine is not None:
+        return _async_engine
+
+    async with _async_engine_lock:
+        if _async_engine is None:
+            try:
+                _async_engine = create_async_engine(
+                    get_async_database_url(),
+                    pool_pre_ping=True,
+                    pool_recycle=settings.DB_POOL_RECYCLE,
+                    pool_size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_MAX_OVERFLOW,
+                    pool_timeout=settings.DB_POOL_TIMEOUT
+                )
+                logger.info(f"Async database engine created (pool_size={settings.DB_POOL_SIZE})")
+            except Exception as e:
+                logger.error(f"Async database engine creation error: {e}")
+                raise
+    return _async_engine
+
+
+async def dispose_async_engine():
+    """비동기 엔진과 풀의 모든 커넥션을 정리합니다. (종료 시 호출)"""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
@@ -1,40 +1,124 @@
-from app.db.database import engine as main_engine
 import os
+import time
+import threading
 from sqlalchemy import create_engine
-import logging  
+from sqlalchemy.pool import QueuePool
+from app.core.config import settings
+import logging
 
 logger = logging.getLogger(__name__)
 
-def get_sqlalchemy_engine():
-    """SQLAlchemy 엔진을 생성합니다."""
-    try:
-        # 환경변수에서 DATABASE_URL 가져오기
-        database_url = os.getenv('DATABASE_URL')
-        
-        if not database_url:
-            # Cloud SQL 연결 정보로 URL 구성
-            db_host = os.getenv('DB_HOST')
-            db_port = os.getenv('DB_PORT', '5432')
-            db_name = os.getenv('DB_NAME')
-            db_user = os.getenv('DB_USER')
-            db_password = os.getenv('DB_PASSWORD')
-            
-            if db_host and db_host.startswith('/cloudsql/'):
-                # Cloud SQL Unix 소켓 연결
-                database_url = f"postgresql+psycopg2://{db_user}:{db_password}@/{db_name}?host={db_host}"
+# 프로세스 전역 엔진 (최초 호출 시 1회 생성, 모든 서비스가 공유)
+_engine = None
+_engine_lock = threading.Lock()
+
+
+class PoolWaitStats:
+    """커넥션 풀 대기(checkout) 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
             else:
-                # TCP 연결
-                database_url = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        
-        engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
-            pool_recycle=300,
-            pool_size=5,
-            max_overflow=10
-        )
-        
-        return engine
-    except Exception as e:
-        logger.error(f"Database engine creation error: {e}")
-        raise
\ No newline at end of file
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+            }
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """커넥션을 얻기까지 걸린 시간(신규 연결 생성 포함)을 기록하는 QueuePool"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except Exception:
+            pool_wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_wait_stats.record(time.perf_counter() - start)
+        return conn
+
+
+def get_database_url() -> str:
+    """환경변수 DATABASE_URL이 있으면 우선 사용하고, 없으면 Settings 기반 URL을 사용합니다."""
+    return os.getenv('DATABASE_URL') or settings.DATABASE_URL
+
+
+def get_sqlalchemy_engine():
+    """프로세스 공용 SQLAlchemy 엔진을 반환합니다. (최초 호출 시 생성)"""
+    global _engine
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            try:
+                _engine = create_engine(
+                    get_database_url(),
+                    poolclass=InstrumentedQueuePool,
+                    pool_pre_ping=True,
+                    pool_recycle=settings.DB_POOL_RECYCLE,
+                    pool_size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_MAX_OVERFLOW,
+                    pool_timeout=settings.DB_POOL_TIMEOUT
+                )
+                logger.info(
+                    f"Database engine created (pool_size={settings.DB_POOL_SIZE}, "
+                    f"max_overflow={settings.DB_MAX_OVERFLOW})"
+                )
+            except Exception as e:
+                logger.error(f"Database engine creation error: {e}")
+                raise
+    return _engine
+
+
+def get_pool_status() -> dict:
+    """커넥션 풀 사용 현황과 대기 통계를 반환합니다."""
+    if _engine is None:
+        return {"initialized": False, **pool_wait_stats.snapshot()}
+
+    pool = _engine.pool
+    return {
+        "initialized": True,
+        "pool_size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "timeout_sec": pool.timeout(),
+        **pool_wait_stats.snapshot()
+    }
+
+
+def dispose_engine():
+    """엔진과 풀의 모든 커넥션을 정리합니다. (종료 시 또는 fork 이후 호출)"""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
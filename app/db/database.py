@@ -1,11 +1,9 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
 
-DATABASE_URL = settings.DATABASE_URL
-
-engine = create_engine(DATABASE_URL)
+# 서비스 레이어와 동일한 프로세스 공용 엔진/풀을 사용
+engine = get_sqlalchemy_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -0,0 +1,36 @@
+"""
+서비스 테이블 최초 사용 시 생성 (CREATE TABLE IF NOT EXISTS)
+
+테이블마다 생성은 프로세스당 1회만 시도합니다. DB 역할에 DDL 권한이 없는 등으로 실패하면
+실패 결과도 기억해, 요청마다 실패하는 트랜잭션을 반복하거나 경고를 다시 출력하지 않습니다.
+(False를 받은 호출 측은 테이블 없이 동작하며, 다시 시도하려면 프로세스를 재시작해야 합니다.)
+"""
+import threading
+from typing import Dict
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+
+_table_status: Dict[str, bool] = {}
+_table_lock = threading.Lock()
+
+
+def ensure_table(table_name: str, create_sql: str) -> bool:
+    """create_sql(';'로 구분된 여러 문장 가능)을 한 트랜잭션으로 실행합니다. 반환: 테이블 사용 가능 여부"""
+    status = _table_status.get(table_name)
+    if status is not None:
+        return status
+
+    with _table_lock:
+        if table_name not in _table_status:
+            try:
+                with get_sqlalchemy_engine().begin() as conn:
+                    for statement in create_sql.split(';'):
+                        if statement.strip():
+                            conn.execute(text(statement))
+                _table_status[table_name] = True
+            except Exception as e:
+                print(f"[WARNING] {table_name} 테이블 준비 실패 (재시작 전까지 테이블 없이 동작): {e}")
+                _table_status[table_name] = False
+        return _table_status[table_name]
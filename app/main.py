@@ -2,11 +2,23 @@
 import os
 import logging
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import company, prediction, sentiment, market, summarize, keyword_extractor, stock_chart, return_analysis, industry, clients, portfolio_charts, financial_metrics, valuation, company_sector
 from app.api.intention import router as intention
 from app.services.cache_manager import load_mcdonald_dictionary
+from app.db.connection import get_pool_status, dispose_engine
+from app.db.async_connection import dispose_async_engine
+from app.core.http_client import close_http_client
+from app.core.concurrency import shutdown_blocking_executor
+from app.core.metrics import prometheus_middleware, render_metrics
+from app.services.price_cache import price_cache
+from app.services.price_store import get_price_store
+from app.services.weekly_sentiment_cache import weekly_sentiment_cache
+from app.services.phrase_embedding_cache import phrase_embedding_cache
+from app.core.model_registry import model_registry
+from app.services.embedding_service import title_embedding_service
+from app.core.config import settings
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,6 +48,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 처리 시간/처리 중 요청 수 계측 (/metrics)
+app.middleware("http")(prometheus_middleware)
+
 app.include_router(company.router, prefix="/api/v1")
 app.include_router(prediction.router, prefix="/api/v1")
 app.include_router(sentiment.router, prefix="/api/v1")  # sentiment 라우터 prefix 추가
@@ -80,6 +95,38 @@ def readiness_check():
     logger.info("Readiness check accessed")
     return {"status": "ready", "message": "Service is ready to serve requests"}
 
+@app.get("/db/pool-status")
+def db_pool_status():
+    """DB 커넥션 풀 사용 현황 (checkout/overflow/대기시간) - 풀 사이즈 산정용"""
+    return get_pool_status()
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus 스크레이프 엔드포인트 (SQL 쿼리/HTTP 라우트 메트릭)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+@app.get("/cache/price-stats")
+def price_cache_stats():
+    """주가 시계열 캐시 현황 (적재 티커 수/메모리 사용량/hit·miss) 및 mmap 스냅샷 정보"""
+    store = get_price_store()
+    return {**price_cache.stats(), "store": store.info() if store is not None else None}
+
+@app.get("/cache/weekly-sentiment-stats")
+def weekly_sentiment_cache_stats():
+    """주차 단위 감성 결과 캐시 현황 (캐시된 주차 수/hit·miss/hit ratio/사전 버전)"""
+    return weekly_sentiment_cache.stats()
+
+@app.get("/cache/keyword-phrase-stats")
+def keyword_phrase_cache_stats():
+    """KeyBERT 후보 구문 임베딩 캐시 현황 (구문 수/메모리 사용량/hit·miss)"""
+    return phrase_embedding_cache.stats()
+
+@app.get("/models/status")
+def model_status():
+    """ML 모델 로드 상태 (로드 여부/로드 시간/RSS 증가량) 및 제목 임베딩 배치 통계"""
+    return {**model_registry.stats(), "title_embedding": title_embedding_service.stats()}
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -99,6 +146,12 @@ async def startup_event():
         logger.error(f"⚠️ McDonald 사전 로드 중 오류: {e}")
         # 이 오류로 인해 서버가 시작되지 않는 것을 방지
     
+    # 자주 쓰는 모델은 요청을 받기 시작한 뒤 백그라운드에서 미리 로드
+    warmup_models = [name.strip() for name in settings.MODEL_WARMUP.split(",") if name.strip()]
+    if warmup_models:
+        logger.info(f"🔥 모델 warm-up 시작 (백그라운드): {warmup_models}")
+        model_registry.warm_up_in_background(warmup_models)
+    
     logger.info("✅ 애플리케이션 초기화 완료")
     logger.info(f"📡 서비스가 포트 {port}에서 실행 중입니다.")
 
@@ -108,6 +161,10 @@ async def shutdown_event():
     애플리케이션 종료 시 실행되는 이벤트
     """
     logger.info("🛑 FastAPI 애플리케이션이 종료됩니다.")
+    await close_http_client()
+    await dispose_async_engine()
+    shutdown_blocking_executor()
+    dispose_engine()
 
 # Cloud Run 환경에서 직접 실행될 경우를 위한 설정
 if __name__ == "__main__":
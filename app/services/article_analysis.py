@@ -0,0 +1,92 @@
+"""
+기사 spaCy 분석 (기사당 nlp() 1회)
+
+키워드 추출에 필요한 문장, 개체명, 표제어를 한 번의 파싱 결과에서 모두 만듭니다.
+문장 경계는 기존 remove_last_sentences와 같도록 dependency parser 결과(doc.sents)를 사용합니다.
+결과에는 문자열/집합만 남기고 Doc은 보관하지 않으므로 여러 요청에서 재사용해도 메모리가 늘지 않습니다.
+"""
+import string
+from typing import List, Optional, Sequence, Set, Tuple
+
+from app.core.config import settings
+from app.services.nlp_models import get_spacy
+
+NER_LABELS = {"PERSON", "ORG", "GPE", "LOC", "FAC", "PRODUCT"}
+TAIL_SENTENCES = 3  # 키워드 추출 시 제외하는 마지막 문장 수 (기자 정보, 면책 문구 등)
+
+_KEEP_PUNCTUATION = {'$', '%', "'", '(', ')', '-'}
+_STRIP_TABLE = str.maketrans('', '', ''.join(p for p in string.punctuation if p not in _KEEP_PUNCTUATION))
+
+
+def _named_entities(ents) -> Tuple[Set[str], Set[str]]:
+    original, lowered = set(), set()
+    for ent in ents:
+        if ent.label_ in NER_LABELS:
+            orig = ent.text.strip()
+            original.add(orig)
+            lowered.add(orig.lower())
+    return original, lowered
+
+
+def _lemmatize(tokens, original_ents: Set[str]) -> str:
+    """소문자화 + 구두점 제거 후 알파벳/하이픈 토큰만 표제어로 남깁니다. (숫자가 들어간 토큰은 제외)"""
+    lemmas = []
+    for token in tokens:
+        stripped = token.lower_.translate(_STRIP_TABLE)
+        if not stripped:
+            continue
+        if stripped in original_ents:
+            lemmas.append(stripped)
+        elif stripped.isalpha() or '-' in stripped:
+            # 구두점이 제거된 토큰(U.S. -> us 등)은 표제어 대신 정리된 텍스트 사용
+            lemmas.append(token.lemma_.lower() if stripped == token.lower_ else stripped)
+    return ' '.join(lemmas)
+
+
+class ArticleAnalysis:
+    """
+    기사 1건의 분석 결과
+    - sentences: 문장 목록
+    - entities: 기사 전체의 (원문 개체명, 소문자 개체명)
+    - cleaned_entities: 마지막 TAIL_SENTENCES 문장을 제외한 본문의 개체명
+    - processed: 마지막 문장을 제외한 본문의 표제어 문자열 (KeyBERT 입력)
+    """
+    __slots__ = ('text', 'sentences', 'entities', 'cleaned_entities', 'processed')
+
+    def __init__(self, doc, text: str, tail_sentences: int = TAIL_SENTENCES):
+        self.text = text
+        sents = list(doc.sents)
+        self.sentences = [sent.text for sent in sents]
+        cutoff = sents[-tail_sentences].start if len(sents) > tail_sentences else len(doc)
+
+        self.entities = _named_entities(doc.ents)
+        self.cleaned_entities = _named_entities(ent for ent in doc.ents if ent.end <= cutoff)
+        self.processed = _lemmatize(doc[:cutoff], self.cleaned_entities[0])
+
+    @property
+    def cleaned_text(self) -> str:
+        if len(self.sentences) > TAIL_SENTENCES:
+            return ' '.join(self.sentences[:-TAIL_SENTENCES])
+        return self.text
+
+
+def analyze_article(text: str) -> ArticleAnalysis:
+    return ArticleAnalysis(get_spacy()(text), text)
+
+
+def analyze_articles(texts: Sequence[str], n_process: Optional[int] = None,
+                     batch_size: Optional[int] = None) -> List[ArticleAnalysis]:
+    """
+    여러 기사를 nlp.pipe로 분석합니다.
+    n_process > 1이면 멀티프로세스로 파싱하되, 기사 수가 프로세스당 배치 1개도 안 되면 단일 프로세스로 실행합니다.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    n_process = n_process or settings.SPACY_N_PROCESS
+    batch_size = batch_size or settings.SPACY_BATCH_SIZE
+    if len(texts) < n_process * batch_size:
+        n_process = 1
+
+    docs = get_spacy().pipe(texts, n_process=n_process, batch_size=batch_size)
+    return [ArticleAnalysis(doc, text) for doc, text in zip(docs, texts)]
@@ -0,0 +1,201 @@
+"""
+기사별 McDonald 감성점수 저장소 (article_sentiment 테이블)
+
+kb_enterprise_dataset의 기사 id를 키로 점수와 카테고리별 count/sum, 사전 버전(dict_version),
+본문 해시(content_hash = md5(article))를 저장합니다. 사전 버전이나 본문이 바뀐 행만 다시 계산합니다.
+
+사용법:
+    python -m app.services.article_sentiment backfill [--symbol GS] [--batch-size 1000]
+    (전체 재계산은 멀티프로세스 백필 app.services.sentiment_backfill 사용)
+"""
+import argparse
+import csv
+import io
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.db.table_setup import ensure_table
+
+SENTIMENT_CATEGORIES = ('pos', 'neg', 'uncertainty', 'litigious', 'constraining')
+SENTIMENT_FIELDS = (
+    ('score',)
+    + tuple(f"{c}_cnt" for c in SENTIMENT_CATEGORIES)
+    + tuple(f"{c}_sum" for c in SENTIMENT_CATEGORIES)
+)
+
+BACKFILL_BATCH_SIZE = 1000
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS article_sentiment (
+        article_id BIGINT PRIMARY KEY,
+        stock_symbol TEXT NOT NULL,
+        date DATE,
+        weekstart_sunday DATE,
+        score DOUBLE PRECISION NOT NULL,
+        pos_cnt INTEGER NOT NULL,
+        neg_cnt INTEGER NOT NULL,
+        uncertainty_cnt INTEGER NOT NULL,
+        litigious_cnt INTEGER NOT NULL,
+        constraining_cnt INTEGER NOT NULL,
+        pos_sum DOUBLE PRECISION NOT NULL,
+        neg_sum DOUBLE PRECISION NOT NULL,
+        uncertainty_sum DOUBLE PRECISION NOT NULL,
+        litigious_sum DOUBLE PRECISION NOT NULL,
+        constraining_sum DOUBLE PRECISION NOT NULL,
+        content_hash TEXT NOT NULL,
+        dict_version TEXT NOT NULL,
+        scored_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+    CREATE INDEX IF NOT EXISTS idx_article_sentiment_symbol_week
+        ON article_sentiment (stock_symbol, weekstart_sunday);
+"""
+
+_UPSERT_COLUMNS = ("article_id", "stock_symbol", "date", "weekstart_sunday") + SENTIMENT_FIELDS + ("content_hash", "dict_version")
+UPSERT_SQL = text(f"""
+    INSERT INTO article_sentiment ({", ".join(_UPSERT_COLUMNS)}, scored_at)
+    VALUES ({", ".join(f":{c}" for c in _UPSERT_COLUMNS)}, now())
+    ON CONFLICT (article_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _UPSERT_COLUMNS[1:])},
+        scored_at = now()
+""")
+
+# COPY 적재용 임시 테이블 (커넥션별, 커밋 시 비워짐)
+CREATE_STAGE_TABLE_SQL = text("""
+    CREATE TEMP TABLE IF NOT EXISTS article_sentiment_stage
+        (LIKE article_sentiment INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+""")
+COPY_STAGE_SQL = f"COPY article_sentiment_stage ({', '.join(_UPSERT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+MERGE_STAGE_SQL = text(f"""
+    INSERT INTO article_sentiment ({", ".join(_UPSERT_COLUMNS)}, scored_at)
+    SELECT {", ".join(_UPSERT_COLUMNS)}, now() FROM article_sentiment_stage
+    ON CONFLICT (article_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _UPSERT_COLUMNS[1:])},
+        scored_at = now()
+""")
+
+
+def ensure_article_sentiment_table() -> bool:
+    """article_sentiment 테이블/인덱스가 없으면 생성합니다. 실패 시 False (조회는 실시간 계산으로 동작)"""
+    return ensure_table("article_sentiment", CREATE_TABLE_SQL)
+
+
+def upsert_article_sentiments(records: List[Dict], conn=None):
+    """
+    점수 레코드 목록을 executemany로 upsert 합니다.
+    record 키: article_id, stock_symbol, date, weekstart_sunday, SENTIMENT_FIELDS, content_hash, dict_version
+    """
+    if not records:
+        return
+    if conn is not None:
+        conn.execute(UPSERT_SQL, records)
+        return
+    with get_sqlalchemy_engine().begin() as conn:
+        conn.execute(UPSERT_SQL, records)
+
+
+def copy_article_sentiments(records: List[Dict], conn):
+    """
+    대량 저장용: COPY로 임시 테이블에 적재한 뒤 한 번의 INSERT ... ON CONFLICT로 반영합니다.
+    conn은 트랜잭션이 열린 Connection (engine.begin())이어야 하며, psycopg2 드라이버가 필요합니다.
+    """
+    if not records:
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        # None은 빈 칸 -> COPY csv에서 NULL
+        writer.writerow([record[c] for c in _UPSERT_COLUMNS])
+    buffer.seek(0)
+
+    conn.execute(CREATE_STAGE_TABLE_SQL)
+    with conn.connection.driver_connection.cursor() as cursor:
+        cursor.copy_expert(COPY_STAGE_SQL, buffer)
+    conn.execute(MERGE_STAGE_SQL)
+
+
+def build_record(article_id, stock_symbol, date, weekstart_sunday, content_hash, dict_version, detail: Dict) -> Dict:
+    record = {
+        "article_id": article_id,
+        "stock_symbol": stock_symbol,
+        "date": date,
+        "weekstart_sunday": weekstart_sunday,
+        "content_hash": content_hash,
+        "dict_version": dict_version,
+    }
+    for field in SENTIMENT_FIELDS:
+        record[field] = detail[field]
+    return record
+
+
+def _pending_articles_query(stock_symbol: Optional[str], id_range: bool = False):
+    """점수가 없거나 사전 버전/본문이 바뀐 기사 (id_range=True면 :id_start <= id < :id_end 조건 추가)"""
+    conditions = "AND k.stock_symbol = :stock_symbol" if stock_symbol else ""
+    if id_range:
+        conditions += " AND k.id >= :id_start AND k.id < :id_end"
+    return text(f"""
+        SELECT k.id, k.stock_symbol, k.date, k.weekstart_sunday, k.article, md5(k.article)
+        FROM kb_enterprise_dataset k
+        LEFT JOIN article_sentiment s ON s.article_id = k.id
+        WHERE k.article IS NOT NULL AND k.article != ''
+          AND (s.article_id IS NULL OR s.dict_version <> :dict_version OR s.content_hash <> md5(k.article))
+          {conditions}
+        ORDER BY k.id
+    """)
+
+
+def backfill_article_sentiment(stock_symbol: Optional[str] = None, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    새로 추가되었거나 변경된 기사(또는 사전 버전이 바뀐 기사)만 점수를 계산해 article_sentiment에 저장합니다.
+    반환: 처리한 기사 수
+    """
+    from app.services.cache_manager import get_mcdonald_dictionary_version
+    from app.services.sentiment import get_article_sentiment_details
+    from app.services.weekly_sentiment import invalidate_weekly_rollups
+
+    if not ensure_article_sentiment_table():
+        return 0
+
+    dict_version = get_mcdonald_dictionary_version()
+    params = {"dict_version": dict_version}
+    if stock_symbol:
+        params["stock_symbol"] = stock_symbol
+
+    print(f"[INFO] article_sentiment 백필 시작 (dict_version={dict_version}, stock_symbol={stock_symbol or 'ALL'})")
+    start = time.time()
+    processed = 0
+    engine = get_sqlalchemy_engine()
+    # 읽기(서버사이드 커서)와 쓰기를 서로 다른 커넥션에서 수행
+    with engine.connect() as read_conn:
+        result = read_conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            _pending_articles_query(stock_symbol), params
+        )
+        for rows in result.partitions():
+            details = get_article_sentiment_details([row[4] for row in rows])
+            records = [
+                build_record(article_id, symbol, date, week_start, content_hash, dict_version, detail)
+                for (article_id, symbol, date, week_start, _, content_hash), detail in zip(rows, details)
+            ]
+            upsert_article_sentiments(records)
+            invalidate_weekly_rollups((r['stock_symbol'], r['weekstart_sunday']) for r in records)
+            processed += len(records)
+            elapsed = time.time() - start
+            print(f"[INFO] {processed:,}건 저장 ({processed / elapsed:.1f} articles/sec)")
+
+    print(f"[INFO] article_sentiment 백필 완료: {processed:,}건, {time.time() - start:.1f}s")
+    return processed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="article_sentiment 테이블 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser("backfill", help="신규/변경 기사 감성점수 증분 계산")
+    backfill_parser.add_argument("--symbol", default=None, help="특정 종목만 처리")
+    backfill_parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+
+    args = parser.parse_args()
+    if args.command == "backfill":
+        backfill_article_sentiment(args.symbol, args.batch_size)
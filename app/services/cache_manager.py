@@ -1,22 +1,89 @@
 import json
 import os
 import gzip
+import hashlib
 from datetime import datetime, timedelta
+from typing import List, Optional
+import numpy as np
 from app.db.connection import get_sqlalchemy_engine
 from app.core.config import settings
-from sqlalchemy import text 
+from sqlalchemy import text
 
 
 # 캐시 설정
 CACHE_DIR = getattr(settings, 'cache_dir', None)
 if not CACHE_DIR:
     CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../cache'))
+# 이전 형식 (gzip JSON) - 바이너리 캐시가 없을 때 변환용으로만 사용
 MCDONALD_CACHE_FILE = os.path.join(CACHE_DIR, "mcdonald_dict.json.gz")
+# 바이너리 형식: 정렬된 단어 테이블 + 카테고리 비트마스크 + 카테고리 값 (np.load mmap)
+MCDONALD_WORDS_FILE = os.path.join(CACHE_DIR, "mcdonald_words.npy")
+MCDONALD_FLAGS_FILE = os.path.join(CACHE_DIR, "mcdonald_flags.npy")
+MCDONALD_VALUES_FILE = os.path.join(CACHE_DIR, "mcdonald_values.npy")
+MCDONALD_BINARY_FILES = (MCDONALD_WORDS_FILE, MCDONALD_FLAGS_FILE, MCDONALD_VALUES_FILE)
 CACHE_METADATA_FILE = os.path.join(CACHE_DIR, "cache_metadata.json")
 CACHE_EXPIRY_HOURS = getattr(settings, 'cache_expiry_hours', 48)  # 2일
 
-# 전역 변수: McDonald 사전 메모리 캐시
+# values 컬럼 순서 / flags 비트 순서
+MCDONALD_CATEGORIES = ('positive', 'negative', 'uncertainty', 'litigious', 'constraining')
+
+# 전역 변수: McDonald 사전 (mmap)
 _mcdonald_dict = None
+_mcdonald_dict_version = None
+
+
+class McDonaldDictionary:
+    """
+    mmap으로 연 McDonald 사전
+    - words: 정렬된 고정폭 ASCII 단어 배열 (이진 탐색)
+    - flags: 단어별 카테고리 비트마스크 (bit i = MCDONALD_CATEGORIES[i] 값이 양수)
+    - values: 단어별 카테고리 값 (float64, N x 5)
+    """
+
+    def __init__(self, words: np.ndarray, flags: np.ndarray, values: np.ndarray):
+        self.words = words
+        self.flags = flags
+        self.values = values
+        self.max_word_len = words.dtype.itemsize
+
+    @classmethod
+    def empty(cls):
+        return cls(
+            np.zeros(0, dtype='S1'),
+            np.zeros(0, dtype=np.uint8),
+            np.zeros((0, len(MCDONALD_CATEGORIES)), dtype=np.float64)
+        )
+
+    def __len__(self):
+        return len(self.words)
+
+    def lookup(self, tokens: List[str]) -> np.ndarray:
+        """토큰 목록의 사전 인덱스 배열 (사전에 없으면 -1)"""
+        if len(tokens) == 0 or len(self.words) == 0:
+            return np.full(len(tokens), -1, dtype=np.int64)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        # 고정폭보다 긴 토큰은 잘려서 비교되므로 길이로 제외
+        keys = np.array(tokens, dtype=self.words.dtype)
+        idx = np.searchsorted(self.words, keys)
+        clipped = np.minimum(idx, len(self.words) - 1)
+        found = (idx < len(self.words)) & (self.words[clipped] == keys) & (lengths <= self.max_word_len)
+        return np.where(found, clipped, -1)
+
+    def index_of(self, word: str) -> int:
+        """단어 1개의 사전 인덱스 (없으면 -1)"""
+        if not word or len(word) > self.max_word_len or not word.isascii():
+            return -1
+        return int(self.lookup([word])[0])
+
+    def get(self, word: str, default=None):
+        idx = self.index_of(word)
+        if idx < 0:
+            return default
+        return dict(zip(MCDONALD_CATEGORIES, self.values[idx].tolist()))
+
+    def iter_words(self):
+        return (word.decode('ascii') for word in self.words)
+
 
 def ensure_cache_dir():
     """캐시 디렉토리 생성"""
@@ -24,21 +91,67 @@ def ensure_cache_dir():
         os.makedirs(CACHE_DIR)
         print(f"[INFO] 캐시 디렉토리 생성: {CACHE_DIR}")
 
-def export_mcdonald_dict_to_json():
+def _binary_rows(mcdonald_dict: dict):
+    """바이너리 캐시에 저장되는 (정렬된 ASCII 단어 목록, 단어별 카테고리 값 목록)"""
+    words = sorted(word for word in mcdonald_dict if word and word.isascii())
+    values = [[float(mcdonald_dict[word][category] or 0) for category in MCDONALD_CATEGORIES] for word in words]
+    return words, values
+
+def compute_dictionary_version(words: List[str], values: List[List[float]]) -> str:
+    """
+    바이너리 캐시에 실제로 저장된 단어/값의 해시 (내용이 같으면 재생성해도 같은 버전)
+    export 시(_binary_rows)와 로드된 파일(McDonaldDictionary)에서 같은 값이 나오도록 이 함수 하나만 사용합니다.
+    """
+    canonical = json.dumps([words, values], separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+def _save_npy_atomic(path: str, array: np.ndarray):
+    # 다른 프로세스가 기존 파일을 mmap 중이어도 안전하도록 임시 파일 작성 후 교체
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+def write_mcdonald_binary(mcdonald_dict: dict) -> int:
+    """{word: {category: value}} 사전을 바이너리 캐시 파일로 저장합니다. 반환: 저장한 단어 수"""
+    words, rows = _binary_rows(mcdonald_dict)
+    skipped = len(mcdonald_dict) - len(words)
+    if skipped:
+        print(f"[WARNING] ASCII가 아닌 단어 {skipped}개는 제외합니다.")
+
+    values = np.array(rows, dtype=np.float64).reshape(len(words), len(MCDONALD_CATEGORIES))
+    flags = np.zeros(len(words), dtype=np.uint8)
+    for bit in range(len(MCDONALD_CATEGORIES)):
+        flags |= (values[:, bit] > 0).astype(np.uint8) << bit
+
+    _save_npy_atomic(MCDONALD_WORDS_FILE, np.array(words, dtype='S'))
+    _save_npy_atomic(MCDONALD_FLAGS_FILE, flags)
+    _save_npy_atomic(MCDONALD_VALUES_FILE, values)
+    return len(words)
+
+def _write_metadata(mcdonald_dict: dict, created_at: str = None):
+    metadata = {
+        "created_at": created_at or datetime.now().isoformat(),
+        "word_count": len(mcdonald_dict),
+        "dictionary_version": compute_dictionary_version(*_binary_rows(mcdonald_dict)),
+        "db_query_time": datetime.now().isoformat()
+    }
+    with open(CACHE_METADATA_FILE, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
+
+def export_mcdonald_dictionary():
     """
-    Cloud SQL에서 McDonald 사전을 JSON 파일로 내보내기 (일회성 작업)
+    Cloud SQL에서 McDonald 사전을 바이너리 캐시 파일로 내보내기
     """
-    print("[INFO] McDonald 사전을 Cloud SQL에서 JSON으로 내보내는 중...")
-    
+    print("[INFO] McDonald 사전을 Cloud SQL에서 내보내는 중...")
+
     try:
         ensure_cache_dir()
-        
+
         with get_sqlalchemy_engine().connect() as conn:
-            # 2. SQL 쿼리를 text()로 감싸줍니다.
             query = text("SELECT word, positive, negative, uncertainty, litigious, constraining FROM mcdonald_masterdictionary")
             result = conn.execute(query)
             rows = result.fetchall()
-        
+
             mcdonald_dict = {}
             for row in rows:
                 word, positive, negative, uncertainty, litigious, constraining = row
@@ -50,97 +163,139 @@ def export_mcdonald_dict_to_json():
                     'constraining': constraining
                 }
 
-        # 압축된 JSON 파일로 저장
-        with gzip.open(MCDONALD_CACHE_FILE, 'wt', encoding='utf-8') as f:
-            json.dump(mcdonald_dict, f, indent=2)
-        
+        word_count = write_mcdonald_binary(mcdonald_dict)
+
         # 메타데이터 저장
-        metadata = {
-            "created_at": datetime.now().isoformat(),
-            "word_count": len(mcdonald_dict),
-            "db_query_time": datetime.now().isoformat()
-        }
-        
-        with open(CACHE_METADATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-        
-        print(f"[INFO] McDonald 사전 JSON 내보내기 완료: {len(mcdonald_dict)}개 단어")
-        print(f"[INFO] 파일 저장 위치: {MCDONALD_CACHE_FILE}")
+        _write_metadata(mcdonald_dict)
+
+        print(f"[INFO] McDonald 사전 내보내기 완료: {word_count}개 단어")
+        print(f"[INFO] 파일 저장 위치: {CACHE_DIR}")
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] McDonald 사전 내보내기 실패: {e}")
+        return False
+
+def convert_json_cache_to_binary() -> bool:
+    """
+    이전 형식(gzip JSON) 캐시만 있을 때 바이너리 캐시로 변환합니다.
+    기존 메타데이터의 created_at을 유지하므로 만료 시점은 바뀌지 않습니다.
+    """
+    if not os.path.exists(MCDONALD_CACHE_FILE):
+        return False
+    try:
+        with gzip.open(MCDONALD_CACHE_FILE, 'rt', encoding='utf-8') as f:
+            mcdonald_dict = json.load(f)
+        created_at = None
+        if os.path.exists(CACHE_METADATA_FILE):
+            with open(CACHE_METADATA_FILE, 'r', encoding='utf-8') as f:
+                created_at = json.load(f).get('created_at')
+        write_mcdonald_binary(mcdonald_dict)
+        _write_metadata(mcdonald_dict, created_at)
+        print(f"[INFO] JSON 캐시를 바이너리 캐시로 변환: {len(mcdonald_dict)}개 단어")
         return True
-        
     except Exception as e:
-        print(f"[ERROR] McDonald 사전 JSON 내보내기 실패: {e}")
+        print(f"[WARNING] JSON 캐시 변환 실패: {e}")
         return False
 
 def is_cache_valid():
     """
     캐시가 유효한지 확인 (파일 존재 여부 및 만료 시간 체크)
     """
-    if not os.path.exists(MCDONALD_CACHE_FILE) or not os.path.exists(CACHE_METADATA_FILE):
+    if not all(os.path.exists(path) for path in MCDONALD_BINARY_FILES):
+        if not convert_json_cache_to_binary():
+            return False
+    if not os.path.exists(CACHE_METADATA_FILE):
         return False
-    
+
     try:
         with open(CACHE_METADATA_FILE, 'r', encoding='utf-8') as f:
             metadata = json.load(f)
-        
+
         created_at = datetime.fromisoformat(metadata['created_at'])
         expiry_time = created_at + timedelta(hours=CACHE_EXPIRY_HOURS)
-        
+
         return datetime.now() < expiry_time
     except Exception as e:
         print(f"[WARNING] 캐시 메타데이터 확인 실패: {e}")
         return False
 
-def load_mcdonald_dictionary():
+def _open_binary_dictionary() -> McDonaldDictionary:
+    return McDonaldDictionary(
+        np.load(MCDONALD_WORDS_FILE, mmap_mode='r'),
+        np.load(MCDONALD_FLAGS_FILE, mmap_mode='r'),
+        np.load(MCDONALD_VALUES_FILE, mmap_mode='r')
+    )
+
+def load_mcdonald_dictionary() -> McDonaldDictionary:
     """
-    McDonald 사전을 메모리에 로드하는 함수 (앱 시작 시 1회 실행)
+    McDonald 사전을 mmap으로 여는 함수 (앱 시작 시 1회 실행)
     """
     global _mcdonald_dict
     if _mcdonald_dict is not None:
         return _mcdonald_dict
-    
-    print("[INFO] McDonald 사전을 메모리에 로드 중...")
-    
+
+    print("[INFO] McDonald 사전을 로드 중...")
+
     # 캐시 유효성 검사
     if not is_cache_valid():
         print("[INFO] 캐시가 유효하지 않음. 새로 생성합니다...")
-        if not export_mcdonald_dict_to_json():
-            print("[ERROR] 캐시 생성 실패. 빈 딕셔너리 반환.")
-            return {}
-    
+        if not export_mcdonald_dictionary():
+            print("[ERROR] 캐시 생성 실패. 빈 사전 반환.")
+            return McDonaldDictionary.empty()
+
     try:
-        # 압축된 JSON 파일에서 로드
-        with gzip.open(MCDONALD_CACHE_FILE, 'rt', encoding='utf-8') as f:
-            _mcdonald_dict = json.load(f)
-        
+        _mcdonald_dict = _open_binary_dictionary()
         print(f"[INFO] McDonald 사전 로드 완료: {len(_mcdonald_dict)}개 단어")
         return _mcdonald_dict
-        
+
     except Exception as e:
         print(f"[ERROR] McDonald 사전 로드 실패: {e}")
-        # JSON 로드 실패 시 DB에서 직접 로드 시도
+        # 캐시 로드 실패 시 DB에서 다시 내보내기 시도
         print("[INFO] DB에서 직접 로드를 시도합니다...")
-        if export_mcdonald_dict_to_json():
+        if export_mcdonald_dictionary():
             return load_mcdonald_dictionary()
-        return {}
+        return McDonaldDictionary.empty()
 
-def get_mcdonald_word_info(word: str):
+def get_mcdonald_word_info(word: str) -> Optional[dict]:
     """
-    메모리에서 McDonald 사전 정보를 조회하는 함수
+    McDonald 사전 정보를 조회하는 함수 (이진 탐색, 없으면 None)
     """
     global _mcdonald_dict
     if _mcdonald_dict is None:
         _mcdonald_dict = load_mcdonald_dictionary()
-    
+
     return _mcdonald_dict.get(word, None)
 
+def get_mcdonald_dictionary_version() -> str:
+    """
+    현재 사용 중인 McDonald 사전의 버전 (article_sentiment 등 사전 기반 결과의 유효성 판단용)
+    cache_metadata.json의 dictionary_version을 사용하고, 없으면 로드된 사전 파일에서 계산합니다.
+    """
+    global _mcdonald_dict_version
+    if _mcdonald_dict_version is not None:
+        return _mcdonald_dict_version
+
+    mcdonald_dict = load_mcdonald_dictionary()
+    try:
+        with open(CACHE_METADATA_FILE, 'r', encoding='utf-8') as f:
+            _mcdonald_dict_version = json.load(f).get('dictionary_version')
+    except Exception as e:
+        print(f"[WARNING] 캐시 메타데이터 확인 실패: {e}")
+    if not _mcdonald_dict_version:
+        _mcdonald_dict_version = compute_dictionary_version(
+            list(mcdonald_dict.iter_words()), mcdonald_dict.values.tolist()
+        )
+    return _mcdonald_dict_version
+
 def refresh_cache():
     """
     캐시를 강제로 갱신하는 함수
     """
-    global _mcdonald_dict
+    global _mcdonald_dict, _mcdonald_dict_version
     _mcdonald_dict = None
-    return export_mcdonald_dict_to_json()
+    _mcdonald_dict_version = None
+    return export_mcdonald_dictionary()
 
 def get_cache_info():
     """
@@ -150,11 +305,11 @@ def get_cache_info():
         if os.path.exists(CACHE_METADATA_FILE):
             with open(CACHE_METADATA_FILE, 'r', encoding='utf-8') as f:
                 metadata = json.load(f)
-            
-            file_size = os.path.getsize(MCDONALD_CACHE_FILE) / (1024 * 1024)  # MB
+
+            file_size = sum(os.path.getsize(path) for path in MCDONALD_BINARY_FILES if os.path.exists(path)) / (1024 * 1024)  # MB
             metadata['file_size_mb'] = round(file_size, 2)
             metadata['is_valid'] = is_cache_valid()
-            
+
             return metadata
         else:
             return {"error": "캐시 메타데이터 파일이 존재하지 않습니다."}
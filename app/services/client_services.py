@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from app.core.config import settings
 from typing import List, Dict, Optional
 import logging
@@ -10,6 +10,9 @@ from app.services.ai_analysis_service import generate_performance_summary
 import numpy as np
 from pandas_datareader import data as pdr
 from app.db.connection import get_sqlalchemy_engine
+from app.db.async_connection import get_async_engine
+from app.core.metrics import caller_option
+from app.services.price_repository import dates_to_strings, get_index_prices, get_price_series, get_prices
 
 logger = logging.getLogger(__name__)
 
@@ -60,36 +63,68 @@ def parse_amount_string(amount_str: str) -> float:
     logger.warning(f"Could not parse amount string: {amount_str}")
     return 0.0
 
+ALL_CLIENTS_QUERY = text("""
+    SELECT id, name, sex, age, risk_profile, investment_horizon, total_amount
+    FROM virtual_clients_listpage
+    ORDER BY id
+""")
+
+CLIENT_DETAIL_QUERY = text("""
+    SELECT id, name, sex, age, risk_profile, investment_horizon, 
+           total_amount, memo1, memo2, memo3, benchmark, months_since_last_rebalancing
+    FROM virtual_clients_v4
+    WHERE id = :client_id
+""")
+
+CLIENT_PORTFOLIO_QUERY = text("""
+    SELECT stock, quantity, sector
+    FROM virtual_clients_portfolio
+    WHERE id = :client_id
+    ORDER BY stock
+""")
+
+def _client_list_row_to_dict(row) -> Dict:
+    # total_amount를 안전하게 변환
+    try:
+        total_amount = parse_amount_string(row[6])
+    except Exception as e:
+        logger.warning(f"Error parsing total_amount for client {row[0]}: {row[6]}, error: {e}")
+        total_amount = 0.0
+    
+    return {
+        "id": row[0],
+        "name": row[1],
+        "sex": row[2],
+        "age": row[3],
+        "risk_profile": row[4],
+        "investment_horizon": row[5],
+        "total_amount": total_amount
+    }
+
+def _client_detail_row_to_dict(row) -> Dict:
+    return {
+        **_client_list_row_to_dict(row),
+        "memo1": row[7],
+        "memo2": row[8],
+        "memo3": row[9],
+        "benchmark": row[10],
+        "months_since_last_rebalancing": row[11]
+    }
+
+def _portfolio_row_to_dict(row) -> Dict:
+    return {
+        "stock": row[0],
+        "quantity": int(row[1]) if row[1] else 0,
+        "sector": row[2]
+    }
+
 def get_all_clients() -> List[Dict]:
     """모든 고객 정보를 가져옵니다."""
     try:
         engine = get_database_connection()
         with engine.connect() as conn:
-            query = text("""
-                SELECT id, name, sex, age, risk_profile, investment_horizon, total_amount
-                FROM virtual_clients_listpage
-                ORDER BY id
-            """)
-            result = conn.execute(query)
-            clients = []
-            for row in result:
-                # total_amount를 안전하게 변환
-                try:
-                    total_amount = parse_amount_string(row[6])
-                except Exception as e:
-                    logger.warning(f"Error parsing total_amount for client {row[0]}: {row[6]}, error: {e}")
-                    total_amount = 0.0
-                
-                clients.append({
-                    "id": row[0],
-                    "name": row[1],
-                    "sex": row[2],
-                    "age": row[3],
-                    "risk_profile": row[4],
-                    "investment_horizon": row[5],
-                    "total_amount": total_amount
-                })
-            return clients
+            result = conn.execute(ALL_CLIENTS_QUERY)
+            return [_client_list_row_to_dict(row) for row in result]
     except Exception as e:
         logger.error(f"Error fetching all clients: {e}")
         raise
@@ -99,38 +134,8 @@ def get_client_by_id(client_id: str) -> Optional[Dict]:
     try:
         engine = get_database_connection()
         with engine.connect() as conn:
-            query = text("""
-                SELECT id, name, sex, age, risk_profile, investment_horizon, 
-                       total_amount, memo1, memo2, memo3, benchmark, months_since_last_rebalancing
-                FROM virtual_clients_v4
-                WHERE id = :client_id
-            """)
-            result = conn.execute(query, {"client_id": client_id})
-            row = result.fetchone()
-            
-            if row:
-                # total_amount를 안전하게 변환
-                try:
-                    total_amount = parse_amount_string(row[6])
-                except Exception as e:
-                    logger.warning(f"Error parsing total_amount for client {client_id}: {row[6]}, error: {e}")
-                    total_amount = 0.0
-                
-                return {
-                    "id": row[0],
-                    "name": row[1],
-                    "sex": row[2],
-                    "age": row[3],
-                    "risk_profile": row[4],
-                    "investment_horizon": row[5],
-                    "total_amount": total_amount,
-                    "memo1": row[7],
-                    "memo2": row[8],
-                    "memo3": row[9],
-                    "benchmark": row[10],
-                    "months_since_last_rebalancing": row[11]
-                }
-            return None
+            row = conn.execute(CLIENT_DETAIL_QUERY, {"client_id": client_id}).fetchone()
+            return _client_detail_row_to_dict(row) if row else None
     except Exception as e:
         logger.error(f"Error fetching client {client_id}: {e}")
         raise
@@ -140,21 +145,50 @@ def get_client_portfolio(client_id: str) -> List[Dict]:
     try:
         engine = get_database_connection()
         with engine.connect() as conn:
-            query = text("""
-                SELECT stock, quantity, sector
-                FROM virtual_clients_portfolio
-                WHERE id = :client_id
-                ORDER BY stock
-            """)
-            result = conn.execute(query, {"client_id": client_id})
-            portfolio = []
-            for row in result:
-                portfolio.append({
-                    "stock": row[0],
-                    "quantity": int(row[1]) if row[1] else 0,
-                    "sector": row[2]
-                })
-            return portfolio
+            result = conn.execute(CLIENT_PORTFOLIO_QUERY, {"client_id": client_id})
+            return [_portfolio_row_to_dict(row) for row in result]
+    except Exception as e:
+        logger.error(f"Error fetching portfolio for client {client_id}: {e}")
+        raise
+
+async def get_all_clients_async() -> List[Dict]:
+    """모든 고객 정보를 가져옵니다. (asyncpg, 이벤트 루프 비차단)"""
+    try:
+        engine = await get_async_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                ALL_CLIENTS_QUERY, execution_options=caller_option(f"{__name__}.get_all_clients_async")
+            )
+            return [_client_list_row_to_dict(row) for row in result]
+    except Exception as e:
+        logger.error(f"Error fetching all clients: {e}")
+        raise
+
+async def get_client_by_id_async(client_id: str) -> Optional[Dict]:
+    """특정 고객의 상세 정보를 가져옵니다. (asyncpg, 이벤트 루프 비차단)"""
+    try:
+        engine = await get_async_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                CLIENT_DETAIL_QUERY, {"client_id": client_id},
+                execution_options=caller_option(f"{__name__}.get_client_by_id_async")
+            )
+            row = result.fetchone()
+            return _client_detail_row_to_dict(row) if row else None
+    except Exception as e:
+        logger.error(f"Error fetching client {client_id}: {e}")
+        raise
+
+async def get_client_portfolio_async(client_id: str) -> List[Dict]:
+    """특정 고객의 포트폴리오 정보를 가져옵니다. (asyncpg, 이벤트 루프 비차단)"""
+    try:
+        engine = await get_async_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                CLIENT_PORTFOLIO_QUERY, {"client_id": client_id},
+                execution_options=caller_option(f"{__name__}.get_client_portfolio_async")
+            )
+            return [_portfolio_row_to_dict(row) for row in result]
     except Exception as e:
         logger.error(f"Error fetching portfolio for client {client_id}: {e}")
         raise
@@ -162,10 +196,13 @@ def get_client_portfolio(client_id: str) -> List[Dict]:
 def calculate_portfolio_return(portfolio: List[Dict], start_date: str, end_date: str) -> float:
     """포트폴리오의 가중평균 수익률을 계산합니다. DB 사용"""
     try:
-        engine = get_database_connection()
         total_value_start = 0
         total_value_end = 0
         
+        # 보유 종목 전체를 파티션 테이블별 1회씩 일괄 조회
+        symbols = [holding['stock'] for holding in portfolio if holding['quantity'] > 0]
+        prices = get_prices(symbols, start_date, end_date, ('close',))
+        
         for holding in portfolio:
             symbol = holding['stock']
             quantity = holding['quantity']
@@ -174,34 +211,16 @@ def calculate_portfolio_return(portfolio: List[Dict], start_date: str, end_date:
                 continue
                 
             try:
-                # 적절한 테이블 선택
-                table_name = get_stock_price_table(symbol)
+                series = prices.get(symbol)
                 
-                with engine.connect() as conn:
-                    # 시작일과 종료일에 가장 가까운 데이터 가져오기
-                    query = text(f"""
-                        SELECT date, close
-                        FROM {table_name}
-                        WHERE stock_symbol = :symbol 
-                        AND date BETWEEN :start_date AND :end_date
-                        ORDER BY date ASC
-                    """)
-                    
-                    result = conn.execute(query, {
-                        "symbol": symbol,
-                        "start_date": start_date,
-                        "end_date": end_date
-                    })
-                    
-                    rows = result.fetchall()
-                
-                if len(rows) < 2:
+                if series is None or len(series['close']) < 2:
                     logger.warning(f"Insufficient data for {symbol} between {start_date} and {end_date}")
                     continue
                 
                 # 시작 가격과 종료 가격
-                start_price = float(rows[0][1]) if rows[0][1] else 0.0
-                end_price = float(rows[-1][1]) if rows[-1][1] else 0.0
+                closes = np.nan_to_num(series['close'])
+                start_price = float(closes[0])
+                end_price = float(closes[-1])
                 
                 if start_price <= 0 or end_price <= 0:
                     logger.warning(f"Invalid price data for {symbol}: start={start_price}, end={end_price}")
@@ -234,8 +253,6 @@ def calculate_portfolio_return(portfolio: List[Dict], start_date: str, end_date:
 def calculate_benchmark_return(benchmark: str, start_date: str, end_date: str) -> float:
     """벤치마크의 수익률을 계산합니다. DB 사용"""
     try:
-        engine = get_database_connection()
-        
         # 벤치마크 이름을 DB 컬럼명으로 매핑
         benchmark_column_mapping = {
             'S&P 500': 'sp500',
@@ -256,30 +273,17 @@ def calculate_benchmark_return(benchmark: str, start_date: str, end_date: str) -
         
         logger.info(f"Fetching benchmark data for {benchmark} (column: {column_name}) from {start_date} to {end_date}")
         
-        with engine.connect() as conn:
-            # 시작일과 종료일에 가장 가까운 데이터 가져오기
-            query = text(f"""
-                SELECT date, {column_name}
-                FROM index_closing_price
-                WHERE date BETWEEN :start_date AND :end_date
-                AND {column_name} IS NOT NULL
-                ORDER BY date ASC
-            """)
-            
-            result = conn.execute(query, {
-                "start_date": start_date,
-                "end_date": end_date
-            })
-            
-            rows = result.fetchall()
+        # 시작일과 종료일에 가장 가까운 데이터 가져오기 (NULL 제외)
+        series = get_index_prices(start_date, end_date, (column_name,))
+        closes = series[column_name][~np.isnan(series[column_name])]
         
-        if len(rows) < 2:
-            logger.warning(f"Insufficient benchmark data for {benchmark} between {start_date} and {end_date} (found {len(rows)} points)")
+        if len(closes) < 2:
+            logger.warning(f"Insufficient benchmark data for {benchmark} between {start_date} and {end_date} (found {len(closes)} points)")
             return 0.0
         
         # 시작 가격과 종료 가격
-        start_price = float(rows[0][1]) if rows[0][1] else 0.0
-        end_price = float(rows[-1][1]) if rows[-1][1] else 0.0
+        start_price = float(closes[0])
+        end_price = float(closes[-1])
         
         if start_price <= 0 or end_price <= 0:
             logger.warning(f"Invalid price data for {benchmark}: start={start_price}, end={end_price}")
@@ -408,43 +412,21 @@ def get_client_performance_analysis(client_id: str, period_end_date: str) -> Dic
         logger.error(f"Error calculating client performance for {client_id}: {e}")
         return {"error": f"Error calculating performance: {str(e)}"}
 
-def get_stock_price_table(symbol: str) -> str:
-    """ticker의 첫 글자에 따라 적절한 stock price 테이블명을 반환합니다."""
-    first_char = symbol[0].lower()
-    if 'a' <= first_char <= 'd':
-        return 'fnspid_stock_price_a'
-    elif 'e' <= first_char <= 'm':
-        return 'fnspid_stock_price_b'
-    else:  # n-z
-        return 'fnspid_stock_price_c'
-
-def calculate_stock_metrics(symbol: str, period_end_date: str) -> Dict:
-    """개별 종목의 현재가, 수익률, 변동성을 계산합니다. DB 사용"""
+def calculate_stock_metrics(symbol: str, period_end_date: str, prices: Dict = None) -> Dict:
+    """
+    개별 종목의 현재가, 수익률, 변동성을 계산합니다. DB 사용
+    prices: get_prices()로 미리 일괄 조회한 결과. 주어지면 DB 조회 없이 사용합니다.
+    """
     try:
-        engine = get_database_connection()
         period_end = datetime.strptime(period_end_date, '%Y-%m-%d')
         three_years_ago = period_end - timedelta(days=3*365)
         
-        # 적절한 테이블 선택
-        table_name = get_stock_price_table(symbol)
-        
-        with engine.connect() as conn:
-            # 3년치 데이터 가져오기 (2023년까지만 있으므로)
-            query = text(f"""
-                SELECT date, open, high, low, close, adj_close, volume
-                FROM {table_name}
-                WHERE stock_symbol = :symbol 
-                AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            
-            result = conn.execute(query, {
-                "symbol": symbol,
-                "start_date": three_years_ago.strftime('%Y-%m-%d'),
-                "end_date": period_end_date
-            })
-            
-            rows = result.fetchall()
+        # 3년치 데이터 가져오기 (2023년까지만 있으므로)
+        if prices is not None:
+            series = prices.get(symbol)
+        else:
+            series = get_price_series(symbol, three_years_ago.strftime('%Y-%m-%d'), period_end_date, ('close',))
+        rows = [] if series is None else list(zip(dates_to_strings(series['dates']), np.nan_to_num(series['close']).tolist()))
             
         if not rows:
             logger.warning(f"No data found for {symbol} in DB")
@@ -458,10 +440,10 @@ def calculate_stock_metrics(symbol: str, period_end_date: str) -> Dict:
 
         # 데이터를 딕셔너리 리스트로 변환
         price_data = []
-        for row in rows:
+        for date_str, close in rows:
             price_data.append({
-                'date': row[0] if isinstance(row[0], str) else row[0].strftime('%Y-%m-%d'),
-                'close': float(row[4]) if row[4] else 0.0
+                'date': date_str,
+                'close': close
             })
 
         # 현재가 (기준일 종가 또는 가장 최근 종가)
@@ -556,9 +538,14 @@ def get_enhanced_client_portfolio(client_id: str, period_end_date: str) -> List[
         enhanced_portfolio = []
         total_portfolio_value = 0.0
         
+        # 보유 종목의 3년치 종가를 파티션 테이블별 1회씩 일괄 조회
+        period_end = datetime.strptime(period_end_date, '%Y-%m-%d')
+        three_years_ago = (period_end - timedelta(days=3*365)).strftime('%Y-%m-%d')
+        prices = get_prices([holding['stock'] for holding in portfolio], three_years_ago, period_end_date, ('close',))
+        
         # 1단계: 각 종목의 현재 시가총액 계산
         for holding in portfolio:
-            stock_metrics = calculate_stock_metrics(holding['stock'], period_end_date)
+            stock_metrics = calculate_stock_metrics(holding['stock'], period_end_date, prices)
             current_value = stock_metrics['current_price'] * holding['quantity']
             total_portfolio_value += current_value
             
@@ -0,0 +1,169 @@
+"""
+주차별 클러스터링 결과 저장소 (weekly_cluster_result 테이블)
+
+섹터별(scope=섹터명) / 전체 시장(scope=MARKET_SCOPE) 주차별로 클러스터링한 기사 id, 클러스터 라벨,
+클러스터별 medoid 기사 id(크기 순), 최종 선택된 top3 기사 id를 저장합니다.
+/industry/top3_articles, /market/hot-articles는 저장된 주차는 클러스터링 없이 바로 응답하고,
+없는 주차만 실시간으로 클러스터링한 뒤 결과를 저장합니다.
+오늘이 포함된 주차는 기사가 계속 추가되므로 저장하지 않고 매번 실시간으로 클러스터링합니다.
+
+사용법:
+    python -m app.services.cluster_results precompute [--scope all|sector|market] [--recompute]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.db.table_setup import ensure_table
+
+MARKET_SCOPE = "__market__"
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS weekly_cluster_result (
+        scope TEXT NOT NULL,
+        weekstart_sunday DATE NOT NULL,
+        article_ids BIGINT[] NOT NULL,
+        cluster_labels INTEGER[] NOT NULL,
+        medoid_article_ids BIGINT[] NOT NULL,
+        top3_article_ids BIGINT[] NOT NULL,
+        computed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (scope, weekstart_sunday)
+    )
+"""
+
+UPSERT_SQL = text("""
+    INSERT INTO weekly_cluster_result
+        (scope, weekstart_sunday, article_ids, cluster_labels, medoid_article_ids, top3_article_ids, computed_at)
+    VALUES (:scope, :weekstart_sunday, :article_ids, :cluster_labels, :medoid_article_ids, :top3_article_ids, now())
+    ON CONFLICT (scope, weekstart_sunday) DO UPDATE SET
+        article_ids = EXCLUDED.article_ids,
+        cluster_labels = EXCLUDED.cluster_labels,
+        medoid_article_ids = EXCLUDED.medoid_article_ids,
+        top3_article_ids = EXCLUDED.top3_article_ids,
+        computed_at = now()
+""")
+
+
+def ensure_cluster_result_table() -> bool:
+    """weekly_cluster_result 테이블이 없으면 생성합니다. 실패 시 False (항상 실시간 클러스터링)"""
+    return ensure_table("weekly_cluster_result", CREATE_TABLE_SQL)
+
+
+def get_cluster_result(scope: str, weekstart_sunday: str) -> Optional[Dict]:
+    """저장된 클러스터링 결과 (없으면 None)"""
+    if not ensure_cluster_result_table():
+        return None
+    try:
+        with get_sqlalchemy_engine().connect() as conn:
+            row = conn.execute(text("""
+                SELECT article_ids, cluster_labels, medoid_article_ids, top3_article_ids
+                FROM weekly_cluster_result
+                WHERE scope = :scope AND weekstart_sunday = :weekstart_sunday
+            """), {"scope": scope, "weekstart_sunday": weekstart_sunday}).fetchone()
+    except Exception as e:
+        print(f"[WARNING] 클러스터링 결과 조회 실패 ({scope}, {weekstart_sunday}): {e}")
+        return None
+    if row is None:
+        return None
+    return {
+        "article_ids": list(row[0]),
+        "cluster_labels": list(row[1]),
+        "medoid_article_ids": list(row[2]),
+        "top3_article_ids": list(row[3]),
+    }
+
+
+def save_cluster_result(scope: str, weekstart_sunday: str, article_ids: List[int], cluster_labels: List[int],
+                        medoid_article_ids: List[int], top3_article_ids: List[int]):
+    """클러스터링 결과 저장 (실패해도 응답에는 영향 없음)"""
+    if not ensure_cluster_result_table():
+        return
+    try:
+        with get_sqlalchemy_engine().begin() as conn:
+            conn.execute(UPSERT_SQL, {
+                "scope": scope,
+                "weekstart_sunday": weekstart_sunday,
+                "article_ids": [int(i) for i in article_ids],
+                "cluster_labels": [int(label) for label in cluster_labels],
+                "medoid_article_ids": [int(i) for i in medoid_article_ids],
+                "top3_article_ids": [int(i) for i in top3_article_ids],
+            })
+    except Exception as e:
+        print(f"[WARNING] 클러스터링 결과 저장 실패 ({scope}, {weekstart_sunday}): {e}")
+
+
+def is_closed_week(weekstart_sunday) -> bool:
+    """오늘이 포함된 주차보다 이전 주차인지 (더 이상 기사가 추가되지 않아 결과를 저장해도 되는 주차)"""
+    today = datetime.now().date()
+    current_week = today - timedelta(days=(today.weekday() + 1) % 7)
+    return str(weekstart_sunday)[:10] < current_week.isoformat()
+
+
+def _list_weeks(scope: str, recompute: bool):
+    """클러스터링 대상 (scope, weekstart_sunday) 목록 (recompute=False면 저장된 주차 제외)"""
+    done_condition = "" if recompute else """
+        AND NOT EXISTS (
+            SELECT 1 FROM weekly_cluster_result r
+            WHERE r.scope = w.scope AND r.weekstart_sunday = w.weekstart_sunday
+        )"""
+    queries = []
+    if scope in ("all", "sector"):
+        queries.append("""
+            SELECT DISTINCT sector AS scope, weekstart_sunday FROM kb_enterprise_dataset
+            WHERE sector IS NOT NULL AND weekstart_sunday IS NOT NULL AND article IS NOT NULL AND article != ''
+        """)
+    if scope in ("all", "market"):
+        queries.append(f"""
+            SELECT DISTINCT '{MARKET_SCOPE}' AS scope, weekstart_sunday FROM kb_enterprise_dataset
+            WHERE weekstart_sunday IS NOT NULL AND article IS NOT NULL AND article != ''
+        """)
+    query = f"""
+        SELECT w.scope, w.weekstart_sunday FROM ({" UNION ALL ".join(queries)}) w
+        WHERE TRUE {done_condition}
+        ORDER BY w.weekstart_sunday, w.scope
+    """
+    with get_sqlalchemy_engine().connect() as conn:
+        return conn.execute(text(query)).fetchall()
+
+
+def precompute_cluster_results(scope: str = "all", recompute: bool = False) -> int:
+    """
+    모든 섹터/시장 주차의 클러스터링 결과를 계산해 저장합니다. 반환: 저장한 주차 수
+    """
+    from app.services.clustering import cluster_week
+
+    if not ensure_cluster_result_table():
+        return 0
+
+    weeks = [(week_scope, week) for week_scope, week in _list_weeks(scope, recompute) if is_closed_week(week)]
+    print(f"[INFO] 주차별 클러스터링 사전 계산 시작: {len(weeks)}개 (scope={scope}, recompute={recompute})")
+    start = time.time()
+    saved = 0
+    for i, (week_scope, week) in enumerate(weeks, 1):
+        week_str = week.strftime('%Y-%m-%d')
+        try:
+            if cluster_week(week_scope, week_str) is not None:
+                saved += 1
+        except Exception as e:
+            print(f"[ERROR] 클러스터링 실패 ({week_scope}, {week_str}): {e}")
+        if i % 50 == 0:
+            print(f"[INFO] {i}/{len(weeks)} 처리 ({i / (time.time() - start):.2f} weeks/sec)")
+    print(f"[INFO] 주차별 클러스터링 사전 계산 완료: {saved}개 저장, {time.time() - start:.1f}s")
+    return saved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주차별 클러스터링 결과 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    precompute_parser = subparsers.add_parser("precompute", help="섹터/시장 주차별 클러스터링 사전 계산")
+    precompute_parser.add_argument("--scope", choices=("all", "sector", "market"), default="all")
+    precompute_parser.add_argument("--recompute", action="store_true", help="이미 저장된 주차도 다시 계산")
+
+    args = parser.parse_args()
+    if args.command == "precompute":
+        precompute_cluster_results(args.scope, args.recompute)
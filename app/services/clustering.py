@@ -1,18 +1,21 @@
 import pandas as pd
 import numpy as np
 from datetime import timedelta
-from sentence_transformers import SentenceTransformer
 import hdbscan
 import collections
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.decomposition import PCA
 from sklearn.metrics.pairwise import euclidean_distances
+from app.core.config import settings
 from app.db.connection import get_sqlalchemy_engine
 from app.services.sentiment import get_sentiment_score_for_article
-from app.services.keyword_extractor import extract_keywords, extract_named_entities, restore_named_entities, kw_model
+from app.services.keyword_extractor import extract_keywords_batch, restore_named_entities
+from app.services.article_analysis import analyze_articles
+from app.services.nlp_models import get_keybert
+from app.services.embedding_service import embed_article_titles
 from app.services.summarize import summarize_top3_articles
+from app.services.cluster_results import MARKET_SCOPE, get_cluster_result, is_closed_week, save_cluster_result
 from sqlalchemy import text
-import os
-
-CACHE_DIR = os.getenv("HF_HOME")
 
 def week_start_sunday(input_date_str: str) -> str:
     """
@@ -32,8 +35,8 @@ def get_articles_by_sector(sector: str, weekstart_sunday: str):
         with get_sqlalchemy_engine().connect() as conn:
             # 2. 쿼리를 text()로 감싸고, 파라미터 스타일을 :name 으로 변경합니다.
             query = text("""
-                SELECT article, date, weekstart_sunday, article_title, stock_symbol
-                FROM kb_enterprise_dataset 
+                SELECT id, article, date, weekstart_sunday, article_title, stock_symbol, sector
+                FROM kb_enterprise_dataset
                 WHERE sector = :sector AND weekstart_sunday = :weekstart_sunday
                   AND article IS NOT NULL AND article != ''
                 ORDER BY date DESC;
@@ -47,135 +50,222 @@ def get_articles_by_sector(sector: str, weekstart_sunday: str):
         print(f"Error fetching articles for sector {sector}: {e}")
         return []
 
-def get_industry_top3_articles(sector: str, end_date: str):
+def get_articles_by_ids(article_ids):
     """
-    산업군과 종료일을 받아 클러스터링을 통한 상위 3개 대표 기사를 반환합니다.
+    DB에서 id 목록에 해당하는 기사들을 id 목록 순서대로 가져옵니다. (없는 id는 제외)
+    """
+    if not article_ids:
+        return []
+    try:
+        with get_sqlalchemy_engine().connect() as conn:
+            query = text("""
+                SELECT id, article, date, weekstart_sunday, article_title, stock_symbol, sector
+                FROM kb_enterprise_dataset
+                WHERE id = ANY(:ids)
+            """)
+            rows = conn.execute(query, {"ids": [int(i) for i in article_ids]}).mappings().all()
+    except Exception as e:
+        print(f"Error fetching articles by ids: {e}")
+        return []
+    by_id = {row['id']: row for row in rows}
+    return [by_id[i] for i in article_ids if i in by_id]
+
+def _extract_valid_articles(articles_data):
+    """
+    제목이 있는 기사만 골라 (기사 정보 목록, 제목 목록, 기사 id 목록)을 반환합니다.
     """
-    week_sunday = week_start_sunday(end_date)
-    
-    # DB에서 해당 섹터의 기사들 가져오기
-    articles_data = get_articles_by_sector(sector, week_sunday)
-    
-    if not articles_data:
-        print(f"❗ {sector} 섹터의 {week_sunday} 주차에 기사 데이터가 없습니다.")
-        return {"top3_articles": [], "week": week_sunday}
-    
-    # 기사 제목 추출 및 클리닝
     valid_articles = []
     titles = []
-    
+    article_ids = []
+
     for row in articles_data:
         article_title = row['article_title']
         if article_title and article_title.strip():
             valid_articles.append({
+                'id': row['id'],
                 'article': row['article'],
                 'date': row['date'],
                 'weekstart': row['weekstart_sunday'],
                 'article_title': article_title,
-                'stock_symbol': row['stock_symbol']
+                'stock_symbol': row['stock_symbol'],
+                'sector': row['sector']
             })
             titles.append(article_title.strip())
-    
-    
-    if len(titles) < 3:
-        print(f"❗ {sector} 섹터의 기사가 충분하지 않습니다. (필요: 3개, 현재: {len(titles)}개)")
-        return {"top3_articles": [], "week": week_sunday}
-    
-    # 1) 임베딩
-    model = SentenceTransformer('paraphrase-mpnet-base-v2', cache_folder=CACHE_DIR)
-    embeddings = model.encode(titles, show_progress_bar=True)
-    
-    # 2) 클러스터링
+            article_ids.append(row['id'])
+    return valid_articles, titles, article_ids
+
+def reduce_embeddings(embeddings, method: str = None, dim: int = None):
+    """
+    HDBSCAN 전 차원 축소 (CLUSTER_REDUCTION: none | pca | umap)
+    기사 수가 CLUSTER_REDUCTION_MIN_ARTICLES 미만이거나 이미 dim 이하 차원이면 그대로 반환합니다.
+    """
+    method = (method or settings.CLUSTER_REDUCTION).lower()
+    dim = dim or settings.CLUSTER_REDUCTION_DIM
+    n_articles, n_dims = embeddings.shape
+    if method == "none" or n_articles < settings.CLUSTER_REDUCTION_MIN_ARTICLES or n_dims <= dim:
+        return embeddings
+
+    # 축소 차원은 (기사 수 - 2)를 넘을 수 없음 (UMAP spectral 초기화 제약)
+    dim = min(dim, n_articles - 2)
+    try:
+        if method == "pca":
+            return PCA(n_components=dim, random_state=settings.CLUSTER_REDUCTION_SEED).fit_transform(embeddings)
+        if method == "umap":
+            import umap
+            reducer = umap.UMAP(
+                n_components=dim,
+                n_neighbors=min(15, n_articles - 1),
+                min_dist=0.0,
+                metric="cosine",
+                random_state=settings.CLUSTER_REDUCTION_SEED
+            )
+            return reducer.fit_transform(embeddings)
+        print(f"[WARNING] 알 수 없는 CLUSTER_REDUCTION 값: {method} (차원 축소 없이 진행)")
+    except Exception as e:
+        print(f"[WARNING] 차원 축소 실패 ({method}), 원본 임베딩으로 클러스터링: {e}")
+    return embeddings
+
+def cluster_embeddings(embeddings, reduction: str = None, dim: int = None):
+    """
+    임베딩을 (차원 축소 후) HDBSCAN으로 클러스터링합니다.
+    반환: (클러스터 라벨 배열, 클러스터 크기 순 medoid 위치 목록)
+    """
+    # 2) 클러스터링 (설정 시 차원 축소 후)
+    reduced = reduce_embeddings(embeddings, reduction, dim)
     clusterer = hdbscan.HDBSCAN(min_cluster_size=3)
-    labels = clusterer.fit_predict(embeddings)
-    
-    # 3) 상위 3개 클러스터 찾기
+    labels = clusterer.fit_predict(reduced)
+
+    # 3) 클러스터별 대표 기사(medoid) 찾기 (큰 클러스터 순, 원본 임베딩 공간 기준)
     cnt = collections.Counter(labels[labels >= 0])
-    if len(cnt) < 3:
-        print(f"❗ 클러스터 개수가 부족합니다. (필요: 3개, 현재: {len(cnt)}개)")
-        print(f"📊 총 기사 수: {len(valid_articles)}, 클러스터링된 기사 수: {len(labels[labels >= 0])}, 노이즈 기사 수: {len(labels[labels == -1])}")
-        
-        # 클러스터가 부족한 경우 가장 큰 클러스터들과 노이즈에서 선택
-        available_clusters = [cl[0] for cl in cnt.most_common()]
-        noise_indices = np.where(labels == -1)[0]
-        
-        top3_articles = []
-        
-        # 기존 클러스터에서 대표 기사 선택
-        for cluster_id in available_clusters:
-            cluster_idxs = np.where(labels == cluster_id)[0]
-            cluster_embs = embeddings[cluster_idxs]
-            centroid = cluster_embs.mean(axis=0)
-            dists = euclidean_distances([centroid], cluster_embs)[0]
-            medoid_pos = cluster_idxs[np.argmin(dists)]
-            
-            article_data = valid_articles[medoid_pos]
-            top3_articles.append(article_data)
-        
-        print(f"🔍 클러스터에서 선택된 기사 수: {len(top3_articles)}")
-        
-        # 부족한 만큼 노이즈에서 추가 선택 (무작위)
-        needed = 3 - len(top3_articles)
-        if needed > 0 and len(noise_indices) > 0:
-            print(f"🎲 노이즈에서 {needed}개 기사 추가 선택 (사용 가능한 노이즈: {len(noise_indices)}개)")
-            selected_noise = np.random.choice(noise_indices, min(needed, len(noise_indices)), replace=False)
-            for idx in selected_noise:
-                article_data = valid_articles[idx]
-                top3_articles.append(article_data)
-        
-        # 여전히 부족하면 전체에서 무작위 선택
-        remaining_needed = 3 - len(top3_articles)
-        if remaining_needed > 0:
-            print(f"⚠️ 여전히 {remaining_needed}개 기사 부족 - 전체에서 무작위 선택")
-            while len(top3_articles) < 3 and len(valid_articles) > len(top3_articles):
-                remaining_indices = [i for i in range(len(valid_articles)) 
-                                   if valid_articles[i] not in top3_articles]
-                if remaining_indices:
-                    selected_idx = np.random.choice(remaining_indices)
-                    top3_articles.append(valid_articles[selected_idx])
-                else:
-                    print("❌ 더 이상 선택할 기사가 없습니다.")
-                    break
-        
-        print(f"✅ 최종 선택된 기사 수: {len(top3_articles)}")
+    medoid_positions = []
+    for cluster_id, _ in cnt.most_common():
+        cluster_idxs = np.where(labels == cluster_id)[0]
+        cluster_embs = embeddings[cluster_idxs]
+        centroid = cluster_embs.mean(axis=0)
+        dists = euclidean_distances([centroid], cluster_embs)[0]
+        medoid_positions.append(int(cluster_idxs[np.argmin(dists)]))
+    return labels, medoid_positions
+
+def _cluster_titles(article_ids, titles):
+    """
+    제목 임베딩을 클러스터링합니다.
+    반환: (클러스터 라벨 배열, 클러스터 크기 순 medoid 위치 목록)
+    """
+    # 1) 임베딩 (저장소에 있는 제목은 재사용)
+    embeddings = embed_article_titles(article_ids, titles)
+    return cluster_embeddings(embeddings)
+
+def _select_top3_positions(labels, medoid_positions, n_articles):
+    """
+    상위 3개 클러스터의 medoid 위치를 반환합니다.
+    클러스터가 3개 미만이면 노이즈, 그래도 부족하면 전체에서 무작위로 채웁니다.
+    """
+    if len(medoid_positions) >= 3:
+        return medoid_positions[:3]
+
+    print(f"❗ 클러스터 개수가 부족합니다. (필요: 3개, 현재: {len(medoid_positions)}개)")
+    print(f"📊 총 기사 수: {n_articles}, 클러스터링된 기사 수: {len(labels[labels >= 0])}, 노이즈 기사 수: {len(labels[labels == -1])}")
+
+    # 클러스터가 부족한 경우 가장 큰 클러스터들과 노이즈에서 선택
+    top3_positions = list(medoid_positions)
+    print(f"🔍 클러스터에서 선택된 기사 수: {len(top3_positions)}")
+
+    # 부족한 만큼 노이즈에서 추가 선택 (무작위)
+    noise_indices = np.where(labels == -1)[0]
+    needed = 3 - len(top3_positions)
+    if needed > 0 and len(noise_indices) > 0:
+        print(f"🎲 노이즈에서 {needed}개 기사 추가 선택 (사용 가능한 노이즈: {len(noise_indices)}개)")
+        selected_noise = np.random.choice(noise_indices, min(needed, len(noise_indices)), replace=False)
+        top3_positions.extend(int(idx) for idx in selected_noise)
+
+    # 여전히 부족하면 전체에서 무작위 선택
+    remaining_needed = 3 - len(top3_positions)
+    if remaining_needed > 0:
+        print(f"⚠️ 여전히 {remaining_needed}개 기사 부족 - 전체에서 무작위 선택")
+        remaining_indices = [i for i in range(n_articles) if i not in top3_positions]
+        if len(remaining_indices) < remaining_needed:
+            print("❌ 더 이상 선택할 기사가 없습니다.")
+        selected = np.random.choice(remaining_indices, min(remaining_needed, len(remaining_indices)), replace=False)
+        top3_positions.extend(int(idx) for idx in selected)
+
+    print(f"✅ 최종 선택된 기사 수: {len(top3_positions)}")
+    return top3_positions
+
+def cluster_week(scope: str, week_sunday: str):
+    """
+    scope(섹터명 또는 MARKET_SCOPE)의 주차 기사를 클러스터링하고 결과를 weekly_cluster_result에 저장합니다.
+    (오늘이 포함된 주차는 아직 기사가 추가되므로 저장하지 않음)
+    반환: 상위 3개 기사 정보 목록 (기사가 3개 미만이면 None)
+    """
+    if scope == MARKET_SCOPE:
+        articles_data = get_hot_articles_by_date(week_sunday)
+        scope_label = f"{week_sunday} 주차"
     else:
-        top_clusters = [cl[0] for cl in cnt.most_common(3)]
-        top3_articles = []
-        
-        for cluster_id in top_clusters:
-            cluster_idxs = np.where(labels == cluster_id)[0]
-            cluster_embs = embeddings[cluster_idxs]
-            centroid = cluster_embs.mean(axis=0)
-            dists = euclidean_distances([centroid], cluster_embs)[0]
-            medoid_pos = cluster_idxs[np.argmin(dists)]
-            
-            article_data = valid_articles[medoid_pos]
-            top3_articles.append(article_data)
-    
-    # 4) 각 기사에 대해 감성점수, 키워드, 요약 추가
+        articles_data = get_articles_by_sector(scope, week_sunday)
+        scope_label = f"{scope} 섹터의 {week_sunday} 주차"
+
+    if not articles_data:
+        print(f"❗ {scope_label}에 기사 데이터가 없습니다.")
+        return None
+
+    # 기사 제목 추출 및 클리닝
+    valid_articles, titles, article_ids = _extract_valid_articles(articles_data)
+    if len(titles) < 3:
+        print(f"❗ {scope_label}의 기사가 충분하지 않습니다. (필요: 3개, 현재: {len(titles)}개)")
+        return None
+
+    labels, medoid_positions = _cluster_titles(article_ids, titles)
+    top3_positions = _select_top3_positions(labels, medoid_positions, len(valid_articles))
+
+    if is_closed_week(week_sunday):
+        save_cluster_result(
+            scope,
+            week_sunday,
+            article_ids,
+            labels.tolist(),
+            [article_ids[i] for i in medoid_positions],
+            [article_ids[i] for i in top3_positions]
+        )
+    return [valid_articles[i] for i in top3_positions]
+
+def _get_top3_articles(scope: str, week_sunday: str):
+    """
+    저장된 클러스터링 결과가 있으면 해당 기사를 바로 가져오고, 없으면 실시간으로 클러스터링합니다.
+    """
+    stored = get_cluster_result(scope, week_sunday)
+    if stored is not None:
+        top3_ids = stored['top3_article_ids']
+        top3_articles, _, _ = _extract_valid_articles(get_articles_by_ids(top3_ids))
+        # 저장 이후 기사가 삭제/변경된 경우에만 다시 계산
+        if len(top3_articles) == len(top3_ids):
+            return top3_articles
+        print(f"⚠️ 저장된 클러스터링 결과의 기사가 없어 다시 계산합니다. ({scope}, {week_sunday})")
+    return cluster_week(scope, week_sunday)
+
+def _enrich_articles(top3_articles, include_sector: bool):
+    """
+    각 기사에 감성점수, 키워드, 요약을 추가합니다.
+    요약(BART + 번역)은 별도 스레드에서 진행하고, 그동안 키워드를 모든 기사에 대해 한 번에 추출합니다.
+    """
+    texts = [article_data['article'] for article_data in top3_articles]
+
+    # 4) 감성점수 계산
+    scores = [get_sentiment_score_for_article(text) for text in texts]
+
     enriched_articles = []
-    
-    for article_data in top3_articles:
-        # 감성점수 계산
-        sentiment_score = get_sentiment_score_for_article(article_data['article'])
-        
-        # 키워드 추출
-        original_ents, lowered_ents = extract_named_entities(article_data['article'])
-        keywords = extract_keywords(article_data['article'], kw_model)
-        keywords = restore_named_entities(keywords, original_ents, lowered_ents)
-        keyword_list = [kw for kw, _ in keywords]
-        
+    for article_data, sentiment_score in zip(top3_articles, scores):
         enriched_article = {
             'article': article_data['article'],
             'date': article_data['date'].strftime('%Y-%m-%d') if hasattr(article_data['date'], 'strftime') else str(article_data['date']),
             'weekstart': article_data['weekstart'].strftime('%Y-%m-%d') if hasattr(article_data['weekstart'], 'strftime') else str(article_data['weekstart']),
             'article_title': article_data['article_title'],
             'stock_symbol': article_data['stock_symbol'],
-            'score': sentiment_score,
-            'keywords': keyword_list
         }
+        if include_sector:
+            enriched_article['sector'] = article_data['sector']
+        enriched_article['score'] = sentiment_score
         enriched_articles.append(enriched_article)
-    
+
     # 5) 요약 추가 (기존 함수 활용을 위해 형식 맞추기)
     summary_input = []
     for article in enriched_articles:
@@ -188,9 +278,20 @@ def get_industry_top3_articles(sector: str, end_date: str):
             'neg_cnt': 0,  # 임시값
             'article_title': article['article_title']
         })
-    
-    summarized_articles = summarize_top3_articles(summary_input)
-    
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrich-summary") as pool:
+        summary_future = pool.submit(summarize_top3_articles, summary_input)
+
+        # 6) 키워드 추출 (기사당 spaCy 파싱 1회 + KeyBERT 1회 호출)
+        analyses = analyze_articles(texts)
+        keywords_batch = extract_keywords_batch(texts, get_keybert(), analyses=analyses)
+        for article, analysis, keywords in zip(enriched_articles, analyses, keywords_batch):
+            original_ents, lowered_ents = analysis.entities
+            keywords = restore_named_entities(keywords, original_ents, lowered_ents)
+            article['keywords'] = [kw for kw, _ in keywords]
+
+        summarized_articles = summary_future.result()
+
     # 최종 결과 구성
     final_articles = []
     for i, article in enumerate(enriched_articles):
@@ -200,12 +301,26 @@ def get_industry_top3_articles(sector: str, end_date: str):
         else:
             final_article['summary'] = "요약을 생성할 수 없습니다."
         final_articles.append(final_article)
-    
+    return final_articles
+
+def get_industry_top3_articles(sector: str, end_date: str):
+    """
+    산업군과 종료일을 받아 클러스터링을 통한 상위 3개 대표 기사를 반환합니다.
+    (사전 계산된 주차는 저장된 결과 사용)
+    """
+    week_sunday = week_start_sunday(end_date)
+
+    top3_articles = _get_top3_articles(sector, week_sunday)
+    if not top3_articles:
+        return {"top3_articles": [], "week": week_sunday}
+
+    final_articles = _enrich_articles(top3_articles, include_sector=False)
+
     print(f"=== {sector} 섹터 {week_sunday} 주차 상위 3개 클러스터 대표 기사 ===")
     for i, article in enumerate(final_articles, 1):
         print(f"[기사 {i}] 종목: {article['stock_symbol']}, 제목: {article['article_title']}")
         print(f"감성점수: {article['score']}, 키워드: {article['keywords'][:3]}")
-    
+
     return {
         "top3_articles": final_articles,
         "week": week_sunday
@@ -220,8 +335,8 @@ def get_hot_articles_by_date(start_date: str):
         with get_sqlalchemy_engine().connect() as conn:
             # 5. 쿼리를 text()로 감싸고, 파라미터 스타일을 :name 으로 변경합니다.
             query = text("""
-                SELECT article, date, weekstart_sunday, article_title, stock_symbol, sector
-                FROM kb_enterprise_dataset 
+                SELECT id, article, date, weekstart_sunday, article_title, stock_symbol, sector
+                FROM kb_enterprise_dataset
                 WHERE weekstart_sunday = :start_date
                   AND article IS NOT NULL AND article != ''
                 ORDER BY date DESC;
@@ -238,164 +353,22 @@ def get_hot_articles_by_date(start_date: str):
 def get_market_hot_articles(end_date: str):
     """
     특정 날짜의 주차에서 모든 섹터의 기사를 대상으로 클러스터링을 통한 상위 3개 핫한 기사를 반환합니다.
+    (사전 계산된 주차는 저장된 결과 사용)
     """
     week_sunday = week_start_sunday(end_date)
-    
-    # DB에서 해당 주차의 모든 기사들 가져오기
-    articles_data = get_hot_articles_by_date(week_sunday)
-    
-    if not articles_data:
-        print(f"❗ {week_sunday} 주차에 기사 데이터가 없습니다.")
-        return {"top3_articles": [], "week": week_sunday}
-    
-    # 기사 제목 추출 및 클리닝
-    valid_articles = []
-    titles = []
-    
-    for row in articles_data:
-        article_title = row['article_title']
-        if article_title and article_title.strip():
-            valid_articles.append({
-                'article': row['article'],
-                'date': row['date'],
-                'weekstart': row['weekstart_sunday'],
-                'article_title': article_title,
-                'stock_symbol': row['stock_symbol'],
-                'sector': row['sector']
-            })
-            titles.append(article_title.strip())
-    
-    if len(titles) < 3:
-        print(f"❗ {week_sunday} 주차의 기사가 충분하지 않습니다. (필요: 3개, 현재: {len(titles)}개)")
+
+    top3_articles = _get_top3_articles(MARKET_SCOPE, week_sunday)
+    if not top3_articles:
         return {"top3_articles": [], "week": week_sunday}
-    
-    # 1) 임베딩
-    model = SentenceTransformer('paraphrase-mpnet-base-v2', cache_folder=CACHE_DIR)
-    embeddings = model.encode(titles, show_progress_bar=True)
-    
-    # 2) 클러스터링
-    clusterer = hdbscan.HDBSCAN(min_cluster_size=3)
-    labels = clusterer.fit_predict(embeddings)
-    
-    # 3) 상위 3개 클러스터 찾기
-    cnt = collections.Counter(labels[labels >= 0])
-    if len(cnt) < 3:
-        print(f"❗ 클러스터 개수가 부족합니다. (필요: 3개, 현재: {len(cnt)}개)")
-        print(f"📊 총 기사 수: {len(valid_articles)}, 클러스터링된 기사 수: {len(labels[labels >= 0])}, 노이즈 기사 수: {len(labels[labels == -1])}")
-        
-        # 클러스터가 부족한 경우 가장 큰 클러스터들과 노이즈에서 선택
-        available_clusters = [cl[0] for cl in cnt.most_common()]
-        noise_indices = np.where(labels == -1)[0]
-        
-        top3_articles = []
-        
-        # 기존 클러스터에서 대표 기사 선택
-        for cluster_id in available_clusters:
-            cluster_idxs = np.where(labels == cluster_id)[0]
-            cluster_embs = embeddings[cluster_idxs]
-            centroid = cluster_embs.mean(axis=0)
-            dists = euclidean_distances([centroid], cluster_embs)[0]
-            medoid_pos = cluster_idxs[np.argmin(dists)]
-            
-            article_data = valid_articles[medoid_pos]
-            top3_articles.append(article_data)
-        
-        print(f"🔍 클러스터에서 선택된 기사 수: {len(top3_articles)}")
-        
-        # 부족한 만큼 노이즈에서 추가 선택 (무작위)
-        needed = 3 - len(top3_articles)
-        if needed > 0 and len(noise_indices) > 0:
-            print(f"🎲 노이즈에서 {needed}개 기사 추가 선택 (사용 가능한 노이즈: {len(noise_indices)}개)")
-            selected_noise = np.random.choice(noise_indices, min(needed, len(noise_indices)), replace=False)
-            for idx in selected_noise:
-                article_data = valid_articles[idx]
-                top3_articles.append(article_data)
-        
-        # 여전히 부족하면 전체에서 무작위 선택
-        remaining_needed = 3 - len(top3_articles)
-        if remaining_needed > 0:
-            print(f"⚠️ 여전히 {remaining_needed}개 기사 부족 - 전체에서 무작위 선택")
-            while len(top3_articles) < 3 and len(valid_articles) > len(top3_articles):
-                remaining_indices = [i for i in range(len(valid_articles)) 
-                                   if valid_articles[i] not in top3_articles]
-                if remaining_indices:
-                    selected_idx = np.random.choice(remaining_indices)
-                    top3_articles.append(valid_articles[selected_idx])
-                else:
-                    print("❌ 더 이상 선택할 기사가 없습니다.")
-                    break
-        
-        print(f"✅ 최종 선택된 기사 수: {len(top3_articles)}")
-    else:
-        top_clusters = [cl[0] for cl in cnt.most_common(3)]
-        top3_articles = []
-        
-        for cluster_id in top_clusters:
-            cluster_idxs = np.where(labels == cluster_id)[0]
-            cluster_embs = embeddings[cluster_idxs]
-            centroid = cluster_embs.mean(axis=0)
-            dists = euclidean_distances([centroid], cluster_embs)[0]
-            medoid_pos = cluster_idxs[np.argmin(dists)]
-            
-            article_data = valid_articles[medoid_pos]
-            top3_articles.append(article_data)
-    
-    # 4) 각 기사에 대해 감성점수, 키워드, 요약 추가
-    enriched_articles = []
-    
-    for article_data in top3_articles:
-        # 감성점수 계산
-        sentiment_score = get_sentiment_score_for_article(article_data['article'])
-        
-        # 키워드 추출
-        original_ents, lowered_ents = extract_named_entities(article_data['article'])
-        keywords = extract_keywords(article_data['article'], kw_model)
-        keywords = restore_named_entities(keywords, original_ents, lowered_ents)
-        keyword_list = [kw for kw, _ in keywords]
-        
-        enriched_article = {
-            'article': article_data['article'],
-            'date': article_data['date'].strftime('%Y-%m-%d') if hasattr(article_data['date'], 'strftime') else str(article_data['date']),
-            'weekstart': article_data['weekstart'].strftime('%Y-%m-%d') if hasattr(article_data['weekstart'], 'strftime') else str(article_data['weekstart']),
-            'article_title': article_data['article_title'],
-            'stock_symbol': article_data['stock_symbol'],
-            'sector': article_data['sector'],
-            'score': sentiment_score,
-            'keywords': keyword_list
-        }
-        enriched_articles.append(enriched_article)
-    
-    # 5) 요약 추가 (기존 함수 활용을 위해 형식 맞추기)
-    summary_input = []
-    for article in enriched_articles:
-        summary_input.append({
-            'article': article['article'],
-            'date': article['date'],
-            'weekstart': article['weekstart'],
-            'score': article['score'],
-            'pos_cnt': 0,  # 임시값
-            'neg_cnt': 0,  # 임시값
-            'article_title': article['article_title']
-        })
-    
-    summarized_articles = summarize_top3_articles(summary_input)
-    
-    # 최종 결과 구성
-    final_articles = []
-    for i, article in enumerate(enriched_articles):
-        final_article = article.copy()
-        if i < len(summarized_articles):
-            final_article['summary'] = summarized_articles[i]['summary']
-        else:
-            final_article['summary'] = "요약을 생성할 수 없습니다."
-        final_articles.append(final_article)
-    
+
+    final_articles = _enrich_articles(top3_articles, include_sector=True)
+
     print(f"=== {week_sunday} 주차 시장 핫한 기사 TOP 3 ===")
     for i, article in enumerate(final_articles, 1):
         print(f"[기사 {i}] 섹터: {article['sector']}, 종목: {article['stock_symbol']}, 제목: {article['article_title']}")
         print(f"감성점수: {article['score']}, 키워드: {article['keywords'][:3]}")
-    
+
     return {
         "top3_articles": final_articles,
         "week": week_sunday
-    }
\ No newline at end of file
+    }
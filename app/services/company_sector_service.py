@@ -4,9 +4,32 @@
 import logging
 from sqlalchemy import text
 from app.db.database import SessionLocal
+from app.db.async_connection import get_async_engine
+from app.core.metrics import caller_option
 
 logger = logging.getLogger(__name__)
 
+# kb_enterprise_dataset 테이블에서 ticker로 섹터 정보 조회
+COMPANY_SECTOR_QUERY = text("""
+    SELECT stock_symbol, sector
+    FROM kb_enterprise_dataset 
+    WHERE stock_symbol = :ticker
+    LIMIT 1
+""")
+
+def _sector_row_to_dict(ticker: str, row) -> dict:
+    if row:
+        return {
+            "ticker": row[0],
+            "sector": row[1]
+        }
+    logger.warning(f"No sector data found for ticker: {ticker}")
+    return {
+        "ticker": ticker,
+        "sector": None,
+        "message": f"해당 티커({ticker})의 섹터 정보를 찾을 수 없습니다."
+    }
+
 def get_company_sector_by_ticker(ticker: str) -> dict:
     """
     기업의 ticker로 해당 기업의 섹터 정보를 조회
@@ -19,31 +42,27 @@ def get_company_sector_by_ticker(ticker: str) -> dict:
     """
     db = SessionLocal()
     try:
-        # kb_enterprise_dataset 테이블에서 ticker로 섹터 정보 조회
-        query = text("""
-            SELECT stock_symbol, sector
-            FROM kb_enterprise_dataset 
-            WHERE stock_symbol = :ticker
-            LIMIT 1
-        """)
-        
-        result = db.execute(query, {"ticker": ticker}).fetchone()
-        
-        if result:
-            return {
-                "ticker": result[0],
-                "sector": result[1]
-            }
-        else:
-            logger.warning(f"No sector data found for ticker: {ticker}")
-            return {
-                "ticker": ticker,
-                "sector": None,
-                "message": f"해당 티커({ticker})의 섹터 정보를 찾을 수 없습니다."
-            }
+        result = db.execute(COMPANY_SECTOR_QUERY, {"ticker": ticker}).fetchone()
+        return _sector_row_to_dict(ticker, result)
                 
     except Exception as e:
         logger.error(f"Error fetching company sector for ticker {ticker}: {str(e)}")
         raise Exception(f"기업 섹터 정보 조회 중 오류가 발생했습니다: {str(e)}")
     finally:
         db.close()
+
+async def get_company_sector_by_ticker_async(ticker: str) -> dict:
+    """
+    get_company_sector_by_ticker의 비동기 버전 (asyncpg, 이벤트 루프 비차단)
+    """
+    try:
+        engine = await get_async_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                COMPANY_SECTOR_QUERY, {"ticker": ticker},
+                execution_options=caller_option(f"{__name__}.get_company_sector_by_ticker_async")
+            )
+            return _sector_row_to_dict(ticker, result.fetchone())
+    except Exception as e:
+        logger.error(f"Error fetching company sector for ticker {ticker}: {str(e)}")
+        raise Exception(f"기업 섹터 정보 조회 중 오류가 발생했습니다: {str(e)}")
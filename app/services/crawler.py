@@ -5,11 +5,23 @@ import json
 import pandas_datareader.data as web
 from app.core.config import settings
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List
 from openai import OpenAI
-from app.db.connection import get_sqlalchemy_engine
-from sqlalchemy import text 
+from app.core.http_client import get_http_client
+from app.services.price_repository import (
+    PRICE_COLUMNS,
+    PRICE_DATA_END_DATE,
+    clamp_end_date,
+    dates_to_strings,
+    get_index_prices,
+    get_price_series,
+    get_stock_table_name,
+    slice_series,
+    to_float_list,
+)
+from app.services.return_analysis import compute_return_analytics
 
 
 # 요청 간 최소 대기시간 (초 단위)
@@ -234,45 +246,23 @@ def get_weekly_stock_indicators_from_stooq(ticker: str, start_date: str, end_dat
     }
     """
     try:
-        # 티커 첫 글자에 따라 테이블 결정
-        first_letter = ticker[0].lower()
-        if 'a' <= first_letter <= 'd':
-            table_name = 'fnspid_stock_price_a'
-        elif 'e' <= first_letter <= 'm':
-            table_name = 'fnspid_stock_price_b'
-        elif 'n' <= first_letter <= 'z':
-            table_name = 'fnspid_stock_price_c'
-        else:
+        if get_stock_table_name(ticker) is None:
             return {"error": f"Invalid ticker format: {ticker}"}
         
         # 2023년까지의 데이터만 있으므로 end_date가 2023년을 넘으면 조정
-        if end_date > '2023-12-31':
-            end_date = '2023-12-31'
-        if start_date > '2023-12-31':
+        end_date = clamp_end_date(end_date)
+        if start_date > PRICE_DATA_END_DATE:
             return {"error": "No data available for the requested period (data only until 2023)"}
         
-        with get_sqlalchemy_engine().connect() as conn:
-            # 주간 데이터 조회 (SQLAlchemy 2.x 호환되도록 수정)
-            query = text(f"""
-                SELECT date, open, high, low, close, volume, adj_close
-                FROM {table_name}
-                WHERE stock_symbol = :ticker AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            params = {"ticker": ticker, "start_date": start_date, "end_date": end_date}
-            result = conn.execute(query, params)
-            rows = result.mappings().all()
-        
-        if not rows:
+        series = get_price_series(ticker, start_date, end_date)
+        if series is None:
             return {"error": "No price data in given period."}
         
-        # DataFrame 생성 (딕셔너리 리스트를 사용하므로 columns 인자 불필요)
-        df = pd.DataFrame(rows)
-        
-        # 날짜를 인덱스로 설정하고 정렬
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-        df.sort_index(inplace=True)
+        # 날짜를 인덱스로 하는 DataFrame 생성 (이미 날짜 오름차순)
+        df = pd.DataFrame(
+            {col: series[col] for col in PRICE_COLUMNS},
+            index=pd.to_datetime(series['dates'])
+        )
         
         # 통계 계산 (adj_close 사용)
         close_avg = df['adj_close'].mean()
@@ -326,65 +316,25 @@ def get_stock_price_chart_data(ticker: str, start_date: str, end_date: str) -> D
     주식 가격 차트 데이터를 데이터베이스에서 가져옵니다.
     """
     try:
-        # 티커 첫 글자에 따라 테이블 결정
-        first_letter = ticker[0].lower()
-        if 'a' <= first_letter <= 'd':
-            table_name = 'fnspid_stock_price_a'
-        elif 'e' <= first_letter <= 'm':
-            table_name = 'fnspid_stock_price_b'
-        elif 'n' <= first_letter <= 'z':
-            table_name = 'fnspid_stock_price_c'
-        else:
+        if get_stock_table_name(ticker) is None:
             return {"error": f"Invalid ticker format: {ticker}"}
         
         # 2023년까지의 데이터만 있으므로 end_date가 2023년을 넘으면 조정
-        if end_date > '2023-12-31':
-            end_date = '2023-12-31'
-        if start_date > '2023-12-31':
+        end_date = clamp_end_date(end_date)
+        if start_date > PRICE_DATA_END_DATE:
             return {"error": "No data available for the requested period (data only until 2023)"}
         
-        with get_sqlalchemy_engine().connect() as conn:
-            # 차트 데이터 조회 (SQLAlchemy 2.x 호환되도록 수정)
-            query = text(f"""
-                SELECT date, open, high, low, close, volume, adj_close
-                FROM {table_name}
-                WHERE stock_symbol = :ticker AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            params = {"ticker": ticker, "start_date": start_date, "end_date": end_date}
-            result = conn.execute(query, params)
-            rows = result.mappings().all()  # 수정된 부분
-        
-        if not rows:
+        series = get_price_series(ticker, start_date, end_date, ('open', 'high', 'low', 'close', 'volume'))
+        if series is None:
             return {"error": f"No data found for symbol {ticker}"}
         
-        # 데이터 구조화 (딕셔너리 접근 방식으로 변경)
-        dates = []
-        opens = []
-        highs = []
-        lows = []
-        closes = []
-        volumes = []
-        
-        for row in rows:
-            # row는 이제 딕셔너리 형태
-            if isinstance(row['date'], str):
-                dates.append(row['date'])
-            else:
-                dates.append(row['date'].strftime('%Y-%m-%d'))
-            opens.append(float(row['open']) if row['open'] is not None else None)
-            highs.append(float(row['high']) if row['high'] is not None else None)
-            lows.append(float(row['low']) if row['low'] is not None else None)
-            closes.append(float(row['close']) if row['close'] is not None else None)
-            volumes.append(float(row['volume']) if row['volume'] is not None else None)
-        
         return {
-            "dates": dates,
-            "closes": closes,
-            "opens": opens,
-            "highs": highs,
-            "lows": lows,
-            "volumes": volumes
+            "dates": dates_to_strings(series['dates']),
+            "closes": to_float_list(series['close']),
+            "opens": to_float_list(series['open']),
+            "highs": to_float_list(series['high']),
+            "lows": to_float_list(series['low']),
+            "volumes": to_float_list(series['volume'])
         }
     except Exception as e:
         return {"error": f"Error fetching stock data from database for {ticker}: {e}"}
@@ -441,32 +391,15 @@ def get_index_chart_data(symbol: str, start_date: str, end_date: str) -> Dict:
         if not column_name:
             return {"error": f"Unsupported index symbol: {symbol}"}
         
-        with get_sqlalchemy_engine().connect() as conn:
-            # 지수 데이터 조회 (SQLAlchemy 2.x 호환되도록 수정)
-            query = text(f"""
-                SELECT date, {column_name}
-                FROM index_closing_price
-                WHERE date BETWEEN :start_date AND :end_date AND {column_name} IS NOT NULL
-                ORDER BY date ASC
-            """)
-            params = {"start_date": start_date, "end_date": end_date}
-            result = conn.execute(query, params)
-            rows = result.mappings().all()  # 수정된 부분
+        # 지수 데이터 조회 (NULL 제외)
+        series = get_index_prices(start_date, end_date, (column_name,))
+        valid = ~np.isnan(series[column_name])
         
-        if not rows:
+        if not valid.any():
             return {"error": f"No data found for symbol {symbol}"}
         
-        # 데이터 구조화 (딕셔너리 접근 방식으로 변경)
-        dates = []
-        closes = []
-        
-        for row in rows:
-            # row는 이제 딕셔너리 형태
-            if isinstance(row['date'], str):
-                dates.append(row['date'])
-            else:
-                dates.append(row['date'].strftime('%Y-%m-%d'))
-            closes.append(float(row[column_name]) if row[column_name] is not None else None)
+        dates = dates_to_strings(series['dates'][valid])
+        closes = series[column_name][valid].tolist()
         
         # index_closing_price 테이블에는 OHLV 데이터가 없으므로 close 값만 제공
         # 호환성을 위해 opens, highs, lows는 closes와 동일한 값으로, volumes는 None으로 설정
@@ -519,185 +452,25 @@ def calculate_absolute_and_relative_returns(ticker: str, start_date: str, end_da
         'sp500_returns': [...],   # 수익률(%)
         'relative_returns': [...]  # 상대수익률(%)
     }
+    (계산은 return_analysis.compute_return_analytics에서 한 번에 수행)
     """
-    try:
-        # 개별 주식 데이터 가져오기
-        stock_data = get_stock_price_chart_data(ticker, start_date, end_date)
-        if "error" in stock_data:
-            return stock_data
-        
-        # S&P500 데이터 가져오기 (기존 나스닥에서 S&P500으로 변경)
-        sp500_data = get_index_chart_data('^SPX', start_date, end_date)
-        if "error" in sp500_data:
-            return sp500_data
-        
-        # 날짜 매칭 (두 데이터의 교집합)
-        stock_dates = set(stock_data['dates'])
-        sp500_dates = set(sp500_data['dates'])
-        common_dates = sorted(list(stock_dates & sp500_dates))
-        
-        if not common_dates:
-            return {"error": "No common dates between stock and S&P500 data"}
-        
-        # 공통 날짜에 해당하는 데이터만 추출
-        stock_prices = []
-        sp500_prices = []
-        
-        for date in common_dates:
-            stock_idx = stock_data['dates'].index(date)
-            sp500_idx = sp500_data['dates'].index(date)
-            stock_prices.append(stock_data['closes'][stock_idx])
-            sp500_prices.append(sp500_data['closes'][sp500_idx])
-        
-        # 지수 계산 (기준일=100)
-        stock_index = [(price / stock_prices[0]) * 100 for price in stock_prices]
-        sp500_index = [(price / sp500_prices[0]) * 100 for price in sp500_prices]
-        
-        # 상대지수 계산
-        relative_index = [(s_idx / b_idx) * 100 for s_idx, b_idx in zip(stock_index, sp500_index)]
-        
-        # 수익률 계산 (%)
-        stock_returns = [((price / stock_prices[0]) - 1) * 100 for price in stock_prices]
-        sp500_returns = [((price / sp500_prices[0]) - 1) * 100 for price in sp500_prices]
-        relative_returns = [((rel_idx / 100) - 1) * 100 for rel_idx in relative_index]
-        
-        return {
-            'dates': common_dates,
-            'stock_prices': stock_prices,
-            'sp500_prices': sp500_prices,
-            'stock_index': stock_index,
-            'sp500_index': sp500_index,
-            'relative_index': relative_index,
-            'stock_returns': stock_returns,
-            'sp500_returns': sp500_returns,
-            'relative_returns': relative_returns
-        }
-        
-    except Exception as e:
-        return {"error": f"Error calculating returns: {e}"}
+    result = compute_return_analytics(ticker, start_date, end_date)
+    return result.get('comparison', result)
 
 def get_return_analysis_summary(ticker: str, start_date: str, end_date: str) -> dict:
     """
     수익률 분석 요약 정보를 반환합니다.
     """
-    try:
-        data = calculate_absolute_and_relative_returns(ticker, start_date, end_date)
-        if "error" in data:
-            return data
-        
-        if not data['stock_returns']:
-            return {"error": "No return data available"}
-        
-        stock_final_return = data['stock_returns'][-1]
-        sp500_final_return = data['sp500_returns'][-1]
-        relative_final_return = data['relative_returns'][-1]
-        
-        # 변동성 계산 (일간 수익률의 표준편차 × √252)
-        import numpy as np
-        if len(data['stock_prices']) > 1:
-            daily_stock_returns = [((data['stock_prices'][i] / data['stock_prices'][i-1]) - 1) * 100 
-                                 for i in range(1, len(data['stock_prices']))]
-            stock_volatility = np.std(daily_stock_returns) * (252 ** 0.5)
-        else:
-            stock_volatility = 0
-        
-        return {
-            "ticker": ticker,
-            "period": f"{start_date} ~ {end_date}",
-            "stock_return": round(stock_final_return, 2),
-            "sp500_return": round(sp500_final_return, 2),
-            "relative_return": round(relative_final_return, 2),
-            "stock_volatility": round(stock_volatility, 2),
-            "outperformance": round(stock_final_return - sp500_final_return, 2),
-            "data_points": len(data['dates'])
-        }
-        
-    except Exception as e:
-        return {"error": f"Error generating return analysis summary: {e}"}
+    result = compute_return_analytics(ticker, start_date, end_date)
+    return result.get('summary', result)
 
 def get_return_analysis_table(ticker: str, start_date: str, end_date: str) -> dict:
     """
     수익률 분석 표 데이터를 반환합니다.
     절대수익률과 상대수익률을 기간별로 제공합니다.
     """
-    try:
-        data = calculate_absolute_and_relative_returns(ticker, start_date, end_date)
-        if "error" in data:
-            return data
-        
-        if not data['stock_returns']:
-            return {"error": "No return data available"}
-        
-        # 최종 수익률 계산
-        stock_final_return = data['stock_returns'][-1]
-        sp500_final_return = data['sp500_returns'][-1]
-        relative_final_return = data['relative_returns'][-1]
-        
-        # 1개월, 3개월, 6개월, 12개월 수익률 계산
-        dates = data['dates']
-        stock_returns = data['stock_returns']
-        sp500_returns = data['sp500_returns']
-        relative_returns = data['relative_returns']
-        
-        # 현재 날짜에서 역순으로 기간별 수익률 계산
-        periods = {
-            '1M': 22,    # 약 1개월 (22 영업일)
-            '3M': 66,    # 약 3개월 (66 영업일)
-            '6M': 132,   # 약 6개월 (132 영업일)
-            '12M': 252   # 약 12개월 (252 영업일)
-        }
-        
-        table_data = []
-        
-        for period_name, days_back in periods.items():
-            if len(stock_returns) > days_back:
-                # 해당 기간의 시작점과 끝점 인덱스
-                start_idx = len(stock_returns) - days_back - 1
-                end_idx = len(stock_returns) - 1
-                
-                # 기간별 수익률 계산 (시작점 대비 끝점)
-                stock_start_price = data['stock_prices'][start_idx]
-                stock_end_price = data['stock_prices'][end_idx]
-                stock_period_return = ((stock_end_price / stock_start_price) - 1) * 100
-                
-                sp500_start_price = data['sp500_prices'][start_idx]
-                sp500_end_price = data['sp500_prices'][end_idx]
-                sp500_period_return = ((sp500_end_price / sp500_start_price) - 1) * 100
-                
-                # 상대수익률 = 개별주식수익률 - 벤치마크수익률
-                relative_period_return = stock_period_return - sp500_period_return
-                
-                table_data.append({
-                    'period': period_name,
-                    'absolute_return': round(stock_period_return, 2),
-                    'relative_return': round(relative_period_return, 2),
-                    'benchmark_return': round(sp500_period_return, 2),
-                    'outperformance': round(stock_period_return - sp500_period_return, 2)
-                })
-            else:
-                # 데이터가 부족한 경우에도 기본값을 넣어서 프론트엔드에서 '-'로 표시
-                table_data.append({
-                    'period': period_name,
-                    'absolute_return': None,
-                    'relative_return': None,
-                    'benchmark_return': None,
-                    'outperformance': None
-                })
-        
-        return {
-            "ticker": ticker,
-            "period": f"{start_date} ~ {end_date}",
-            "table_data": table_data,
-            "current_data": {
-                "absolute_return": round(stock_final_return, 2),
-                "relative_return": round(relative_final_return, 2),
-                "benchmark_return": round(sp500_final_return, 2),
-                "outperformance": round(stock_final_return - sp500_final_return, 2)
-            }
-        }
-        
-    except Exception as e:
-        return {"error": f"Error generating return analysis table: {e}"}
+    result = compute_return_analytics(ticker, start_date, end_date)
+    return result.get('table', result)
 
 
 #### 04 . 시황정보 : 증시, 채권, 환율 #####
@@ -719,31 +492,11 @@ def get_us_indices_6months_chart(end_date: str) -> dict:
         start_str = start_dt.strftime('%Y-%m-%d')
         end_str = end_dt.strftime('%Y-%m-%d')
 
-        with get_sqlalchemy_engine().connect() as conn:
-            query = text("""
-                SELECT date, dow, sp500, nasdaq 
-                FROM index_closing_price 
-                WHERE date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC;
-            """)
-            params = {"start_date": start_str, "end_date": end_str}
-            result = conn.execute(query, params)
-            rows = result.mappings().all()  # 수정된 부분
-        
-        # 데이터 구조화 (딕셔너리 접근 방식으로 변경)
-        dates = []
-        dow_closes = []
-        sp500_closes = []
-        nasdaq_closes = []
-        
-        for row in rows:
-            if isinstance(row['date'], str):
-                dates.append(row['date'])
-            else:
-                dates.append(row['date'].strftime('%Y-%m-%d'))
-            dow_closes.append(float(row['dow']) if row['dow'] is not None else None)
-            sp500_closes.append(float(row['sp500']) if row['sp500'] is not None else None)
-            nasdaq_closes.append(float(row['nasdaq']) if row['nasdaq'] is not None else None)
+        series = get_index_prices(start_str, end_str)
+        dates = dates_to_strings(series['dates'])
+        dow_closes = to_float_list(series['dow'])
+        sp500_closes = to_float_list(series['sp500'])
+        nasdaq_closes = to_float_list(series['nasdaq'])
         
         result = {
             'dow': {'dates': dates, 'closes': dow_closes},
@@ -772,33 +525,11 @@ def get_us_indices_1year_chart(end_date: str) -> dict:
         start_str = start_dt.strftime('%Y-%m-%d')
         end_str = end_dt.strftime('%Y-%m-%d')
 
-        with get_sqlalchemy_engine().connect() as conn:
-            # SQLAlchemy 2.x 호환되도록 수정
-            query = text("""
-                SELECT date, dow, sp500, nasdaq 
-                FROM index_closing_price 
-                WHERE date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC;
-            """)
-            params = {"start_date": start_str, "end_date": end_str}
-            result = conn.execute(query, params)
-            rows = result.mappings().all()  # 수정된 부분
-        
-        # 데이터 구조화 (딕셔너리 접근 방식으로 변경)
-        dates = []
-        dow_closes = []
-        sp500_closes = []
-        nasdaq_closes = []
-        
-        for row in rows:
-            # row는 이제 딕셔너리 형태
-            if isinstance(row['date'], str):
-                dates.append(row['date'])
-            else:
-                dates.append(row['date'].strftime('%Y-%m-%d'))
-            dow_closes.append(float(row['dow']) if row['dow'] is not None else None)
-            sp500_closes.append(float(row['sp500']) if row['sp500'] is not None else None)
-            nasdaq_closes.append(float(row['nasdaq']) if row['nasdaq'] is not None else None)
+        series = get_index_prices(start_str, end_str)
+        dates = dates_to_strings(series['dates'])
+        dow_closes = to_float_list(series['dow'])
+        sp500_closes = to_float_list(series['sp500'])
+        nasdaq_closes = to_float_list(series['nasdaq'])
         
         result = {
             'dow': {'dates': dates, 'closes': dow_closes},
@@ -985,81 +716,33 @@ def get_enhanced_stock_info(ticker: str, end_date: str = None) -> Dict:
     """
     import numpy as np
     try:
-        # 티커 첫 글자에 따라 테이블 결정
-        first_letter = ticker[0].lower()
-        if 'a' <= first_letter <= 'd':
-            table_name = 'fnspid_stock_price_a'
-        elif 'e' <= first_letter <= 'm':
-            table_name = 'fnspid_stock_price_b'
-        elif 'n' <= first_letter <= 'z':
-            table_name = 'fnspid_stock_price_c'
-        else:
+        if get_stock_table_name(ticker) is None:
             return {"error": f"Invalid ticker format: {ticker}"}
         
-        # end_date 파라미터 처리
-        if end_date is None:
-            # end_date가 제공되지 않으면 기본값으로 2023-12-31 사용
-            final_end_date = '2023-12-31'
-        else:
-            # end_date가 2023년을 넘으면 2023-12-31로 조정
-            if end_date > '2023-12-31':
-                final_end_date = '2023-12-31'
-            else:
-                final_end_date = end_date
+        # end_date가 없거나 2023년을 넘으면 2023-12-31로 조정
+        final_end_date = clamp_end_date(end_date)
         
         # 기준 날짜로부터 1년, 1개월, 60일 전 날짜 계산
         start_1y = (datetime.strptime(final_end_date, '%Y-%m-%d') - timedelta(days=365)).strftime('%Y-%m-%d')
         start_1m = (datetime.strptime(final_end_date, '%Y-%m-%d') - timedelta(days=31)).strftime('%Y-%m-%d')
         start_60d = (datetime.strptime(final_end_date, '%Y-%m-%d') - timedelta(days=60)).strftime('%Y-%m-%d')
         
-        with get_sqlalchemy_engine().connect() as conn:
-            # 1년치 데이터 조회
-            query_1y = text(f"""
-                SELECT date, open, high, low, close, volume, adj_close
-                FROM {table_name}
-                WHERE stock_symbol = :ticker AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            params_1y = {"ticker": ticker, "start_date": start_1y, "end_date": final_end_date}
-            result_1y = conn.execute(query_1y, params_1y)
-            rows_1y = result_1y.mappings().all()
-            
-            # 1개월치 데이터 조회
-            query_1m = text(f"""
-                SELECT date, open, high, low, close, volume, adj_close
-                FROM {table_name}
-                WHERE stock_symbol = :ticker AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            params_1m = {"ticker": ticker, "start_date": start_1m, "end_date": final_end_date}
-            result_1m = conn.execute(query_1m, params_1m)
-            rows_1m = result_1m.mappings().all()
-            
-            # 60일치 데이터 조회
-            query_60d = text(f"""
-                SELECT date, open, high, low, close, volume, adj_close
-                FROM {table_name}
-                WHERE stock_symbol = :ticker AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC
-            """)
-            params_60d = {"ticker": ticker, "start_date": start_60d, "end_date": final_end_date}
-            result_60d = conn.execute(query_60d, params_60d)
-            rows_60d = result_60d.mappings().all()
+        # 1년치 데이터를 한 번만 조회하고 1개월/60일 구간은 잘라서 사용
+        series_1y = get_price_series(ticker, start_1y, final_end_date)
+        if series_1y is None:
+            return {"error": f"No historical data found for {ticker} in database"}
+        series_1m = slice_series(series_1y, start_1m)
+        series_60d = slice_series(series_1y, start_60d)
         
         # 데이터 확인
-        if not rows_1y or not rows_1m or not rows_60d:
+        if len(series_1m['dates']) == 0 or len(series_60d['dates']) == 0:
             return {"error": f"No historical data found for {ticker} in database"}
         
-        # DataFrame 생성 (딕셔너리 리스트를 사용하므로 columns 인자 불필요)
-        df_1y = pd.DataFrame(rows_1y)
-        df_1m = pd.DataFrame(rows_1m)
-        df_60d = pd.DataFrame(rows_60d)
-        
-        # 날짜를 인덱스로 설정하고 정렬
-        for df in [df_1y, df_1m, df_60d]:
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            df.sort_index(inplace=True)
+        # DataFrame 생성 (날짜 인덱스, 오름차순)
+        df_1y, df_1m, df_60d = [
+            pd.DataFrame({col: series[col] for col in PRICE_COLUMNS}, index=pd.to_datetime(series['dates']))
+            for series in (series_1y, series_1m, series_60d)
+        ]
         
         # 현재가 (가장 최근 종가) - adj_close 사용
         current_price = df_1y['adj_close'].iloc[-1] if not df_1y.empty else None
@@ -1195,6 +878,82 @@ def get_financial_metrics_from_sec(ticker: str, end_date: str = None) -> dict:
     """
     return get_financial_metrics_from_fmp(ticker)
 
+def _parse_fmp_income_statement(ticker: str, data) -> dict:
+    """FMP Income Statement 응답(JSON)에서 최근 2년치 재무지표를 추출합니다."""
+    print(f"📊 FMP Income Statement data for {ticker}: {len(data)} entries found")
+
+    if not data or not isinstance(data, list) or len(data) == 0:
+        print(f"❌ FMP Income Statement: No data found for {ticker}")
+        return {"error": f"No income statement data found for {ticker}"}
+
+    # 최근 2년 데이터 추출
+    current_data = data[0] if len(data) > 0 else None
+    previous_data = data[1] if len(data) > 1 else None
+
+    def safe_float(value):
+        """안전한 float 변환"""
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+
+    def safe_percentage(numerator, denominator):
+        """안전한 퍼센트 계산"""
+        if numerator is None or denominator is None or denominator == 0:
+            return None
+        try:
+            return round((float(numerator) / float(denominator)) * 100, 2)
+        except (ValueError, TypeError, ZeroDivisionError):
+            return None
+
+    # 현재년도 데이터
+    current_revenue = safe_float(current_data.get("revenue")) if current_data else None
+    current_operating_income = safe_float(current_data.get("operatingIncome")) if current_data else None
+    current_net_income = safe_float(current_data.get("netIncome")) if current_data else None
+
+    # 전년도 데이터
+    previous_revenue = safe_float(previous_data.get("revenue")) if previous_data else None
+    previous_operating_income = safe_float(previous_data.get("operatingIncome")) if previous_data else None
+    previous_net_income = safe_float(previous_data.get("netIncome")) if previous_data else None
+
+    # 영업이익률 계산
+    current_operating_margin = safe_percentage(current_operating_income, current_revenue)
+    previous_operating_margin = safe_percentage(previous_operating_income, previous_revenue)
+
+    result = {
+        "ticker": ticker,
+        "current_year": current_data.get("calendarYear") if current_data else None,
+        "previous_year": previous_data.get("calendarYear") if previous_data else None,
+        "metrics": {
+            "revenue": {
+                "current": current_revenue,
+                "previous": previous_revenue
+            },
+            "operating_income": {
+                "current": current_operating_income,
+                "previous": previous_operating_income
+            },
+            "operating_margin": {
+                "current": current_operating_margin,
+                "previous": previous_operating_margin
+            },
+            "net_income": {
+                "current": current_net_income,
+                "previous": previous_net_income
+            }
+        }
+    }
+
+    print(f"✅ FMP Income Statement result for {ticker}:")
+    print(f"   Revenue: {current_revenue} / {previous_revenue}")
+    print(f"   Operating Income: {current_operating_income} / {previous_operating_income}")
+    print(f"   Operating Margin: {current_operating_margin}% / {previous_operating_margin}%")
+    print(f"   Net Income: {current_net_income} / {previous_net_income}")
+
+    return result
+
 def get_financial_metrics_from_fmp(ticker: str) -> dict:
     """
     FMP API의 Income Statement를 통해 재무지표를 가져옵니다.
@@ -1212,80 +971,27 @@ def get_financial_metrics_from_fmp(ticker: str) -> dict:
         if resp.status_code != 200:
             return {"error": f"FMP Income Statement API request failed: {resp.status_code}"}
         
-        data = resp.json()
-        print(f"📊 FMP Income Statement data for {ticker}: {len(data)} entries found")
-        
-        if not data or not isinstance(data, list) or len(data) == 0:
-            print(f"❌ FMP Income Statement: No data found for {ticker}")
-            return {"error": f"No income statement data found for {ticker}"}
+        return _parse_fmp_income_statement(ticker, resp.json())
         
-        # 최근 2년 데이터 추출
-        current_data = data[0] if len(data) > 0 else None
-        previous_data = data[1] if len(data) > 1 else None
-        
-        def safe_float(value):
-            """안전한 float 변환"""
-            if value is None:
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        
-        def safe_percentage(numerator, denominator):
-            """안전한 퍼센트 계산"""
-            if numerator is None or denominator is None or denominator == 0:
-                return None
-            try:
-                return round((float(numerator) / float(denominator)) * 100, 2)
-            except (ValueError, TypeError, ZeroDivisionError):
-                return None
-        
-        # 현재년도 데이터
-        current_revenue = safe_float(current_data.get("revenue")) if current_data else None
-        current_operating_income = safe_float(current_data.get("operatingIncome")) if current_data else None
-        current_net_income = safe_float(current_data.get("netIncome")) if current_data else None
-        
-        # 전년도 데이터
-        previous_revenue = safe_float(previous_data.get("revenue")) if previous_data else None
-        previous_operating_income = safe_float(previous_data.get("operatingIncome")) if previous_data else None
-        previous_net_income = safe_float(previous_data.get("netIncome")) if previous_data else None
-        
-        # 영업이익률 계산
-        current_operating_margin = safe_percentage(current_operating_income, current_revenue)
-        previous_operating_margin = safe_percentage(previous_operating_income, previous_revenue)
+    except Exception as e:
+        print(f"❌ Exception in FMP Income Statement request for {ticker}: {e}")
+        return {"error": f"Error fetching financial metrics from FMP: {e}"}
+
+async def get_financial_metrics_from_fmp_async(ticker: str) -> dict:
+    """
+    get_financial_metrics_from_fmp의 비동기 버전 (공용 httpx.AsyncClient 사용, 이벤트 루프 비차단)
+    """
+    try:
+        api_key = settings.FMP_API_KEY
+        url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker}?limit=2&apikey={api_key}"
         
-        result = {
-            "ticker": ticker,
-            "current_year": current_data.get("calendarYear") if current_data else None,
-            "previous_year": previous_data.get("calendarYear") if previous_data else None,
-            "metrics": {
-                "revenue": {
-                    "current": current_revenue,
-                    "previous": previous_revenue
-                },
-                "operating_income": {
-                    "current": current_operating_income,
-                    "previous": previous_operating_income
-                },
-                "operating_margin": {
-                    "current": current_operating_margin,
-                    "previous": previous_operating_margin
-                },
-                "net_income": {
-                    "current": current_net_income,
-                    "previous": previous_net_income
-                }
-            }
-        }
+        resp = await get_http_client().get(url)
+        print(f"📡 FMP Income Statement response status for {ticker}: {resp.status_code}")
         
-        print(f"✅ FMP Income Statement result for {ticker}:")
-        print(f"   Revenue: {current_revenue} / {previous_revenue}")
-        print(f"   Operating Income: {current_operating_income} / {previous_operating_income}")
-        print(f"   Operating Margin: {current_operating_margin}% / {previous_operating_margin}%")
-        print(f"   Net Income: {current_net_income} / {previous_net_income}")
+        if resp.status_code != 200:
+            return {"error": f"FMP Income Statement API request failed: {resp.status_code}"}
         
-        return result
+        return _parse_fmp_income_statement(ticker, resp.json())
         
     except Exception as e:
         print(f"❌ Exception in FMP Income Statement request for {ticker}: {e}")
@@ -0,0 +1,120 @@
+"""
+기사 제목 임베딩 서비스 (paraphrase-mpnet-base-v2)
+
+모델은 model_registry에서 프로세스당 1회만 로드해 모든 클러스터링 요청이 공유합니다.
+제목 목록을 EMBEDDING_BATCH_SIZE 단위로 나눠 encode 하고 배치별 처리 시간을 기록합니다.
+동시에 encode 하는 요청 수는 EMBEDDING_MAX_CONCURRENCY로 제한합니다. (torch 스레드 과점유 방지)
+"""
+import threading
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import EMBEDDING_BATCH_LATENCY, EMBEDDING_TEXTS
+from app.core.model_registry import model_registry
+from app.services.inference_backend import embedding_backend, model_variant
+from app.services.nlp_models import TITLE_EMBEDDING, TITLE_EMBEDDING_MODEL_NAME
+
+
+class EmbeddingService:
+    """공유 SentenceTransformer로 텍스트를 배치 단위로 임베딩합니다."""
+
+    def __init__(self, model_key: str, model_name: str, batch_size: int, max_concurrency: int):
+        self.model_key = model_key
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.texts = 0
+        self.encode_seconds = 0.0
+        self.last_batch_seconds = None
+
+    def _record_batch(self, size: int, elapsed: float):
+        EMBEDDING_BATCH_LATENCY.labels(self.model_name).observe(elapsed)
+        EMBEDDING_TEXTS.labels(self.model_name).inc(size)
+        with self._stats_lock:
+            self.batches += 1
+            self.texts += size
+            self.encode_seconds += elapsed
+            self.last_batch_seconds = elapsed
+
+    def encode(self, texts: Sequence[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """텍스트 목록의 임베딩 행렬 (len(texts) x dim, float32)"""
+        model = model_registry.get(self.model_key)
+        batch_size = batch_size or self.batch_size
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        batches: List[np.ndarray] = []
+        with self._semaphore:
+            for i in range(0, len(texts), batch_size):
+                batch = texts[i:i + batch_size]
+                start = time.perf_counter()
+                batches.append(model.encode(
+                    batch,
+                    batch_size=len(batch),
+                    show_progress_bar=False,
+                    convert_to_numpy=True
+                ))
+                self._record_batch(len(batch), time.perf_counter() - start)
+        return np.concatenate(batches, axis=0)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "model": self.model_name,
+                "loaded": model_registry.is_loaded(self.model_key),
+                "batch_size": self.batch_size,
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch_ms": round(self.encode_seconds / self.batches * 1000, 2) if self.batches else 0.0,
+                "last_batch_ms": round(self.last_batch_seconds * 1000, 2) if self.last_batch_seconds is not None else None,
+                "texts_per_sec": round(self.texts / self.encode_seconds, 1) if self.encode_seconds else 0.0,
+            }
+
+
+# 프로세스 공용 제목 임베딩 서비스
+title_embedding_service = EmbeddingService(
+    TITLE_EMBEDDING,
+    model_variant(TITLE_EMBEDDING_MODEL_NAME, embedding_backend()),
+    settings.EMBEDDING_BATCH_SIZE,
+    settings.EMBEDDING_MAX_CONCURRENCY
+)
+
+
+def embed_titles(titles: Sequence[str]) -> np.ndarray:
+    return title_embedding_service.encode(titles)
+
+
+def embed_article_titles(article_ids: Sequence[int], titles: Sequence[str]) -> np.ndarray:
+    """
+    기사 제목 임베딩 (embedding_store에 있는 (id, 제목 해시)는 재사용하고 나머지만 계산해 저장)
+    저장소를 쓸 수 없으면 전체를 계산합니다.
+    """
+    from app.services.embedding_store import get_title_embedding_store, title_hashes
+
+    store = get_title_embedding_store()
+    if store is None:
+        return embed_titles(titles)
+
+    titles = list(titles)
+    hashes = title_hashes(titles)
+    store.refresh()
+    vectors, found = store.lookup(article_ids, hashes)
+    missing = np.flatnonzero(~found)
+    if len(missing) == 0:
+        return vectors
+
+    encoded = embed_titles([titles[i] for i in missing])
+    try:
+        store.append([article_ids[i] for i in missing], hashes[missing], encoded)
+    except Exception as e:
+        print(f"[WARNING] 임베딩 저장 실패 ({len(missing)}건): {e}")
+    if len(missing) == len(titles):
+        return encoded
+    vectors[missing] = encoded
+    return vectors
@@ -0,0 +1,291 @@
+"""
+기사 제목 임베딩 디스크 저장소 (memory-mapped, 모델별)
+
+(기사 id, 제목 해시)를 키로 임베딩 벡터를 저장합니다. 제목이 바뀐 기사는 해시가 달라 미스로 처리되어 다시 계산됩니다.
+추가는 세그먼트 파일 단위(append-only)로 이루어지며, 여러 프로세스가 동시에 추가해도 파일 이름이 겹치지 않습니다.
+세그먼트가 EMBEDDING_STORE_MAX_SEGMENTS개를 넘으면 추가 직후 1개로 합칩니다. (compact)
+같은 기사 id가 여러 세그먼트에 있으면 나중에 쓴 세그먼트가 우선합니다.
+
+디렉토리 구조 (<EMBEDDING_STORE_DIR>/<모델 이름>/):
+    <segment>.vectors.npy   float32/float16 (N x dim)
+    <segment>.hashes.npy    int64 제목 해시
+    <segment>.ids.npy       int64 기사 id (마지막에 기록, 이 파일이 있어야 완성된 세그먼트)
+
+사용법:
+    python -m app.services.embedding_store backfill [--batch-size 2048]
+    python -m app.services.embedding_store compact
+    python -m app.services.embedding_store info
+"""
+import argparse
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
+
+SEGMENT_SUFFIXES = ('.vectors.npy', '.hashes.npy', '.ids.npy')
+BACKFILL_BATCH_SIZE = 2048
+
+_store = None
+_store_checked = False  # 한 번 열기를 시도했으면 True (실패 결과도 캐시해 요청마다 다시 시도/로그하지 않음)
+_store_lock = threading.Lock()
+
+
+def title_hash(title: str) -> int:
+    """제목 텍스트의 64비트 해시 (int64)"""
+    digest = hashlib.blake2b(title.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def title_hashes(titles: Sequence[str]) -> np.ndarray:
+    return np.fromiter((title_hash(t) for t in titles), dtype=np.int64, count=len(titles))
+
+
+def _save_npy_atomic(path: str, array: np.ndarray):
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+class _SegmentIndex:
+    """
+    세그먼트 목록과 id 오름차순 인덱스의 스냅샷 (생성 후 변경하지 않음)
+    갱신 시 새 스냅샷을 만들어 통째로 교체하므로, 조회는 락 없이 스냅샷 1개만 읽으면 됩니다.
+    """
+    __slots__ = ('segments', 'vectors', 'segment_arrays', 'dim', 'ids', 'hashes', 'seg', 'row')
+
+    def __init__(self, segments=(), vectors=(), segment_arrays=()):
+        self.segments = tuple(segments)
+        self.vectors = tuple(vectors)
+        self.segment_arrays = tuple(segment_arrays)
+        self.dim = self.vectors[-1].shape[1] if self.vectors else None
+        if not self.segment_arrays:
+            self.ids = self.hashes = self.row = np.zeros(0, dtype=np.int64)
+            self.seg = np.zeros(0, dtype=np.int32)
+            return
+        # id 오름차순 인덱스 (id -> 세그먼트 번호, 행 번호, 제목 해시)
+        ids = np.concatenate([a[0] for a in self.segment_arrays])
+        hashes = np.concatenate([a[1] for a in self.segment_arrays])
+        seg = np.concatenate([np.full(len(a[0]), i, dtype=np.int32) for i, a in enumerate(self.segment_arrays)])
+        row = np.concatenate([np.arange(len(a[0]), dtype=np.int64) for a in self.segment_arrays])
+        # 같은 id는 나중 세그먼트 우선: 뒤집은 배열에서 첫 등장 위치를 사용
+        _, first = np.unique(ids[::-1], return_index=True)
+        keep = len(ids) - 1 - first
+        self.ids, self.hashes, self.seg, self.row = ids[keep], hashes[keep], seg[keep], row[keep]
+
+
+class EmbeddingStore:
+    """모델 1개의 제목 임베딩 세그먼트를 mmap으로 열고 (id, 제목 해시)로 조회합니다."""
+
+    def __init__(self, store_dir: str, model_name: str, dtype: str = "float32", max_segments: int = 0):
+        self.model_name = model_name
+        self.dir = os.path.join(store_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', model_name))
+        self.dtype = np.dtype(dtype)
+        self.max_segments = max_segments
+        os.makedirs(self.dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = _SegmentIndex()
+        self.refresh()
+
+    def __len__(self):
+        return len(self._index.ids)
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._index.dim
+
+    def _list_segments(self) -> List[str]:
+        return sorted(name[:-len('.ids.npy')] for name in os.listdir(self.dir) if name.endswith('.ids.npy'))
+
+    def refresh(self):
+        """다른 프로세스가 추가하거나 compact로 지운 세그먼트를 반영해 인덱스를 갱신합니다."""
+        with self._lock:
+            index = self._index
+            on_disk = self._list_segments()
+            if list(index.segments) == on_disk:
+                return
+            loaded = dict(zip(index.segments, zip(index.vectors, index.segment_arrays)))
+            segments, vectors, segment_arrays = [], [], []
+            for name in on_disk:
+                if name in loaded:
+                    seg_vectors, arrays = loaded[name]
+                else:
+                    base = os.path.join(self.dir, name)
+                    try:
+                        seg_vectors = np.load(f"{base}.vectors.npy", mmap_mode='r')
+                        arrays = (np.load(f"{base}.ids.npy"), np.load(f"{base}.hashes.npy"))
+                    except FileNotFoundError:
+                        # 다른 프로세스의 compact가 지우는 중인 세그먼트
+                        continue
+                segments.append(name)
+                vectors.append(seg_vectors)
+                segment_arrays.append(arrays)
+            self._index = _SegmentIndex(segments, vectors, segment_arrays)
+
+    def lookup(self, article_ids: Sequence[int], hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        저장된 벡터 조회
+        반환: (vectors float32 (len(ids) x dim, 미스 행은 0), found bool 배열)
+        """
+        index = self._index
+        ids = np.asarray(article_ids, dtype=np.int64)
+        found = np.zeros(len(ids), dtype=bool)
+        if index.dim is None or len(index.ids) == 0:
+            return np.zeros((len(ids), index.dim or 0), dtype=np.float32), found
+
+        pos = np.searchsorted(index.ids, ids)
+        clipped = np.minimum(pos, len(index.ids) - 1)
+        found = (pos < len(index.ids)) & (index.ids[clipped] == ids) & (index.hashes[clipped] == hashes)
+        out = np.zeros((len(ids), index.dim), dtype=np.float32)
+        segs, rows = index.seg[clipped], index.row[clipped]
+        for s in np.unique(segs[found]):
+            mask = found & (segs == s)
+            out[mask] = index.vectors[s][rows[mask]]
+        return out, found
+
+    def _write_segment(self, article_ids, hashes, vectors):
+        """vectors -> hashes -> ids 순으로 기록 (ids 파일이 생기면 완성된 세그먼트)"""
+        name = f"{time.time_ns():020d}_{os.getpid()}"
+        base = os.path.join(self.dir, name)
+        _save_npy_atomic(f"{base}.vectors.npy", np.asarray(vectors, dtype=self.dtype))
+        _save_npy_atomic(f"{base}.hashes.npy", np.asarray(hashes, dtype=np.int64))
+        _save_npy_atomic(f"{base}.ids.npy", np.asarray(article_ids, dtype=np.int64))
+
+    def append(self, article_ids: Sequence[int], hashes: np.ndarray, vectors: np.ndarray):
+        """
+        새 세그먼트 1개로 추가합니다.
+        세그먼트가 max_segments를 넘으면 이어서 compact해 조회/인덱스 재구성 비용이 계속 늘지 않게 합니다.
+        """
+        if len(article_ids) == 0:
+            return
+        self._write_segment(article_ids, hashes, vectors)
+        self.refresh()
+        if self.max_segments and len(self._index.segments) > self.max_segments:
+            self.compact()
+
+    def compact(self) -> int:
+        """모든 세그먼트를 최신 벡터만 남긴 세그먼트 1개로 합칩니다. 반환: 저장된 벡터 수"""
+        self.refresh()
+        index = self._index
+        if len(index.segments) <= 1:
+            return len(index.ids)
+
+        vectors = np.empty((len(index.ids), index.dim or 0), dtype=self.dtype)
+        for s in np.unique(index.seg):
+            mask = index.seg == s
+            vectors[mask] = index.vectors[s][index.row[mask]]
+        self._write_segment(index.ids, index.hashes, vectors)
+        for name in index.segments:
+            for suffix in reversed(SEGMENT_SUFFIXES):
+                try:
+                    os.remove(os.path.join(self.dir, name + suffix))
+                except FileNotFoundError:
+                    # 다른 프로세스가 동시에 compact한 경우
+                    pass
+        self.refresh()
+        return len(index.ids)
+
+    def info(self) -> dict:
+        index = self._index
+        return {
+            "model": self.model_name,
+            "dir": self.dir,
+            "dtype": self.dtype.name,
+            "dim": index.dim,
+            "vectors": len(index.ids),
+            "segments": len(index.segments),
+            "max_segments": self.max_segments,
+        }
+
+
+def get_title_embedding_store() -> Optional[EmbeddingStore]:
+    """
+    제목 임베딩 모델의 프로세스 공용 저장소 (EMBEDDING_STORE_ENABLED=False거나 열 수 없으면 None)
+    여는 것은 프로세스당 1회만 시도합니다. (읽기 전용 디렉토리 등으로 실패하면 재시작 전까지 매번 계산)
+    """
+    global _store, _store_checked
+    if _store_checked or not settings.EMBEDDING_STORE_ENABLED:
+        return _store
+    from app.services.inference_backend import embedding_backend, model_variant
+    from app.services.nlp_models import TITLE_EMBEDDING_MODEL_NAME
+
+    with _store_lock:
+        if not _store_checked:
+            store_dir = settings.EMBEDDING_STORE_DIR or os.path.join(settings.cache_dir, "embeddings")
+            try:
+                # int8 백엔드 벡터는 fp32와 섞이지 않도록 별도 디렉토리 사용
+                model_name = model_variant(TITLE_EMBEDDING_MODEL_NAME, embedding_backend())
+                _store = EmbeddingStore(store_dir, model_name, settings.EMBEDDING_STORE_DTYPE,
+                                        settings.EMBEDDING_STORE_MAX_SEGMENTS)
+            except Exception as e:
+                print(f"[WARNING] 임베딩 저장소를 열 수 없습니다 (매번 계산): {e}")
+            _store_checked = True
+    return _store
+
+
+def backfill_title_embeddings(batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    전체 기사 제목 중 저장소에 없는(또는 제목이 바뀐) 것만 임베딩해 저장합니다.
+    반환: 새로 계산한 제목 수
+    """
+    from app.services.embedding_service import title_embedding_service
+
+    store = get_title_embedding_store()
+    if store is None:
+        print("[ERROR] 임베딩 저장소가 비활성화되어 있습니다. (EMBEDDING_STORE_ENABLED)")
+        return 0
+
+    print(f"[INFO] 제목 임베딩 백필 시작: {store.info()}")
+    start = time.time()
+    scanned = encoded = 0
+    with get_sqlalchemy_engine().connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(text("""
+            SELECT id, article_title FROM kb_enterprise_dataset
+            WHERE article_title IS NOT NULL AND article_title != ''
+              AND article IS NOT NULL AND article != ''
+            ORDER BY id
+        """))
+        for rows in result.partitions():
+            scanned += len(rows)
+            ids = [row[0] for row in rows]
+            titles = [row[1].strip() for row in rows]
+            hashes = title_hashes(titles)
+            _, found = store.lookup(ids, hashes)
+            missing = np.flatnonzero(~found)
+            if len(missing):
+                vectors = title_embedding_service.encode([titles[i] for i in missing])
+                store.append([ids[i] for i in missing], hashes[missing], vectors)
+                encoded += len(missing)
+            elapsed = time.time() - start
+            print(f"[INFO] {scanned:,}건 확인, {encoded:,}건 계산 ({encoded / elapsed:.1f} titles/sec)")
+
+    print(f"[INFO] 제목 임베딩 백필 완료: {encoded:,}건 계산, {time.time() - start:.1f}s")
+    store.compact()
+    return encoded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 제목 임베딩 저장소 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill_parser = subparsers.add_parser("backfill", help="저장되지 않은 제목 임베딩 계산")
+    backfill_parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    subparsers.add_parser("compact", help="세그먼트를 하나로 합치기")
+    subparsers.add_parser("info", help="저장소 정보 출력")
+
+    args = parser.parse_args()
+    if args.command == "backfill":
+        backfill_title_embeddings(args.batch_size)
+    elif args.command == "compact":
+        store = get_title_embedding_store()
+        print(f"[INFO] compact 완료: {store.compact()}개 벡터" if store else "[ERROR] 임베딩 저장소 비활성화")
+    elif args.command == "info":
+        store = get_title_embedding_store()
+        print(store.info() if store else "[ERROR] 임베딩 저장소 비활성화")
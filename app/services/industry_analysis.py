@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List
 from app.core.config import settings
 from app.db.connection import get_sqlalchemy_engine
+from app.services.price_repository import dates_to_strings, get_price_series, get_prices, slice_series
 import pandas_datareader.data as web
 from sqlalchemy import text
 
@@ -30,66 +31,44 @@ def get_sector_companies_from_db(sector: str) -> List[str]:
         print(f"Error fetching companies for sector {sector}: {e}")
         return []
 
-def get_stock_table_name(ticker: str) -> str:
-    """
-    ticker의 첫 글자에 따라 적절한 stock price 테이블명을 반환합니다.
-    """
-    first_char = ticker[0].lower()
-    if 'a' <= first_char <= 'd':
-        return 'fnspid_stock_price_a'
-    elif 'e' <= first_char <= 'm':
-        return 'fnspid_stock_price_b'
-    else:  # n-z
-        return 'fnspid_stock_price_c'
+def _nan_to_none(value):
+    value = float(value)
+    return None if value != value else value
 
-def get_stock_data_from_db(ticker: str, end_date: str, days_back: int = 400) -> Dict:
+def get_stock_data_from_db(ticker: str, end_date: str, days_back: int = 400, prices: Dict = None) -> Dict:
     """
     DB에서 특정 ticker의 주가 데이터를 가져옵니다.
+    prices: get_prices()로 미리 일괄 조회한 결과. 주어지면 DB 조회 없이 구간만 잘라서 사용합니다.
     """
-    engine = get_sqlalchemy_engine()
     try:
-        with engine.connect() as conn:
-            table_name = get_stock_table_name(ticker)
-            
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            start_dt = end_dt - timedelta(days=days_back)
-            start_date_str = start_dt.strftime('%Y-%m-%d')
-            
-            # SQLAlchemy 2.x 호환성을 위해 text()와 이름 기반 파라미터 사용
-            query = text(f"""
-                SELECT date, open, high, low, close, adj_close, volume
-                FROM {table_name}
-                WHERE stock_symbol = :ticker 
-                AND date BETWEEN :start_date AND :end_date
-                ORDER BY date ASC;
-            """)
-            
-            params = {
-                "ticker": ticker,
-                "start_date": start_date_str,
-                "end_date": end_date
-            }
-            
-            result = conn.execute(query, params)
-            rows = result.fetchall()
-            
-            if not rows:
-                return {"error": f"No data found for {ticker}"}
-            
-            data = []
-            for row in rows:
-                # row 객체는 이제 이름으로 컬럼 접근이 가능합니다.
-                data.append({
-                    'date': row.date.strftime('%Y-%m-%d') if row.date else None,
-                    'open': float(row.open) if row.open is not None else None,
-                    'high': float(row.high) if row.high is not None else None,
-                    'low': float(row.low) if row.low is not None else None,
-                    'close': float(row.close) if row.close is not None else None,
-                    'adj close': float(row.adj_close) if row.adj_close is not None else None,
-                    'volume': int(row.volume) if row.volume is not None else None
-                })
-            
-            return {"data": data}
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        start_dt = end_dt - timedelta(days=days_back)
+        start_date_str = start_dt.strftime('%Y-%m-%d')
+        
+        if prices is not None:
+            series = prices.get(ticker)
+            if series is not None:
+                series = slice_series(series, start_date_str, end_date)
+        else:
+            series = get_price_series(ticker, start_date_str, end_date)
+        
+        if series is None or len(series['dates']) == 0:
+            return {"error": f"No data found for {ticker}"}
+        
+        data = []
+        for i, date_str in enumerate(dates_to_strings(series['dates'])):
+            volume = series['volume'][i]
+            data.append({
+                'date': date_str,
+                'open': _nan_to_none(series['open'][i]),
+                'high': _nan_to_none(series['high'][i]),
+                'low': _nan_to_none(series['low'][i]),
+                'close': _nan_to_none(series['close'][i]),
+                'adj close': _nan_to_none(series['adj_close'][i]),
+                'volume': int(volume) if volume == volume else None
+            })
+        
+        return {"data": data}
             
     except Exception as e:
         print(f"Error fetching stock data for {ticker}: {e}")
@@ -291,6 +270,14 @@ def get_industry_top10_companies(sector: str, end_date: str) -> Dict:
         if not company_tickers:
             return {"error": f"No predefined companies found for sector: {sector}"}
         
+        # 전체 기업의 400일치 주가를 파티션 테이블별 1회씩(최대 3회) 일괄 조회
+        prefetch_start = (datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=400)).strftime('%Y-%m-%d')
+        try:
+            prices = get_prices(company_tickers, prefetch_start, end_date)
+        except Exception as e:
+            print(f"⚠️  Batch price fetch failed, falling back to per-ticker queries: {e}")
+            prices = None
+        
         companies_data = []
         successful_count = 0
         failed_count = 0
@@ -300,7 +287,7 @@ def get_industry_top10_companies(sector: str, end_date: str) -> Dict:
                 print(f"📊 Processing {i+1}/{len(company_tickers)}: {ticker} (using DB)")
                 
                 # 기본 정보 (시가총액, 현재가 등) - DB에서 가져오기
-                enhanced_info = get_enhanced_stock_info_from_db(ticker, end_date)
+                enhanced_info = get_enhanced_stock_info_from_db(ticker, end_date, prices)
                 if "error" in enhanced_info:
                     print(f"⚠️  Enhanced info failed for {ticker}: {enhanced_info['error']}")
                     failed_count += 1
@@ -313,7 +300,7 @@ def get_industry_top10_companies(sector: str, end_date: str) -> Dict:
                     continue
                 
                 # 수익률 계산 - DB에서 가져오기
-                returns = get_stock_returns_from_db(ticker, end_date)
+                returns = get_stock_returns_from_db(ticker, end_date, prices)
                 
                 # 밸류에이션 지표 - 여전히 FMP API 사용
                 valuation = get_valuation_metrics_from_fmp(ticker)
@@ -356,12 +343,12 @@ def get_industry_top10_companies(sector: str, end_date: str) -> Dict:
         print(f"💥 Critical error in get_industry_top10_companies: {e}")
         return {"error": f"Error processing industry analysis: {str(e)}"}
 
-def get_stock_returns_from_db(ticker: str, end_date: str) -> Dict:
+def get_stock_returns_from_db(ticker: str, end_date: str, prices: Dict = None) -> Dict:
     """
     DB에서 특정 기간별 수익률을 계산합니다.
     """
     try:
-        stock_data = get_stock_data_from_db(ticker, end_date, 400)
+        stock_data = get_stock_data_from_db(ticker, end_date, 400, prices)
         
         if "error" in stock_data:
             print(f"No data found for {ticker}")
@@ -437,13 +424,13 @@ def get_stock_returns_from_db(ticker: str, end_date: str) -> Dict:
         print(f"Error calculating returns for {ticker}: {e}")
         return {"1week": None, "1month": None, "1year": None}
 
-def get_enhanced_stock_info_from_db(ticker: str, end_date: str) -> Dict:
+def get_enhanced_stock_info_from_db(ticker: str, end_date: str, prices: Dict = None) -> Dict:
     """
     DB에서 특정 종료일 기준으로 주식 정보를 가져옵니다.
     """
     try:
         # DB에서 현재가 가져오기
-        stock_data = get_stock_data_from_db(ticker, end_date, 30)
+        stock_data = get_stock_data_from_db(ticker, end_date, 30, prices)
         
         if "error" in stock_data:
             return {"error": f"No historical data found for {ticker}"}
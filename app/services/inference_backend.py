@@ -0,0 +1,74 @@
+"""
+CPU 추론 백엔드 (설정으로 선택)
+
+- SUMMARIZER_BACKEND: torch(fp32) | int8(torch dynamic int8 양자화) | onnx(ONNX Runtime, optimum 필요)
+- EMBEDDING_BACKEND:  torch(fp32) | int8(torch dynamic int8 양자화)
+  (sentence-transformers 2.6은 ONNX 백엔드가 없고, nomic-bert는 trust_remote_code 모델이라 ONNX 내보내기를 지원하지 않음)
+
+fp32가 아닌 백엔드는 결과가 조금 달라지므로 모델 이름에 "@int8", "@onnx"를 붙인 이름(model_variant)을
+임베딩 저장소 디렉토리, 구문 임베딩 캐시, 요약 캐시 키에 사용해 fp32 결과와 섞이지 않게 합니다.
+정확도 차이/속도는 benchmarks/inference_backend_benchmark.py로 확인합니다.
+
+ONNX 백엔드 설치:
+    pip install "optimum[onnxruntime]"
+"""
+import os
+
+from app.core.config import settings
+
+SUMMARIZER_BACKENDS = ("torch", "int8", "onnx")
+EMBEDDING_BACKENDS = ("torch", "int8")
+
+
+def _checked(backend: str, allowed, setting_name: str) -> str:
+    backend = (backend or "torch").lower()
+    if backend not in allowed:
+        print(f"[WARNING] 지원하지 않는 {setting_name} 값: {backend} (torch 사용)")
+        return "torch"
+    return backend
+
+
+def summarizer_backend() -> str:
+    return _checked(settings.SUMMARIZER_BACKEND, SUMMARIZER_BACKENDS, "SUMMARIZER_BACKEND")
+
+
+def embedding_backend() -> str:
+    return _checked(settings.EMBEDDING_BACKEND, EMBEDDING_BACKENDS, "EMBEDDING_BACKEND")
+
+
+def model_variant(model_name: str, backend: str) -> str:
+    """백엔드별 모델 식별자 (fp32 torch는 원래 이름 그대로)"""
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def quantize_int8(model):
+    """nn.Linear 가중치를 int8로 동적 양자화 (CPU 전용, 활성값은 실행 시 양자화)"""
+    import torch
+    model.eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def onnx_export_dir(model_name: str) -> str:
+    base = settings.ONNX_EXPORT_DIR or os.path.join(settings.cache_dir, "onnx")
+    return os.path.join(base, model_name.replace("/", "__"))
+
+
+def load_onnx_seq2seq(model_name: str, cache_dir: str = None):
+    """
+    seq2seq 모델을 ONNX Runtime으로 로드합니다.
+    처음에는 export 후 ONNX_EXPORT_DIR에 저장하고, 이후에는 저장된 ONNX 파일을 바로 사용합니다.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError("SUMMARIZER_BACKEND=onnx 에는 optimum[onnxruntime] 설치가 필요합니다.") from e
+
+    export_dir = onnx_export_dir(model_name)
+    if os.path.exists(os.path.join(export_dir, "config.json")):
+        return ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+
+    print(f"[INFO] ONNX export 시작: {model_name} -> {export_dir}")
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, cache_dir=cache_dir)
+    os.makedirs(export_dir, exist_ok=True)
+    model.save_pretrained(export_dir)
+    return model
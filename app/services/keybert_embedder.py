@@ -0,0 +1,56 @@
+"""
+KeyBERT용 임베딩 백엔드: 짧은 후보 구문은 phrase_embedding_cache를 거쳐 임베딩합니다.
+
+KeyBERT 0.7은 BaseEmbedder 인스턴스를 그대로 백엔드로 사용하므로,
+SentenceTransformer를 이 클래스로 감싸 KeyBERT(model=...)에 넘깁니다. (nlp_models._load_keybert)
+문서(기사/청크)는 길이가 길어 재사용되지 않으므로 캐시하지 않습니다.
+"""
+from typing import List
+
+import numpy as np
+from keybert.backend import BaseEmbedder
+
+from app.services.phrase_embedding_cache import PhraseEmbeddingCache, phrase_embedding_cache
+
+# 캐시 대상 최대 단어 수 (extract_keywords의 keyphrase_ngram_range 상한)
+PHRASE_MAX_WORDS = 3
+
+
+class CachingSentenceEmbedder(BaseEmbedder):
+    def __init__(self, embedding_model, model_name: str, cache: PhraseEmbeddingCache = phrase_embedding_cache,
+                 max_phrase_words: int = PHRASE_MAX_WORDS):
+        super().__init__()
+        self.embedding_model = embedding_model
+        self.model_name = model_name
+        self.cache = cache
+        self.max_phrase_words = max_phrase_words
+
+    def _encode(self, texts: List[str], verbose: bool) -> np.ndarray:
+        return self.embedding_model.encode(texts, show_progress_bar=verbose, convert_to_numpy=True)
+
+    def embed(self, documents: List[str], verbose: bool = False) -> np.ndarray:
+        documents = list(documents)
+        phrases = {doc for doc in documents if len(doc.split()) <= self.max_phrase_words}
+        cached = self.cache.get_many(self.model_name, phrases) if phrases else {}
+        if not cached:
+            embeddings = self._encode(documents, verbose)
+            if phrases:
+                self.cache.put_many(self.model_name, {
+                    doc: embeddings[i] for i, doc in enumerate(documents) if doc in phrases
+                })
+            return embeddings
+
+        # 캐시에 없는 텍스트만 한 번에 임베딩한 뒤 원래 순서로 합침
+        missing = [i for i, doc in enumerate(documents) if doc not in cached]
+        encoded = self._encode([documents[i] for i in missing], verbose) if missing else None
+        dim = encoded.shape[1] if encoded is not None else next(iter(cached.values())).shape[0]
+        embeddings = np.empty((len(documents), dim), dtype=np.float32)
+        for i, doc in enumerate(documents):
+            if doc in cached:
+                embeddings[i] = cached[doc]
+        if missing:
+            embeddings[missing] = encoded
+            self.cache.put_many(self.model_name, {
+                documents[i]: encoded[j] for j, i in enumerate(missing) if documents[i] in phrases
+            })
+        return embeddings
@@ -1,84 +1,29 @@
-import os
-import string
 from app.db.connection import get_sqlalchemy_engine
 from app.services.sentiment import get_weekly_sentiment_scores_by_stock_symbol
-from sentence_transformers import SentenceTransformer
-import spacy
-from keybert import KeyBERT
-from transformers import AutoTokenizer
+from app.services.nlp_models import get_keybert
+from app.services.article_analysis import analyze_article, analyze_articles
 from sqlalchemy import text
 
-CACHE_DIR = os.getenv("HF_HOME")
-
-'''
-[유의사항]
-아래 spaCy 내부에 필요한 추가 리소스는 별도의 다운로드가 필요함
-`python -m spacy download en_core_web_sm`
-'''
-
-try:
-    # 1. 키워드 추출용 임베딩 모델 로드
-    embedding_model_name = "nomic-ai/nomic-bert-2048"
-    sentence_model = SentenceTransformer(
-        embedding_model_name,
-        cache_folder=CACHE_DIR,
-        trust_remote_code=True
-    )
-    kw_model = KeyBERT(sentence_model)
-
-    # 2. BART 토크나이저 로드 (요약 모델용)
-    # force_download=True 옵션을 제거하여 캐시를 사용하도록 합니다.
-    bart_tokenizer_name = "facebook/bart-large-cnn"
-    bart_tokenizer = AutoTokenizer.from_pretrained(
-        bart_tokenizer_name,
-        cache_dir=CACHE_DIR
-    )
-
-    # 3. spaCy 모델 로드
-    nlp = spacy.load("en_core_web_sm")
-
-except Exception as e:
-    print(f"모델 로딩 중 오류 발생: {e}")
-    # 모델 로딩 실패 시, 이후 코드 실행을 막기 위해 예외를 다시 발생시키거나
-    # 적절한 기본값으로 초기화해야 합니다.
-    kw_model = None
-    bart_tokenizer = None
-    nlp = None
-    raise e
+# 임베딩 모델(nomic-bert-2048), KeyBERT, spaCy는 nlp_models의 레지스트리에서 처음 사용할 때 로드됩니다.
+# 기사별 spaCy 파싱은 article_analysis에서 1회만 수행하고 문장/개체명/표제어를 모두 재사용합니다.
 
 MAX_TOKENS = 500
 CHUNK_OVERLAP = 50
 
+KEYBERT_PARAMS = {
+    "keyphrase_ngram_range": (1, 3),
+    "stop_words": 'english',
+    "use_mmr": True,
+    "diversity": 0.5,
+    "nr_candidates": 60,
+}
+
 def remove_last_sentences(text, n=3):
-    if not nlp: return text
-    sentences = [sent.text for sent in nlp(text).sents]
+    sentences = analyze_article(text).sentences
     return ' '.join(sentences[:-n]) if len(sentences) > n else text
 
 def extract_named_entities(text):
-    if not nlp: return set(), set()
-    doc = nlp(text)
-    original, lowered = set(), set()
-    for ent in doc.ents:
-        if ent.label_ in {"PERSON", "ORG", "GPE", "LOC", "FAC", "PRODUCT"}:
-            orig = ent.text.strip()
-            original.add(orig)
-            lowered.add(orig.lower())
-    return original, lowered
-
-def preprocess(text, original_ents):
-    if not nlp: return ""
-    keep = {'$', '%', "'", '(', ')', '-'}
-    remove = ''.join([p for p in string.punctuation if p not in keep])
-    text = text.lower().translate(str.maketrans('', '', remove))
-    doc = nlp(text)
-    tokens = []
-    for token in doc:
-        if token.text in original_ents:
-            tokens.append(token.text)
-        elif token.is_alpha or '-' in token.text:
-            tokens.append(token.lemma_)
-    return ' '.join(tokens)
-
+    return analyze_article(text).entities
 
 def restore_named_entities(keywords, original_ents, lowered_ents):
     restored = []
@@ -92,55 +37,72 @@ def restore_named_entities(keywords, original_ents, lowered_ents):
         restored.append((' '.join(new_words), score))
     return restored
 
+def _average_chunk_keywords(keywords_all, top_n):
+    keywords_dict = {}
+    for kw, score in keywords_all:
+        if kw in keywords_dict:
+            keywords_dict[kw].append(score)
+        else:
+            keywords_dict[kw] = [score]
+
+    return sorted(
+        [(kw, sum(scores)/len(scores)) for kw, scores in keywords_dict.items()],
+        key=lambda x: x[1],
+        reverse=True
+    )[:top_n]
+
 def extract_keywords(text, model, top_n=10, threshold=0.4):
     if not model: return []
-    cleaned = remove_last_sentences(text)
-    original_ents, lowered_ents = extract_named_entities(cleaned)
-    processed = preprocess(cleaned, original_ents)
-    tokens = processed.split()
-
-    if len(tokens) <= MAX_TOKENS:
-        keywords = model.extract_keywords(
-            processed,
-            keyphrase_ngram_range=(1, 3),
-            stop_words='english',
-            top_n=top_n,
-            use_mmr=True,
-            diversity=0.5,
-            nr_candidates=60
-        )
-        keywords = restore_named_entities(keywords, original_ents, lowered_ents)
-    else:
-        keywords_all = []
-        chunks = chunk_text(tokens, max_len=MAX_TOKENS, overlap=CHUNK_OVERLAP)
-        for chunk_tokens in chunks:
-            chunk_text_str = ' '.join(chunk_tokens)
-            kws = model.extract_keywords(
-                chunk_text_str,
-                keyphrase_ngram_range=(1, 3),
-                stop_words='english',
-                top_n=top_n,
-                use_mmr=True,
-                diversity=0.5,
-                nr_candidates=60
-            )
-            kws = restore_named_entities(kws, original_ents, lowered_ents)
-            keywords_all.extend(kws)
-        
-        keywords_dict = {}
-        for kw, score in keywords_all:
-            if kw in keywords_dict:
-                keywords_dict[kw].append(score)
-            else:
-                keywords_dict[kw] = [score]
-        
-        keywords = sorted(
-            [(kw, sum(scores)/len(scores)) for kw, scores in keywords_dict.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:top_n]
-
-    return keywords
+    return extract_keywords_batch([text], model, top_n, threshold)[0]
+
+def extract_keywords_batch(texts, model, top_n=10, threshold=0.4, analyses=None):
+    """
+    여러 기사의 키워드를 한 번에 추출합니다.
+    기사별 spaCy 분석(analyses, 없으면 nlp.pipe로 생성)의 표제어 문자열을 사용하고,
+    MAX_TOKENS를 넘는 기사의 청크까지 포함한 모든 문서를 KeyBERT 호출 한 번으로 처리합니다.
+    긴 기사는 청크별 키워드 점수를 평균해 상위 top_n개를 반환합니다.
+    """
+    texts = list(texts)
+    if not model or not texts:
+        return [[] for _ in texts]
+    if analyses is None:
+        analyses = analyze_articles(texts)
+    processed = [analysis.processed for analysis in analyses]
+    entities = [analysis.cleaned_entities for analysis in analyses]
+
+    # KeyBERT에 넘길 문서 목록 (기사 번호별 문서 위치)
+    docs, owners = [], []
+    for i, doc_text in enumerate(processed):
+        tokens = doc_text.split()
+        if not tokens:
+            continue
+        if len(tokens) <= MAX_TOKENS:
+            docs.append(doc_text)
+            owners.append(i)
+        else:
+            for chunk_tokens in chunk_text(tokens, max_len=MAX_TOKENS, overlap=CHUNK_OVERLAP):
+                docs.append(' '.join(chunk_tokens))
+                owners.append(i)
+
+    if not docs:
+        return [[] for _ in texts]
+    doc_keywords = model.extract_keywords(docs, top_n=top_n, **KEYBERT_PARAMS)
+    # KeyBERT는 문서가 1개면 리스트를 한 겹 벗겨서 반환
+    if len(docs) == 1:
+        doc_keywords = [doc_keywords]
+
+    per_article = [[] for _ in texts]
+    for owner, kws in zip(owners, doc_keywords):
+        original_ents, lowered_ents = entities[owner]
+        per_article[owner].append(restore_named_entities(kws, original_ents, lowered_ents))
+
+    results = []
+    for chunks in per_article:
+        if len(chunks) <= 1:
+            results.append(chunks[0] if chunks else [])
+        else:
+            results.append(_average_chunk_keywords([kw for kws in chunks for kw in kws], top_n))
+    return results
 
 
 def chunk_text(tokens, max_len=400, overlap=50):
@@ -186,10 +148,15 @@ def keyword_extract_from_articles(stock_symbol, start_date, end_date):
         print("[오류] 해당 조건에 top3 기사가 없습니다.")
         return {}
 
+    # 모든 주차의 기사를 한 번에 분석 (nlp.pipe, SPACY_N_PROCESS)
+    all_articles = [item['article'] for top3_articles in weekly_top3.values() for item in top3_articles]
+    all_keywords = iter(extract_keywords_batch(all_articles, get_keybert()))
+
     weekly_keywords = {}
     for week, top3_articles in weekly_top3.items():
         article_results = []
         for item in top3_articles:
+            keywords = next(all_keywords)
             # item은 dict 형태: {'article': ..., 'date': ..., 'weekstart': ..., 'score': ..., 'pos_cnt': ..., 'neg_cnt': ..., 'article_title': ...}
             article = item['article']
             date = item['date']
@@ -198,8 +165,7 @@ def keyword_extract_from_articles(stock_symbol, start_date, end_date):
             pos_cnt = item['pos_cnt']
             neg_cnt = item['neg_cnt']
             article_title = item.get('article_title', None)
-            
-            keywords = extract_keywords(article, kw_model)
+
             article_results.append({
                 'article': article,
                 'date': date.strftime('%Y-%m-%d') if hasattr(date, 'strftime') else str(date),
@@ -0,0 +1,161 @@
+"""
+키워드 추출/요약에 쓰는 NLP 모델 정의 (model_registry에 등록, 처음 사용할 때 로드)
+
+무거운 라이브러리(torch, transformers, sentence_transformers, keybert, spacy)도
+로더 안에서 import 하므로 이 모듈을 import 해도 모델이나 라이브러리가 로드되지 않습니다.
+
+[유의사항]
+spaCy 모델은 별도 다운로드가 필요함
+`python -m spacy download en_core_web_sm`
+"""
+import os
+import threading
+
+from app.core.config import settings
+from app.core.model_registry import model_registry
+from app.services.inference_backend import (
+    embedding_backend,
+    load_onnx_seq2seq,
+    model_variant,
+    quantize_int8,
+    summarizer_backend,
+)
+
+CACHE_DIR = os.getenv("HF_HOME")
+
+KEYWORD_EMBEDDING_MODEL_NAME = "nomic-ai/nomic-bert-2048"
+TITLE_EMBEDDING_MODEL_NAME = "paraphrase-mpnet-base-v2"
+BART_MODEL_NAME = "facebook/bart-large-cnn"
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+# 레지스트리 모델 이름
+KEYWORD_EMBEDDING = "keyword_embedding"
+TITLE_EMBEDDING = "title_embedding"
+KEYBERT = "keybert"
+BART_TOKENIZER = "bart_tokenizer"
+BART_SUMMARIZER = "bart_summarizer"
+SPACY_EN = "spacy_en"
+
+_torch_threads_lock = threading.Lock()
+_torch_threads_pinned = False
+
+
+def pin_torch_threads():
+    """
+    torch intra-op 스레드 수를 TORCH_NUM_THREADS로 고정합니다. (프로세스 전역, 1회)
+    동시 요청마다 코어 수만큼 스레드를 쓰며 CPU를 과점유하지 않도록 합니다. 0이면 torch 기본값 유지
+    """
+    global _torch_threads_pinned
+    if _torch_threads_pinned or settings.TORCH_NUM_THREADS <= 0:
+        return
+    with _torch_threads_lock:
+        if not _torch_threads_pinned:
+            import torch
+            torch.set_num_threads(settings.TORCH_NUM_THREADS)
+            _torch_threads_pinned = True
+
+
+def load_keyword_embedding(backend: str = "torch"):
+    from sentence_transformers import SentenceTransformer
+    pin_torch_threads()
+    model = SentenceTransformer(
+        KEYWORD_EMBEDDING_MODEL_NAME,
+        cache_folder=CACHE_DIR,
+        trust_remote_code=True,
+        device="cpu" if backend == "int8" else None
+    )
+    return quantize_int8(model) if backend == "int8" else model
+
+
+def load_title_embedding(backend: str = "torch"):
+    from sentence_transformers import SentenceTransformer
+    pin_torch_threads()
+    model = SentenceTransformer(
+        TITLE_EMBEDDING_MODEL_NAME,
+        cache_folder=CACHE_DIR,
+        device="cpu" if backend == "int8" else None
+    )
+    return quantize_int8(model) if backend == "int8" else model
+
+
+def _load_keybert():
+    from keybert import KeyBERT
+    embedding_model = model_registry.get(KEYWORD_EMBEDDING)
+    if settings.KEYWORD_PHRASE_CACHE_ENABLED:
+        # 후보 구문 임베딩은 phrase_embedding_cache에서 재사용
+        from app.services.keybert_embedder import CachingSentenceEmbedder
+        embedding_model = CachingSentenceEmbedder(
+            embedding_model, model_variant(KEYWORD_EMBEDDING_MODEL_NAME, embedding_backend())
+        )
+    return KeyBERT(embedding_model)
+
+
+def _load_bart_tokenizer():
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(BART_MODEL_NAME, cache_dir=CACHE_DIR)
+
+
+def load_bart_summarizer(backend: str = "torch"):
+    """
+    BART 요약 파이프라인
+    torch: fp32 (GPU가 있으면 GPU), int8: CPU dynamic int8 양자화, onnx: ONNX Runtime (CPU)
+    """
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, pipeline
+    pin_torch_threads()
+    tokenizer = model_registry.get(BART_TOKENIZER)
+    if backend == "onnx":
+        model = load_onnx_seq2seq(BART_MODEL_NAME, cache_dir=CACHE_DIR)
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+    if backend == "int8":
+        model = quantize_int8(AutoModelForSeq2SeqLM.from_pretrained(BART_MODEL_NAME, cache_dir=CACHE_DIR))
+        return pipeline("summarization", model=model, tokenizer=tokenizer, device=-1)
+
+    device = 0 if torch.cuda.is_available() else -1
+    return pipeline(
+        "summarization",
+        model=BART_MODEL_NAME,
+        tokenizer=tokenizer,
+        device=device
+    )
+
+
+def _load_keyword_embedding():
+    return load_keyword_embedding(embedding_backend())
+
+
+def _load_title_embedding():
+    return load_title_embedding(embedding_backend())
+
+
+def _load_bart_summarizer():
+    return load_bart_summarizer(summarizer_backend())
+
+
+def _load_spacy():
+    import spacy
+    return spacy.load(SPACY_MODEL_NAME)
+
+
+model_registry.register(KEYWORD_EMBEDDING, _load_keyword_embedding)
+model_registry.register(TITLE_EMBEDDING, _load_title_embedding)
+model_registry.register(KEYBERT, _load_keybert)
+model_registry.register(BART_TOKENIZER, _load_bart_tokenizer)
+model_registry.register(BART_SUMMARIZER, _load_bart_summarizer)
+model_registry.register(SPACY_EN, _load_spacy)
+
+
+def get_keybert():
+    return model_registry.get(KEYBERT)
+
+
+def get_bart_tokenizer():
+    return model_registry.get(BART_TOKENIZER)
+
+
+def get_summarizer():
+    return model_registry.get(BART_SUMMARIZER)
+
+
+def get_spacy():
+    return model_registry.get(SPACY_EN)
@@ -0,0 +1,75 @@
+"""
+KeyBERT 후보 구문 임베딩 인메모리 캐시 (LRU, 프로세스 공용)
+
+KeyBERT는 기사마다 n-gram 후보 구문을 모두 임베딩합니다. "net income", "federal reserve"처럼
+여러 기사에 반복되는 구문은 (모델, 구문)별로 한 번만 임베딩하고 이후에는 캐시된 벡터를 사용합니다.
+KeyBERT에는 keybert_embedder.CachingSentenceEmbedder로 연결됩니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+
+class PhraseEmbeddingCache:
+    """(모델 이름, 구문) -> 임베딩 벡터(float32)를 보관하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_phrases: int):
+        self.max_phrases = max_phrases
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, model_name: str, phrases: Iterable[str]) -> Dict[str, np.ndarray]:
+        """캐시된 구문만 {구문: 벡터}로 반환합니다."""
+        found = {}
+        with self._lock:
+            for phrase in phrases:
+                key = (model_name, phrase)
+                vector = self._entries.get(key)
+                if vector is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[phrase] = vector
+        return found
+
+    def put_many(self, model_name: str, vectors: Dict[str, np.ndarray]):
+        """{구문: 벡터} 저장 (max_phrases를 넘으면 LRU 순서로 제거)"""
+        with self._lock:
+            for phrase, vector in vectors.items():
+                key = (model_name, phrase)
+                self._entries[key] = np.asarray(vector, dtype=np.float32)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_phrases:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            nbytes = sum(vector.nbytes for vector in self._entries.values())
+            return {
+                "enabled": settings.KEYWORD_PHRASE_CACHE_ENABLED,
+                "phrases": len(self._entries),
+                "max_phrases": self.max_phrases,
+                "memory_mb": round(nbytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 공용 캐시 인스턴스
+phrase_embedding_cache = PhraseEmbeddingCache(settings.KEYWORD_PHRASE_CACHE_MAX_PHRASES)
@@ -1,25 +1,18 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from app.core.config import settings
 from typing import List, Dict, Optional
 import logging
 from collections import defaultdict
 from openai import OpenAI
+from app.db.connection import get_sqlalchemy_engine
 
 
 logger = logging.getLogger(__name__)
 
 def get_database_connection():
-    """데이터베이스 연결 - Cloud SQL 지원"""
+    """데이터베이스 연결 - 프로세스 공용 엔진 사용 (Cloud SQL 지원)"""
     try:
-        if hasattr(settings, 'USE_SUPABASE') and settings.USE_SUPABASE:
-            database_url = settings.SUPABASE_DATABASE_URL
-        else:
-            # settings.DATABASE_URL 속성 사용 (Cloud SQL 지원)
-            database_url = settings.DATABASE_URL
-            print(f"Using DATABASE_URL: {database_url}")  # 디버깅용
-        
-        engine = create_engine(database_url, pool_pre_ping=True)
-        return engine
+        return get_sqlalchemy_engine()
     except Exception as e:
         logger.error(f"Database connection error: {e}")
         raise
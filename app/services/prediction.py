@@ -7,8 +7,7 @@ import openai
 import os
 from dotenv import load_dotenv
 from datetime import datetime
-from app.db.connection import get_sqlalchemy_engine
-from sqlalchemy import text 
+from app.services.price_repository import PRICE_COLUMNS, get_price_series, get_stock_table_name
 
 
 load_dotenv()
@@ -24,28 +23,19 @@ FEATURES = [
 def load_data(stock_symbol):
     """
     주어진 stock_symbol에 따라 적절한 테이블에서 데이터를 읽어와 DataFrame으로 반환합니다.
-    DB 연결은 SQLAlchemy engine을 사용합니다.
+    테이블 라우팅과 조회는 price_repository가 담당합니다.
     """
-    engine = get_sqlalchemy_engine()
-    first_char = stock_symbol[0].upper()
-    if 'A' <= first_char <= 'D':
-        table = 'fnspid_stock_price_a'
-    elif 'E' <= first_char <= 'M':
-        table = 'fnspid_stock_price_b'
-    elif 'N' <= first_char <= 'Z':
-        table = 'fnspid_stock_price_c'
-    else:
+    if get_stock_table_name(stock_symbol) is None:
         raise Exception("유효하지 않은 stock_symbol입니다.")
 
-    query = text(f"SELECT * FROM {table} WHERE stock_symbol = :stock_symbol ORDER BY date")
-    
-    # pd.read_sql은 params를 딕셔너리로 받을 수 있음
-    df = pd.read_sql(query, engine, params={"stock_symbol": stock_symbol})
+    series = get_price_series(stock_symbol)
 
-    if df.empty:
+    if series is None:
         raise ValueError(f"DB에서 {stock_symbol}에 해당하는 데이터가 없습니다.")
-    df['date'] = pd.to_datetime(df['date'])
-    df.set_index('date', inplace=True)
+    df = pd.DataFrame(
+        {col: series[col] for col in PRICE_COLUMNS},
+        index=pd.DatetimeIndex(series['dates'], name='date')
+    )
     return df
 
 def add_features(df):
@@ -0,0 +1,91 @@
+"""
+티커별 주가 시계열 인메모리 캐시 (LRU)
+
+FNSPID 주가 데이터는 2023-12-31 이후로 변하지 않으므로, 티커의 전체 히스토리를
+날짜/float64 컬럼 배열로 한 번만 적재해 두고 이후 요청은 구간 슬라이싱으로 응답합니다.
+메모리 예산(바이트, 배열 크기 + 항목당 고정 오버헤드)을 넘으면 가장 오래 사용하지 않은 티커부터 제거합니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+
+# 항목당 고정 오버헤드 (dict/키 문자열/ndarray 객체 헤더 등). 빈 시계열(없는 티커)도 예산을 차지해 제거 대상이 됨
+ENTRY_OVERHEAD_BYTES = 1024
+
+
+def _series_nbytes(series: Dict[str, np.ndarray]) -> int:
+    return ENTRY_OVERHEAD_BYTES + sum(values.nbytes for values in series.values())
+
+
+class PriceCache:
+    """티커 -> {'dates': ..., '<column>': ...} 시계열을 보관하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, ticker: str) -> Optional[Dict[str, np.ndarray]]:
+        """캐시된 전체 시계열을 반환합니다. 없으면 None (miss로 집계)"""
+        with self._lock:
+            series = self._entries.get(ticker)
+            if series is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(ticker)
+            self.hits += 1
+            return series
+
+    def put(self, ticker: str, series: Dict[str, np.ndarray]):
+        """
+        전체 시계열을 캐시에 저장합니다. 배열은 읽기 전용으로 고정되며,
+        예산을 초과하면 LRU 순서로 제거합니다. 단독으로 예산보다 큰 시계열은 저장하지 않습니다.
+        """
+        for values in series.values():
+            values.setflags(write=False)
+        size = _series_nbytes(series)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(ticker, None)
+            if old is not None:
+                self._nbytes -= _series_nbytes(old)
+            self._entries[ticker] = series
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= _series_nbytes(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.PRICE_CACHE_ENABLED,
+                "tickers": len(self._entries),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 공용 캐시 인스턴스
+price_cache = PriceCache(settings.PRICE_CACHE_MAX_MB * 1024 * 1024)
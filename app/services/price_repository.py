@@ -0,0 +1,293 @@
+"""
+FNSPID 주가 데이터 접근 레이어
+
+fnspid_stock_price_a/b/c 테이블 라우팅(티커 첫 글자 기준)을 한 곳에서 관리하고,
+여러 티커를 파티션 테이블별로 묶어 테이블당 1회 쿼리로 조회합니다.
+한 번 조회한 티커는 전체 히스토리를 price_cache에 보관해 이후 요청은 DB를 거치지 않습니다.
+PRICE_STORE_DIR에 mmap 스냅샷(price_store)이 있으면 DB 대신 스냅샷에서 읽습니다.
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
+from app.services.price_cache import price_cache
+from app.services.price_store import INDEX_COLUMNS, STOCK_COLUMNS, get_price_store
+
+logger = logging.getLogger(__name__)
+
+# 주가 데이터는 2023-12-31까지만 존재
+PRICE_DATA_END_DATE = '2023-12-31'
+
+PRICE_COLUMNS = STOCK_COLUMNS
+
+
+def get_stock_table_name(ticker: str) -> Optional[str]:
+    """
+    ticker의 첫 글자에 따라 적절한 stock price 테이블명을 반환합니다.
+    a-d: fnspid_stock_price_a, e-m: fnspid_stock_price_b, n-z: fnspid_stock_price_c
+    알파벳으로 시작하지 않는 티커는 None을 반환합니다.
+    """
+    if not ticker:
+        return None
+    first_char = ticker[0].lower()
+    if 'a' <= first_char <= 'd':
+        return 'fnspid_stock_price_a'
+    elif 'e' <= first_char <= 'm':
+        return 'fnspid_stock_price_b'
+    elif 'n' <= first_char <= 'z':
+        return 'fnspid_stock_price_c'
+    return None
+
+
+def clamp_end_date(end_date: Optional[str]) -> str:
+    """end_date가 없거나 데이터 종료일(2023-12-31)을 넘으면 종료일로 조정합니다."""
+    if not end_date or end_date > PRICE_DATA_END_DATE:
+        return PRICE_DATA_END_DATE
+    return end_date
+
+
+def _validate_columns(columns: Sequence[str]) -> List[str]:
+    invalid = [c for c in columns if c not in PRICE_COLUMNS]
+    if invalid:
+        raise ValueError(f"Unsupported price columns: {invalid}")
+    return list(columns)
+
+
+def _to_date_array(values: Iterable) -> np.ndarray:
+    """DB에서 받은 date/datetime/문자열 값을 datetime64[D] 배열로 변환"""
+    return np.array([str(v)[:10] for v in values], dtype='datetime64[D]')
+
+
+def _rows_to_series(rows: list, columns: List[str]) -> Dict[str, np.ndarray]:
+    """(stock_symbol, date, *columns) 형태의 row 목록을 컬럼별 배열로 변환 (NULL은 NaN)"""
+    series = {'dates': _to_date_array(row[1] for row in rows)}
+    for i, col in enumerate(columns, start=2):
+        series[col] = np.array([row[i] for row in rows], dtype=np.float64)
+    return series
+
+
+def _query_prices(
+    tickers_by_table: Dict[str, List[str]],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    columns: List[str]
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """파티션 테이블별 1회 쿼리(stock_symbol = ANY(:tickers))로 DB에서 직접 조회"""
+    conditions = ["stock_symbol = ANY(:tickers)"]
+    params = {}
+    if start_date:
+        conditions.append("date >= :start_date")
+        params["start_date"] = start_date
+    if end_date:
+        conditions.append("date <= :end_date")
+        params["end_date"] = end_date
+    select_cols = ", ".join(columns)
+    where_clause = " AND ".join(conditions)
+
+    rows_by_ticker = defaultdict(list)
+    with get_sqlalchemy_engine().connect() as conn:
+        for table_name, table_tickers in tickers_by_table.items():
+            query = text(f"""
+                SELECT stock_symbol, date, {select_cols}
+                FROM {table_name}
+                WHERE {where_clause}
+                ORDER BY stock_symbol, date ASC
+            """)
+            result = conn.execute(query, {**params, "tickers": table_tickers})
+            for row in result:
+                rows_by_ticker[row[0]].append(row)
+
+    return {ticker: _rows_to_series(rows, columns) for ticker, rows in rows_by_ticker.items()}
+
+
+def _empty_series() -> Dict[str, np.ndarray]:
+    series = {'dates': np.array([], dtype='datetime64[D]')}
+    for col in PRICE_COLUMNS:
+        series[col] = np.array([], dtype=np.float64)
+    return series
+
+
+def _get_prices_cached(
+    tickers_by_table: Dict[str, List[str]],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    columns: List[str]
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    캐시에 있는 티커는 DB 조회 없이 구간을 잘라 반환하고,
+    없는 티커만 전체 히스토리(전 컬럼)를 일괄 조회해 캐시에 적재합니다.
+    """
+    full_series = {}
+    missing_by_table = defaultdict(list)
+    for table_name, table_tickers in tickers_by_table.items():
+        for ticker in table_tickers:
+            series = price_cache.get(ticker)
+            if series is None:
+                missing_by_table[table_name].append(ticker)
+            else:
+                full_series[ticker] = series
+
+    if missing_by_table:
+        loaded = _query_prices(missing_by_table, None, None, list(PRICE_COLUMNS))
+        for table_tickers in missing_by_table.values():
+            for ticker in table_tickers:
+                # 데이터가 없는 티커도 빈 시계열로 캐시해 반복 조회를 막음
+                series = loaded.get(ticker) or _empty_series()
+                price_cache.put(ticker, series)
+                full_series[ticker] = series
+
+    result = {}
+    for ticker, series in full_series.items():
+        window = _select_window(series, start_date, end_date, columns)
+        if window is not None:
+            result[ticker] = window
+    return result
+
+
+def _select_window(
+    series: Dict[str, np.ndarray],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    columns: Sequence[str]
+) -> Optional[Dict[str, np.ndarray]]:
+    """전체 시계열에서 구간/컬럼을 골라 반환합니다. 구간에 데이터가 없으면 None"""
+    window = slice_series(series, start_date, end_date)
+    if len(window['dates']) == 0:
+        return None
+    return {'dates': window['dates'], **{col: window[col] for col in columns}}
+
+
+def _get_prices_from_store(
+    store,
+    tickers_by_table: Dict[str, List[str]],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    columns: List[str]
+) -> Dict[str, Dict[str, np.ndarray]]:
+    result = {}
+    for table_tickers in tickers_by_table.values():
+        for ticker in table_tickers:
+            series = store.get_series(ticker)
+            window = _select_window(series, start_date, end_date, columns) if series is not None else None
+            if window is not None:
+                result[ticker] = window
+    return result
+
+
+def get_prices(
+    tickers: Iterable[str],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Sequence[str] = PRICE_COLUMNS
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    여러 티커의 주가 데이터를 조회합니다.
+    캐시에 없는 티커만 파티션 테이블별 1회 쿼리(stock_symbol = ANY(:tickers))로 DB에서 가져옵니다.
+
+    Args:
+        tickers: 티커 목록
+        start_date, end_date: 'YYYY-MM-DD' (None이면 해당 방향으로 제한 없음)
+        columns: 조회할 가격 컬럼 (PRICE_COLUMNS 중 선택)
+
+    Returns:
+        {ticker: {'dates': datetime64[D] 배열, '<column>': float64 배열, ...}}
+        각 티커의 배열은 날짜 오름차순으로 정렬되어 서로 정렬(align)되어 있으며,
+        데이터가 없는 티커는 결과에 포함되지 않습니다.
+        캐시/스냅샷을 사용하는 경우 배열은 이를 참조하는 읽기 전용 뷰입니다.
+    """
+    columns = _validate_columns(columns)
+
+    tickers_by_table = defaultdict(list)
+    for ticker in dict.fromkeys(tickers):
+        table_name = get_stock_table_name(ticker)
+        if table_name is None:
+            logger.warning(f"Invalid ticker format: {ticker}")
+            continue
+        tickers_by_table[table_name].append(ticker)
+
+    if not tickers_by_table:
+        return {}
+
+    store = get_price_store()
+    if store is not None:
+        return _get_prices_from_store(store, tickers_by_table, start_date, end_date, columns)
+    if settings.PRICE_CACHE_ENABLED:
+        return _get_prices_cached(tickers_by_table, start_date, end_date, columns)
+    return _query_prices(tickers_by_table, start_date, end_date, columns)
+
+
+def get_price_series(
+    ticker: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Sequence[str] = PRICE_COLUMNS
+) -> Optional[Dict[str, np.ndarray]]:
+    """단일 티커의 주가 데이터를 반환합니다. 데이터가 없으면 None."""
+    return get_prices([ticker], start_date, end_date, columns).get(ticker)
+
+
+def get_index_prices(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Sequence[str] = INDEX_COLUMNS
+) -> Dict[str, np.ndarray]:
+    """
+    index_closing_price의 지수 종가를 조회합니다. (스냅샷이 있으면 스냅샷 사용)
+
+    Returns:
+        {'dates': datetime64[D] 배열, 'dow'|'sp500'|'nasdaq': float64 배열 (NULL은 NaN)}
+    """
+    invalid = [c for c in columns if c not in INDEX_COLUMNS]
+    if invalid:
+        raise ValueError(f"Unsupported index columns: {invalid}")
+
+    store = get_price_store()
+    if store is not None:
+        window = slice_series(store.get_index_series(), start_date, end_date)
+        return {'dates': window['dates'], **{col: window[col] for col in columns}}
+
+    conditions = []
+    params = {}
+    if start_date:
+        conditions.append("date >= :start_date")
+        params["start_date"] = start_date
+    if end_date:
+        conditions.append("date <= :end_date")
+        params["end_date"] = end_date
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text(f"""
+            SELECT date, {", ".join(columns)}
+            FROM index_closing_price
+            {where_clause}
+            ORDER BY date ASC
+        """), params).fetchall()
+
+    series = {'dates': _to_date_array(row[0] for row in rows)}
+    for i, col in enumerate(columns, start=1):
+        series[col] = np.array([row[i] for row in rows], dtype=np.float64)
+    return series
+
+
+def slice_series(series: Dict[str, np.ndarray], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """정렬된 시계열에서 [start_date, end_date] 구간만 잘라 반환합니다. (이진 탐색)"""
+    dates = series['dates']
+    lo = np.searchsorted(dates, np.datetime64(start_date, 'D'), side='left') if start_date else 0
+    hi = np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right') if end_date else len(dates)
+    return {key: values[lo:hi] for key, values in series.items()}
+
+
+def dates_to_strings(dates: np.ndarray) -> List[str]:
+    """datetime64[D] 배열을 'YYYY-MM-DD' 문자열 리스트로 변환"""
+    return np.datetime_as_string(dates, unit='D').tolist()
+
+
+def to_float_list(values: np.ndarray) -> List[Optional[float]]:
+    """float 배열을 JSON 직렬화 가능한 리스트로 변환 (NaN -> None)"""
+    return [None if v != v else v for v in values.tolist()]
@@ -0,0 +1,240 @@
+"""
+FNSPID 주가/지수 데이터 로컬 스냅샷 (memory-mapped)
+
+fnspid_stock_price_a/b/c, index_closing_price 테이블은 2023-12-31 이후 변하지 않으므로
+한 번 내보낸 스냅샷을 np.load(mmap_mode='r')로 열어 DB 대신 사용할 수 있습니다.
+여러 워커 프로세스가 같은 파일을 열면 OS 페이지 캐시의 사본 하나를 공유합니다.
+
+디렉토리 구조:
+    manifest.json              생성 시각, 행 수, 티커별 [offset, length]
+    stocks/dates.npy           모든 티커의 날짜를 티커 단위로 이어붙인 datetime64[D] 배열
+    stocks/<column>.npy        PRICE_COLUMNS 컬럼별 float64 배열 (dates와 같은 길이/순서)
+    indices/dates.npy          index_closing_price 날짜
+    indices/<column>.npy       dow, sp500, nasdaq 종가 (float64, NULL은 NaN)
+
+사용법:
+    python -m app.services.price_store export --out /app/cache/price_store
+    (이후 PRICE_STORE_DIR=/app/cache/price_store 로 설정)
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
+
+MANIFEST_FILE = "manifest.json"
+STORE_FORMAT_VERSION = 1
+
+STOCK_TABLES = ('fnspid_stock_price_a', 'fnspid_stock_price_b', 'fnspid_stock_price_c')
+STOCK_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'adj_close')
+INDEX_COLUMNS = ('dow', 'sp500', 'nasdaq')
+
+EXPORT_FETCH_SIZE = 50000
+
+_store = None
+_store_checked = False  # 한 번 열기를 시도했으면 True (실패 결과도 캐시해 요청마다 다시 시도/로그하지 않음)
+_store_lock = threading.Lock()
+
+
+class PriceStore:
+    """스냅샷 디렉토리를 mmap으로 열어 티커/지수 시계열을 배열 뷰로 제공합니다."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format_version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported price store format: {self.manifest.get('format_version')}")
+
+        self._offsets: Dict[str, List[int]] = self.manifest["tickers"]
+        self._stocks = self._load_arrays("stocks", STOCK_COLUMNS)
+        self._indices = self._load_arrays("indices", INDEX_COLUMNS)
+
+    def _load_arrays(self, section: str, columns) -> Dict[str, np.ndarray]:
+        section_dir = os.path.join(self.store_dir, section)
+        return {
+            name: np.load(os.path.join(section_dir, f"{name}.npy"), mmap_mode='r')
+            for name in ('dates', *columns)
+        }
+
+    def has_ticker(self, ticker: str) -> bool:
+        return ticker in self._offsets
+
+    def get_series(self, ticker: str) -> Optional[Dict[str, np.ndarray]]:
+        """티커의 전체 히스토리를 반환합니다. (복사 없는 읽기 전용 mmap 뷰, 없으면 None)"""
+        location = self._offsets.get(ticker)
+        if location is None:
+            return None
+        offset, length = location
+        return {name: values[offset:offset + length] for name, values in self._stocks.items()}
+
+    def get_index_series(self) -> Dict[str, np.ndarray]:
+        """index_closing_price 전체 시계열 (dates, dow, sp500, nasdaq)"""
+        return dict(self._indices)
+
+    def info(self) -> dict:
+        return {
+            "store_dir": self.store_dir,
+            "created_at": self.manifest.get("created_at"),
+            "tickers": len(self._offsets),
+            "stock_rows": self.manifest.get("stock_rows"),
+            "index_rows": self.manifest.get("index_rows"),
+        }
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """
+    settings.PRICE_STORE_DIR에 스냅샷이 있으면 프로세스 공용 PriceStore를 반환합니다.
+    설정이 없거나 스냅샷을 열 수 없으면 None (DB 사용)
+    여는 것은 프로세스당 1회만 시도하므로, 나중에 만든 스냅샷을 쓰려면 프로세스를 재시작해야 합니다.
+    """
+    global _store, _store_checked
+    if _store_checked or not settings.PRICE_STORE_DIR:
+        return _store
+
+    with _store_lock:
+        if not _store_checked:
+            manifest_path = os.path.join(settings.PRICE_STORE_DIR, MANIFEST_FILE)
+            if not os.path.exists(manifest_path):
+                print(f"[WARNING] Price store not found: {settings.PRICE_STORE_DIR} (DB 사용)")
+            else:
+                try:
+                    _store = PriceStore(settings.PRICE_STORE_DIR)
+                    print(f"[INFO] Price store loaded: {_store.info()}")
+                except Exception as e:
+                    print(f"[ERROR] Price store load failed: {e} (DB 사용)")
+            _store_checked = True
+    return _store
+
+
+# ---------------------------------------------------------------------------
+# 내보내기 (DB -> 스냅샷)
+# ---------------------------------------------------------------------------
+
+def _open_column_files(section_dir: str, columns, n_rows: int) -> Dict[str, np.ndarray]:
+    os.makedirs(section_dir, exist_ok=True)
+    arrays = {
+        'dates': np.lib.format.open_memmap(
+            os.path.join(section_dir, "dates.npy"), mode='w+', dtype='datetime64[D]', shape=(n_rows,)
+        )
+    }
+    for col in columns:
+        arrays[col] = np.lib.format.open_memmap(
+            os.path.join(section_dir, f"{col}.npy"), mode='w+', dtype=np.float64, shape=(n_rows,)
+        )
+    return arrays
+
+
+def _fill_chunk(arrays: Dict[str, np.ndarray], columns, rows: list, pos: int, date_index: int):
+    """(…, date, *columns) 형태의 row 묶음을 pos 위치부터 배열에 기록"""
+    end = pos + len(rows)
+    arrays['dates'][pos:end] = np.array([str(row[date_index])[:10] for row in rows], dtype='datetime64[D]')
+    for i, col in enumerate(columns, start=date_index + 1):
+        arrays[col][pos:end] = np.array([row[i] for row in rows], dtype=np.float64)
+    return end
+
+
+def _export_stocks(conn, out_dir: str) -> tuple:
+    """fnspid_stock_price_a/b/c를 티커별로 연속 배치하고 [offset, length]를 기록"""
+    n_rows = sum(conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() for table in STOCK_TABLES)
+    arrays = _open_column_files(os.path.join(out_dir, "stocks"), STOCK_COLUMNS, n_rows)
+    select_cols = ", ".join(STOCK_COLUMNS)
+
+    offsets = {}
+    pos = 0
+    for table in STOCK_TABLES:
+        start = time.time()
+        result = conn.execution_options(stream_results=True).execute(text(f"""
+            SELECT stock_symbol, date, {select_cols}
+            FROM {table}
+            ORDER BY stock_symbol, date ASC
+        """))
+        while True:
+            rows = result.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                break
+            chunk_start = pos
+            pos = _fill_chunk(arrays, STOCK_COLUMNS, rows, pos, date_index=1)
+            for i, row in enumerate(rows):
+                location = offsets.get(row[0])
+                if location is None:
+                    offsets[row[0]] = [chunk_start + i, 1]
+                else:
+                    location[1] += 1
+        print(f"[INFO] {table} 내보내기 완료 ({pos:,}/{n_rows:,} rows, {time.time() - start:.1f}s)")
+
+    for values in arrays.values():
+        values.flush()
+    return offsets, pos
+
+
+def _export_indices(conn, out_dir: str) -> int:
+    rows = conn.execute(text(f"""
+        SELECT date, {", ".join(INDEX_COLUMNS)}
+        FROM index_closing_price
+        ORDER BY date ASC
+    """)).fetchall()
+    arrays = _open_column_files(os.path.join(out_dir, "indices"), INDEX_COLUMNS, len(rows))
+    _fill_chunk(arrays, INDEX_COLUMNS, rows, 0, date_index=0)
+    for values in arrays.values():
+        values.flush()
+    print(f"[INFO] index_closing_price 내보내기 완료 ({len(rows):,} rows)")
+    return len(rows)
+
+
+def export_price_store(out_dir: str):
+    """
+    DB의 주가/지수 테이블을 out_dir에 스냅샷으로 내보냅니다.
+    임시 디렉토리에 기록한 뒤 완료 시 교체하므로, 실행 중에도 기존 스냅샷은 그대로 사용 가능합니다.
+    """
+    out_dir = os.path.abspath(out_dir)
+    tmp_dir = f"{out_dir}.tmp"
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    start = time.time()
+    with get_sqlalchemy_engine().connect() as conn:
+        offsets, stock_rows = _export_stocks(conn, tmp_dir)
+        index_rows = _export_indices(conn, tmp_dir)
+
+    manifest = {
+        "format_version": STORE_FORMAT_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "stock_rows": stock_rows,
+        "index_rows": index_rows,
+        "tickers": offsets,
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    os.rename(tmp_dir, out_dir)
+    print(f"[INFO] Price store 생성 완료: {out_dir} ({len(offsets):,} tickers, {time.time() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FNSPID 주가/지수 mmap 스냅샷 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="DB 테이블을 스냅샷으로 내보내기")
+    export_parser.add_argument("--out", default=settings.PRICE_STORE_DIR or os.path.join(settings.cache_dir, "price_store"))
+
+    info_parser = subparsers.add_parser("info", help="스냅샷 정보 출력")
+    info_parser.add_argument("--dir", default=settings.PRICE_STORE_DIR)
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export_price_store(args.out)
+    elif args.command == "info":
+        print(PriceStore(args.dir).info())
@@ -1,5 +1,145 @@
 from typing import Dict
-from app.services.crawler import calculate_absolute_and_relative_returns, get_return_analysis_summary, get_return_analysis_table
+import numpy as np
+from app.services.price_repository import (
+    PRICE_DATA_END_DATE,
+    clamp_end_date,
+    dates_to_strings,
+    get_index_prices,
+    get_price_series,
+    get_stock_table_name,
+)
+
+# 기간별 수익률 표 (영업일 기준)
+RETURN_TABLE_PERIODS = {
+    '1M': 22,    # 약 1개월 (22 영업일)
+    '3M': 66,    # 약 3개월 (66 영업일)
+    '6M': 132,   # 약 6개월 (132 영업일)
+    '12M': 252   # 약 12개월 (252 영업일)
+}
+
+
+def _load_aligned_closes(ticker: str, start_date: str, end_date: str):
+    """
+    주식 종가와 S&P500 종가를 한 번씩만 조회해 공통 거래일로 정렬 병합합니다.
+    반환: (dates, stock_closes, sp500_closes) 또는 {"error": ...}
+    """
+    if get_stock_table_name(ticker) is None:
+        return {"error": f"Invalid ticker format: {ticker}"}
+    end_date = clamp_end_date(end_date)
+    if start_date > PRICE_DATA_END_DATE:
+        return {"error": "No data available for the requested period (data only until 2023)"}
+
+    stock = get_price_series(ticker, start_date, end_date, ('close',))
+    if stock is None:
+        return {"error": f"No data found for symbol {ticker}"}
+    sp500 = get_index_prices(start_date, end_date, ('sp500',))
+    sp500_valid = ~np.isnan(sp500['sp500'])
+    if not sp500_valid.any():
+        return {"error": "No data found for symbol ^SPX"}
+    stock_valid = ~np.isnan(stock['close'])
+
+    # 공통 거래일 인덱스를 한 번에 구함 (같은 날짜가 중복된 행은 기존 list.index처럼 첫 번째 행 사용)
+    stock_dates = stock['dates'][stock_valid]
+    sp500_dates = sp500['dates'][sp500_valid]
+    dates, stock_idx, sp500_idx = np.intersect1d(stock_dates, sp500_dates, return_indices=True)
+    if len(dates) == 0:
+        return {"error": "No common dates between stock and S&P500 data"}
+    return dates, stock['close'][stock_valid][stock_idx], sp500['sp500'][sp500_valid][sp500_idx]
+
+
+def compute_return_analytics(ticker: str, start_date: str, end_date: str) -> Dict:
+    """
+    주식/S&P500 종가를 한 번만 조회해 비교 차트, 요약, 기간별 표 데이터를 한 번에 계산합니다.
+    반환: {"comparison": ..., "summary": ..., "table": ...} 또는 {"error": ...}
+    """
+    try:
+        aligned = _load_aligned_closes(ticker, start_date, end_date)
+        if isinstance(aligned, dict):
+            return aligned
+        dates, stock_prices, sp500_prices = aligned
+
+        # 지수 (기준일=100), 상대지수, 수익률(%)
+        stock_index = (stock_prices / stock_prices[0]) * 100
+        sp500_index = (sp500_prices / sp500_prices[0]) * 100
+        relative_index = (stock_index / sp500_index) * 100
+        stock_returns = ((stock_prices / stock_prices[0]) - 1) * 100
+        sp500_returns = ((sp500_prices / sp500_prices[0]) - 1) * 100
+        relative_returns = ((relative_index / 100) - 1) * 100
+
+        comparison = {
+            'dates': dates_to_strings(dates),
+            'stock_prices': stock_prices.tolist(),
+            'sp500_prices': sp500_prices.tolist(),
+            'stock_index': stock_index.tolist(),
+            'sp500_index': sp500_index.tolist(),
+            'relative_index': relative_index.tolist(),
+            'stock_returns': stock_returns.tolist(),
+            'sp500_returns': sp500_returns.tolist(),
+            'relative_returns': relative_returns.tolist()
+        }
+
+        stock_final_return = float(stock_returns[-1])
+        sp500_final_return = float(sp500_returns[-1])
+        relative_final_return = float(relative_returns[-1])
+
+        # 변동성 (일간 수익률의 표준편차 × √252)
+        if len(stock_prices) > 1:
+            daily_stock_returns = ((stock_prices[1:] / stock_prices[:-1]) - 1) * 100
+            stock_volatility = float(np.std(daily_stock_returns) * (252 ** 0.5))
+        else:
+            stock_volatility = 0
+
+        summary = {
+            "ticker": ticker,
+            "period": f"{start_date} ~ {end_date}",
+            "stock_return": round(stock_final_return, 2),
+            "sp500_return": round(sp500_final_return, 2),
+            "relative_return": round(relative_final_return, 2),
+            "stock_volatility": round(stock_volatility, 2),
+            "outperformance": round(stock_final_return - sp500_final_return, 2),
+            "data_points": len(dates)
+        }
+
+        # 기간별 수익률 (마지막 거래일 기준 N 영업일 전 대비)
+        table_data = []
+        end_idx = len(stock_prices) - 1
+        for period_name, days_back in RETURN_TABLE_PERIODS.items():
+            if len(stock_prices) > days_back:
+                start_idx = end_idx - days_back
+                stock_period_return = float(((stock_prices[end_idx] / stock_prices[start_idx]) - 1) * 100)
+                sp500_period_return = float(((sp500_prices[end_idx] / sp500_prices[start_idx]) - 1) * 100)
+                table_data.append({
+                    'period': period_name,
+                    'absolute_return': round(stock_period_return, 2),
+                    'relative_return': round(stock_period_return - sp500_period_return, 2),
+                    'benchmark_return': round(sp500_period_return, 2),
+                    'outperformance': round(stock_period_return - sp500_period_return, 2)
+                })
+            else:
+                # 데이터가 부족한 경우에도 기본값을 넣어서 프론트엔드에서 '-'로 표시
+                table_data.append({
+                    'period': period_name,
+                    'absolute_return': None,
+                    'relative_return': None,
+                    'benchmark_return': None,
+                    'outperformance': None
+                })
+
+        table = {
+            "ticker": ticker,
+            "period": f"{start_date} ~ {end_date}",
+            "table_data": table_data,
+            "current_data": {
+                "absolute_return": round(stock_final_return, 2),
+                "relative_return": round(relative_final_return, 2),
+                "benchmark_return": round(sp500_final_return, 2),
+                "outperformance": round(stock_final_return - sp500_final_return, 2)
+            }
+        }
+        return {"comparison": comparison, "summary": summary, "table": table}
+    except Exception as e:
+        return {"error": f"Error calculating returns: {e}"}
+
 
 class ReturnAnalysisService:
     """수익률 분석 관련 서비스"""
@@ -18,7 +158,8 @@ class ReturnAnalysisService:
             Dict: 수익률 비교 데이터
         """
         try:
-            return calculate_absolute_and_relative_returns(ticker, start_date, end_date)
+            result = compute_return_analytics(ticker, start_date, end_date)
+            return result.get("comparison", result)
         except Exception as e:
             return {"error": f"Error in return comparison service: {e}"}
 
@@ -36,7 +177,8 @@ class ReturnAnalysisService:
             Dict: 분석 요약 정보
         """
         try:
-            return get_return_analysis_summary(ticker, start_date, end_date)
+            result = compute_return_analytics(ticker, start_date, end_date)
+            return result.get("summary", result)
         except Exception as e:
             return {"error": f"Error in analysis summary service: {e}"}
 
@@ -54,7 +196,8 @@ class ReturnAnalysisService:
             Dict: 분석 표 데이터
         """
         try:
-            return get_return_analysis_table(ticker, start_date, end_date)
+            result = compute_return_analytics(ticker, start_date, end_date)
+            return result.get("table", result)
         except Exception as e:
             return {"error": f"Error in analysis table service: {e}"}
 
@@ -72,22 +215,15 @@ class ReturnAnalysisService:
             Dict: 차트용 결합 데이터
         """
         try:
-            comparison_data = calculate_absolute_and_relative_returns(ticker, start_date, end_date)
-            if "error" in comparison_data:
-                return comparison_data
-            
-            summary_data = get_return_analysis_summary(ticker, start_date, end_date)
-            if "error" in summary_data:
-                return summary_data
-            
-            table_data = get_return_analysis_table(ticker, start_date, end_date)
-            if "error" in table_data:
-                return table_data
+            # 주가/지수 조회와 계산은 한 번만 수행
+            result = compute_return_analytics(ticker, start_date, end_date)
+            if "error" in result:
+                return result
             
             return {
-                "chart_data": comparison_data,
-                "summary": summary_data,
-                "table_data": table_data,
+                "chart_data": result["comparison"],
+                "summary": result["summary"],
+                "table_data": result["table"],
                 "ticker": ticker,
                 "period": f"{start_date} ~ {end_date}"
             }
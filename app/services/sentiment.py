@@ -1,39 +1,66 @@
 from app.db.connection import get_sqlalchemy_engine 
-from app.services.cache_manager import get_mcdonald_word_info
+from app.services.cache_manager import get_mcdonald_dictionary_version
+from app.services.article_sentiment import build_record, ensure_article_sentiment_table, upsert_article_sentiments
+from app.services.sentiment_scorer import get_mcdonald_scorer
+from app.services.weekly_sentiment import (
+    build_rollup_record,
+    ensure_weekly_rollup_table,
+    get_weekly_rollups,
+    invalidate_weekly_rollups,
+    upsert_weekly_rollups,
+)
+from app.services.weekly_sentiment_cache import EMPTY_WEEK, cache_weeks, copy_entry, get_cached_weeks
+from datetime import datetime, timedelta
+from itertools import islice
+import heapq
 import re
 from sqlalchemy import text
 
+# 서버사이드 커서로 한 번에 가져올 기사 수
+ARTICLE_STREAM_BATCH_SIZE = 500
+
+def _build_articles_query(select_cols: str, stock_symbol: str, start_date: str = None, end_date: str = None, join: str = "", exclude_weeks: list = None):
+    params = {"stock_symbol": str(stock_symbol).strip()}
+    
+    # 기본 쿼리 템플릿과 조건 리스트를 사용합니다. (k: kb_enterprise_dataset)
+    query_base = f"""
+        SELECT {select_cols}
+        FROM kb_enterprise_dataset k
+        {join}
+        WHERE k.stock_symbol = :stock_symbol
+          AND k.article IS NOT NULL AND k.article != '' 
+    """
+    conditions = []
+
+    if start_date:
+        conditions.append("k.date >= :start_date")
+        params["start_date"] = start_date
+    if end_date:
+        conditions.append("k.date <= :end_date")
+        params["end_date"] = end_date
+    if exclude_weeks:
+        # 롤업에서 읽는 주차는 기사 조회에서 제외
+        conditions.append("k.weekstart_sunday <> ALL(:exclude_weeks)")
+        params["exclude_weeks"] = list(exclude_weeks)
+    
+    if conditions:
+        query_base += " AND " + " AND ".join(conditions)
+    
+    query_final = query_base + " ORDER BY k.weekstart_sunday, k.date DESC;"
+    return query_final, params
+
 def get_articles_by_stock_symbol(stock_symbol: str, start_date: str = None, end_date: str = None):
     engine = get_sqlalchemy_engine() 
     try:
         with engine.connect() as conn: 
-            params = {"stock_symbol": str(stock_symbol).strip()}
-            
-            # 2. 기본 쿼리 템플릿과 조건 리스트를 사용합니다.
-            query_base = """
-                SELECT article, date, weekstart_sunday, article_title 
-                FROM kb_enterprise_dataset 
-                WHERE stock_symbol = :stock_symbol
-                  AND article IS NOT NULL AND article != '' 
-            """
-            conditions = []
-
-            if start_date:
-                conditions.append("date >= :start_date")
-                params["start_date"] = start_date
-            if end_date:
-                conditions.append("date <= :end_date")
-                params["end_date"] = end_date
-            
-            if conditions:
-                query_base += " AND " + " AND ".join(conditions)
-            
-            query_final = query_base + " ORDER BY weekstart_sunday, date DESC;"
+            query_final, params = _build_articles_query(
+                "k.article, k.date, k.weekstart_sunday, k.article_title", stock_symbol, start_date, end_date
+            )
 
             print("실행 쿼리:", query_final)
             print("파라미터:", params)
             
-            # 3. 쿼리를 text()로 감싸고 파라미터를 함께 전달합니다.
+            # 쿼리를 text()로 감싸고 파라미터를 함께 전달합니다.
             result = conn.execute(text(query_final), params)
             rows = result.fetchall()
             
@@ -44,6 +71,63 @@ def get_articles_by_stock_symbol(stock_symbol: str, start_date: str = None, end_
         print(f"Error fetching articles for ticker: {stock_symbol}. Error: {e}")
         return []
 
+def stream_articles_by_stock_symbol(stock_symbol: str, start_date: str = None, end_date: str = None, batch_size: int = ARTICLE_STREAM_BATCH_SIZE, exclude_weeks: list = None):
+    """
+    get_articles_by_stock_symbol의 스트리밍 버전 (서버사이드 커서, batch_size 단위로 가져옴)
+    DB 오류는 빈 결과로 바꾸지 않고 그대로 raise 합니다. (중간에 끊긴 스트림과 "기사 없음"을 구분하기 위함)
+    weekstart_sunday, date DESC 순으로
+    (article_id, article, date, weekstart_sunday, article_title, score, pos_cnt, neg_cnt, content_hash)를 yield 합니다.
+
+    article_sentiment에 현재 사전 버전/본문 해시와 일치하는 점수가 있으면 article은 None이고
+    score/pos_cnt/neg_cnt가 채워집니다. 없으면 본문과 content_hash가 채워집니다. (본문은 미스인 기사만 전송)
+    """
+    engine = get_sqlalchemy_engine()
+    if ensure_article_sentiment_table():
+        query_final, params = _build_articles_query(
+            """k.id,
+               CASE WHEN s.article_id IS NULL THEN k.article END,
+               k.date, k.weekstart_sunday, k.article_title,
+               s.score, s.pos_cnt, s.neg_cnt,
+               CASE WHEN s.article_id IS NULL THEN md5(k.article) END""",
+            stock_symbol, start_date, end_date,
+            exclude_weeks=exclude_weeks,
+            join="""LEFT JOIN article_sentiment s
+                      ON s.article_id = k.id
+                     AND s.dict_version = :dict_version
+                     AND s.content_hash = md5(k.article)"""
+        )
+        params["dict_version"] = get_mcdonald_dictionary_version()
+    else:
+        query_final, params = _build_articles_query(
+            """k.id, k.article, k.date, k.weekstart_sunday, k.article_title,
+               NULL, NULL, NULL, md5(k.article)""",
+            stock_symbol, start_date, end_date,
+            exclude_weeks=exclude_weeks
+        )
+    count = 0
+    try:
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(text(query_final), params)
+            for row in result:
+                count += 1
+                yield row
+    except Exception as e:
+        # 중간에 끊긴 스트림을 정상 종료(일부 결과)로 오인하지 않도록 호출자에게 그대로 전달
+        print(f"Error streaming articles for ticker: {stock_symbol} ({count}건 조회 후 실패). Error: {e}")
+        raise
+    print(f"스트리밍 조회된 row 수: {count}")
+
+def get_article_bodies(article_ids: list) -> dict:
+    """기사 id 목록으로 본문을 한 번에 조회 -> {article_id: article}"""
+    if not article_ids:
+        return {}
+    with get_sqlalchemy_engine().connect() as conn:
+        result = conn.execute(
+            text("SELECT id, article FROM kb_enterprise_dataset WHERE id = ANY(:article_ids)"),
+            {"article_ids": list(article_ids)}
+        )
+        return {row[0]: row[1] for row in result}
+
 def preprocess_text(text: str) -> list:
     """
     기사 본문에서 단어만 추출(대문자화, 구두점 제거)
@@ -53,48 +137,149 @@ def preprocess_text(text: str) -> list:
     words = text.split()
     return words
 
+def get_article_sentiment_detail(article: str) -> dict:
+    """
+    기사 1건의 감성점수와 카테고리별 count/sum (벡터화 계산기 사용)
+    반환 키: score, {pos,neg,uncertainty,litigious,constraining}_cnt, {...}_sum
+    """
+    return get_mcdonald_scorer().score(article)
+
+def get_article_sentiment_details(articles: list) -> list:
+    """여러 기사를 한 번에 점수화 (토큰화는 기사당 1회, 집계는 NumPy 1회)"""
+    return get_mcdonald_scorer().score_batch(articles)
+
 # 주어진 기사에 대한 감성 점수 계산 함수
 def get_sentiment_score_for_article(article: str) -> float:
-    words = preprocess_text(article)
-    positive_count = 0
-    negative_count = 0
-    uncertainty_count = 0
-    litigious_count = 0
-    constraining_count = 0
-    
-    for word in words:
-        word_info = get_mcdonald_word_info(word)
-        if word_info:
-            if word_info['positive'] > 0:
-                positive_count += 1
-            if word_info['negative'] > 0:
-                negative_count += 1
-            if word_info['uncertainty'] > 0:
-                uncertainty_count += 1
-            if word_info['litigious'] > 0:
-                litigious_count += 1
-            if word_info['constraining'] > 0:
-                constraining_count += 1
-    
-    total_count = positive_count + negative_count + uncertainty_count + litigious_count + constraining_count
+    detail = get_article_sentiment_detail(article)
+    total_count = detail['pos_cnt'] + detail['neg_cnt'] + detail['uncertainty_cnt'] + detail['litigious_cnt'] + detail['constraining_cnt']
     if total_count == 0:
         print("[WARNING] 감성 사전에 매칭되는 단어가 없습니다. 기사 감성점수 0 반환.")
         return 0.0
     
-    # 가중치 적용 (예시)
-    alpha = 1.0
-    beta = 1.0
-    gamma = 1.0
-    sentiment_score = (
-        positive_count - negative_count
-        - alpha * uncertainty_count
-        - beta * litigious_count
-        - gamma * constraining_count
-    ) / total_count
-    sentiment_score = round(sentiment_score, 3)
-    print(f"[DEBUG] 기사 감성점수: {sentiment_score} (pos_cnt: {positive_count}, neg_cnt: {negative_count}, uncertainty_cnt: {uncertainty_count}, litigious_cnt: {litigious_count}, constraining_cnt: {constraining_count})")
+    sentiment_score = detail['score']
+    print(f"[DEBUG] 기사 감성점수: {sentiment_score} (pos_cnt: {detail['pos_cnt']}, neg_cnt: {detail['neg_cnt']}, uncertainty_cnt: {detail['uncertainty_cnt']}, litigious_cnt: {detail['litigious_cnt']}, constraining_cnt: {detail['constraining_cnt']})")
     return sentiment_score
 
+def iter_scored_articles(stock_symbol: str, start_date: str = None, end_date: str = None, exclude_weeks: list = None):
+    """
+    기사를 스트리밍하면서 본문을 제외한 가벼운 dict로 yield 합니다.
+    (row_id, date, weekstart, score, pos_cnt, neg_cnt, article_title)
+    article_sentiment에 저장된 점수를 우선 사용하고, 없는 기사만 ARTICLE_STREAM_BATCH_SIZE 단위로
+    묶어 계산한 뒤 저장합니다.
+    """
+    rows = stream_articles_by_stock_symbol(stock_symbol, start_date, end_date, exclude_weeks=exclude_weeks)
+    symbol = str(stock_symbol).strip()
+    dict_version = None
+    while True:
+        chunk = list(islice(rows, ARTICLE_STREAM_BATCH_SIZE))
+        if not chunk:
+            break
+        
+        misses = [row for row in chunk if row[1] is not None]
+        details = {}
+        if misses:
+            dict_version = dict_version or get_mcdonald_dictionary_version()
+            pending = []
+            for row, detail in zip(misses, get_article_sentiment_details([row[1] for row in misses])):
+                article_id, _, date, week_start, _, _, _, _, content_hash = row
+                details[article_id] = detail
+                pending.append(build_record(article_id, symbol, date, week_start, content_hash, dict_version, detail))
+            _save_scores(pending)
+        
+        for article_id, article, date, week_start, article_title, score, pos_cnt, neg_cnt, _ in chunk:
+            if article is not None:
+                detail = details[article_id]
+                score, pos_cnt, neg_cnt = detail['score'], detail['pos_cnt'], detail['neg_cnt']
+            yield {
+                'row_id': article_id,
+                'date': date,
+                'weekstart': week_start,
+                'score': score,
+                'pos_cnt': pos_cnt,
+                'neg_cnt': neg_cnt,
+                'article_title': article_title
+            }
+
+def _save_scores(records: list):
+    """실시간으로 계산한 점수를 article_sentiment에 저장 (실패해도 응답에는 영향 없음)"""
+    if not records:
+        return
+    try:
+        upsert_article_sentiments(records)
+        # 점수가 새로 저장된 주차의 롤업은 다시 만들도록 삭제
+        invalidate_weekly_rollups((r['stock_symbol'], r['weekstart_sunday']) for r in records)
+    except Exception as e:
+        print(f"[WARNING] article_sentiment 저장 실패 ({len(records)}건): {e}")
+
+def _closeness_key(reference_score: float):
+    # 감성점수 차이가 적은 순, 동점이면 pos+neg count가 많은 순
+    return lambda x: (abs(x['score'] - reference_score), -(x['pos_cnt'] + x['neg_cnt']))
+
+def select_closest_articles(scored_articles, reference_score: float, n: int = 3) -> list:
+    """reference_score에 가장 가까운 n개 기사 (크기 n의 힙으로 선택, 정렬 기준은 top3 함수와 동일)"""
+    return heapq.nsmallest(n, scored_articles, key=_closeness_key(reference_score))
+
+def get_scored_articles_by_ids(article_ids: list, stock_symbol: str, dict_version: str) -> dict:
+    """
+    저장된 점수와 본문을 기사 id로 한 번에 조회 -> {article_id: dict} (롤업 top3 복원용)
+    article_sentiment에 현재 사전 버전/본문 해시의 점수가 없는 기사(점수 저장 실패 등)는 실시간으로 계산해 채우고 저장합니다.
+    """
+    if not article_ids:
+        return {}
+    with get_sqlalchemy_engine().connect() as conn:
+        result = conn.execute(
+            text("""
+                SELECT k.id, k.article, k.date, k.weekstart_sunday, k.article_title, s.score, s.pos_cnt, s.neg_cnt,
+                       md5(k.article)
+                FROM kb_enterprise_dataset k
+                LEFT JOIN article_sentiment s
+                       ON s.article_id = k.id
+                      AND s.dict_version = :dict_version
+                      AND s.content_hash = md5(k.article)
+                WHERE k.id = ANY(:article_ids)
+            """),
+            {"article_ids": list(article_ids), "dict_version": dict_version}
+        )
+        rows = result.fetchall()
+
+    articles = {}
+    misses = []
+    for row in rows:
+        articles[row[0]] = {
+            'row_id': row[0],
+            'article': row[1],
+            'date': row[2],
+            'weekstart': row[3],
+            'article_title': row[4],
+            'score': row[5],
+            'pos_cnt': row[6],
+            'neg_cnt': row[7]
+        }
+        if row[5] is None:
+            misses.append(row)
+
+    if misses:
+        print(f"[WARNING] 롤업 top3 기사 중 저장된 점수가 없는 {len(misses)}건은 실시간으로 계산합니다.")
+        records = []
+        symbol = str(stock_symbol).strip()
+        for row, detail in zip(misses, get_article_sentiment_details([row[1] or '' for row in misses])):
+            article_id, _, date, week_start, _, _, _, _, content_hash = row
+            articles[article_id].update(score=detail['score'], pos_cnt=detail['pos_cnt'], neg_cnt=detail['neg_cnt'])
+            records.append(build_record(article_id, symbol, date, week_start, content_hash, dict_version, detail))
+        # 롤업은 같은 사전 버전으로 계산된 것이므로 무효화하지 않고 점수만 저장
+        try:
+            upsert_article_sentiments(records)
+        except Exception as e:
+            print(f"[WARNING] article_sentiment 저장 실패 ({len(records)}건): {e}")
+    return articles
+
+def attach_article_bodies(scored_articles: list) -> list:
+    """본문 없이 선택된 기사들에 본문을 한 번의 쿼리로 채워 넣습니다."""
+    bodies = get_article_bodies([item['row_id'] for item in scored_articles])
+    for item in scored_articles:
+        item['article'] = bodies.get(item['row_id'], '')
+    return scored_articles
+
 def get_top3_articles_closest_to_weekly_score_from_list(articles, weekly_score):
     """
     기사 리스트에서 감성점수와 가장 가까운 3개 기사 반환
@@ -139,6 +324,75 @@ def get_top3_articles_closest_to_weekly_score_from_list(articles, weekly_score):
     ]
     return top3
 
+def aggregate_weekly_sentiment(scored_articles) -> dict:
+    """
+    weekstart 순으로 정렬된 점수 목록(iter_scored_articles)을 한 주씩 집계합니다.
+    현재 주의 (본문 없는) 점수 목록만 메모리에 유지합니다.
+    반환: {주차(YYYY-MM-DD): {'weekstart', 'weekly_score', 'article_count', 'top3'}} (top3는 본문 없는 dict)
+    """
+    weekly = {}
+    current_week = None
+    current_articles = []
+
+    def close_week():
+        weekly_score = round(sum(item['score'] for item in current_articles) / len(current_articles), 3)
+        weekly[current_week] = {
+            'weekstart': current_articles[0]['weekstart'],
+            'weekly_score': weekly_score,
+            'article_count': len(current_articles),
+            'top3': select_closest_articles(current_articles, weekly_score)
+        }
+
+    for item in scored_articles:
+        week_key = item['weekstart'].strftime('%Y-%m-%d')
+        if week_key != current_week:
+            if current_articles:
+                close_week()
+            current_week = week_key
+            current_articles = []
+        current_articles.append(item)
+    if current_articles:
+        close_week()
+    return weekly
+
+def _parse_date(value):
+    if not value:
+        return None
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+def _current_week_start():
+    """오늘이 포함된 주차의 weekstart (일요일)"""
+    today = datetime.now().date()
+    return today - timedelta(days=(today.weekday() + 1) % 7)
+
+def _full_week_bounds(start_date: str = None, end_date: str = None):
+    """
+    조회 구간에 7일이 모두 포함되는 주차의 weekstart 범위 (first, last), first가 None이면 제한 없음
+    (경계 주차는 구간 밖 기사가 빠지므로 롤업을 쓰지 않고 실시간 계산)
+    오늘이 포함된 주차는 아직 기사가 추가되므로, end_date가 없거나 미래여도 last는 그 이전 주차까지로 제한합니다.
+    """
+    start, end = _parse_date(start_date), _parse_date(end_date)
+    last_closed_week = _current_week_start() - timedelta(days=7)
+    return start, (min(end - timedelta(days=6), last_closed_week) if end else last_closed_week)
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+def _is_full_week(week_start, first_week, last_week) -> bool:
+    week = _as_date(week_start)
+    return (first_week is None or week >= first_week) and (last_week is None or week <= last_week)
+
+def _sundays_between(first_week, last_week) -> list:
+    """first_week ~ last_week 사이의 일요일 (주차 캐시 조회 대상, 구간이 열려 있으면 빈 목록)"""
+    if first_week is None or last_week is None:
+        return []
+    week = first_week + timedelta(days=(6 - first_week.weekday()) % 7)
+    weeks = []
+    while week <= last_week:
+        weeks.append(week)
+        week += timedelta(days=7)
+    return weeks
+
 # 주식 심볼에 대한 주차별 감성 점수 계산 함수
 def get_weekly_sentiment_scores_by_stock_symbol(stock_symbol: str, start_date: str = None, end_date: str = None):
     # start_date, end_date를 하루씩 추가하지 않고 그대로 사용
@@ -146,55 +400,97 @@ def get_weekly_sentiment_scores_by_stock_symbol(stock_symbol: str, start_date: s
     orig_end_date = end_date
     print(f"[DEBUG] 전달받은 값 - stock_symbol: {stock_symbol}, start_date: {start_date}, end_date: {end_date} (원본: {orig_start_date}, {orig_end_date})")
     try:
-        articles = get_articles_by_stock_symbol(stock_symbol, start_date, end_date)
-        weekly_scores = {}
-        weekly_counts = {}
-        weekly_articles = {}  # week별 기사 및 점수 정보 저장
-        for article, date, week_start, article_title in articles:
-            # score = 각 기사 별 감성 점수
-            score = get_sentiment_score_for_article(article)
-            words = preprocess_text(article)
-            pos_cnt, neg_cnt, pos_sum, neg_sum = 0, 0, 0.0, 0.0
-            
-            for word in words:
-                word_info = get_mcdonald_word_info(word)
-                if word_info:
-                    if word_info['positive'] > 0:
-                        pos_cnt += 1
-                        pos_sum += word_info['positive']
-                    if word_info['negative'] > 0:
-                        neg_cnt += 1
-                        neg_sum += word_info['negative']
-            
-            week_key = week_start.strftime('%Y-%m-%d')
-            if week_key not in weekly_scores:
-                weekly_scores[week_key] = 0.0
-                weekly_counts[week_key] = 0
-                weekly_articles[week_key] = []
-            weekly_scores[week_key] += score
-            weekly_counts[week_key] += 1
-            weekly_articles[week_key].append({
-                'article': article,
-                'date': date,
-                'weekstart': week_start,
-                'score': score,
-                'pos_cnt': pos_cnt,
-                'neg_cnt': neg_cnt,
-                'article_title': article_title
-            })
-        for week in weekly_scores:
-            weekly_scores[week] /= weekly_counts[week]
-            weekly_scores[week] = round(weekly_scores[week], 3)
-        print("주차별 평균 감성점수:", weekly_scores)
+        symbol = str(stock_symbol).strip()
+        dict_version = get_mcdonald_dictionary_version()
+
+        # 구간에 완전히 포함된 주차만 캐시/롤업 사용 (경계 주차는 항상 실시간 계산)
+        try:
+            first_week, last_week = _full_week_bounds(start_date, end_date)
+            use_full_weeks = first_week is None or last_week is None or first_week <= last_week
+        except ValueError as e:
+            print(f"[WARNING] 날짜 형식을 해석할 수 없어 주차 캐시/롤업을 사용하지 않습니다: {e}")
+            first_week = last_week = None
+            use_full_weeks = False
+
+        # 1) 주차 캐시 (프로세스 메모리)
+        candidate_weeks = _sundays_between(first_week, last_week) if use_full_weeks else []
+        cached = get_cached_weeks(symbol, candidate_weeks, dict_version)
+
+        # 2) weekly_sentiment_rollup (주차 수만큼의 행)
+        rollups = {}
+        rollup_ready = use_full_weeks and ensure_weekly_rollup_table()
+        if rollup_ready:
+            try:
+                rollups = {
+                    week: rollup
+                    for week, rollup in get_weekly_rollups(symbol, dict_version, first_week, last_week).items()
+                    if _as_date(week) not in cached
+                }
+            except Exception as e:
+                print(f"[WARNING] 주차별 감성 롤업 조회 실패, 실시간 계산으로 대체: {e}")
+
+        # 3) 나머지 주차만 기사 단위로 스트리밍 집계 (캐시/롤업 주차는 쿼리에서 제외)
+        # 스트림이 중간에 실패하면 예외가 그대로 전달되어 아래 롤업 저장/캐시 저장은 실행되지 않음
+        weekly = aggregate_weekly_sentiment(
+            iter_scored_articles(stock_symbol, start_date, end_date, exclude_weeks=list(cached) + list(rollups) or None)
+        )
+        if rollup_ready:
+            records = [
+                build_rollup_record(symbol, item['weekstart'], item['weekly_score'], item['article_count'],
+                                    [a['row_id'] for a in item['top3']], dict_version)
+                for item in weekly.values() if _is_full_week(item['weekstart'], first_week, last_week)
+            ]
+            try:
+                upsert_weekly_rollups(records)
+            except Exception as e:
+                print(f"[WARNING] 주차별 감성 롤업 저장 실패 ({len(records)}주): {e}")
 
-        # 각 주차별로 감성점수와 가장 가까운 3개 기사 추출 (DB 쿼리 없이)
+        # 롤업 주차의 top3는 id로 점수/본문을 한 번에 조회, 실시간 주차는 본문만 조회
+        rollup_articles = get_scored_articles_by_ids(
+            [article_id for rollup in rollups.values() for article_id in rollup['top3_article_ids']],
+            symbol, dict_version
+        )
+        attach_article_bodies([a for item in weekly.values() for a in item['top3']])
+        unresolved_weeks = set()
+        for week, rollup in rollups.items():
+            top3 = [rollup_articles[i] for i in rollup['top3_article_ids'] if i in rollup_articles]
+            if len(top3) < len(rollup['top3_article_ids']):
+                # 삭제된 기사 등으로 top3를 복원하지 못한 주차는 캐시하지 않음
+                print(f"[WARNING] {symbol} {week} 롤업 top3 기사 일부를 찾을 수 없습니다.")
+                unresolved_weeks.add(_as_date(week))
+            weekly[week.strftime('%Y-%m-%d')] = {
+                'weekstart': week,
+                'weekly_score': rollup['avg_score'],
+                'top3': top3
+            }
+
+        computed = {}
+        new_cache_entries = {}
+        for week_key, item in weekly.items():
+            computed[week_key] = {
+                'weekly_score': item['weekly_score'],
+                'top3_articles': get_top3_articles_closest_to_weekly_score_from_list(item['top3'], item['weekly_score'])
+            }
+            if _is_full_week(item['weekstart'], first_week, last_week) and _as_date(item['weekstart']) not in unresolved_weeks:
+                new_cache_entries[_as_date(item['weekstart'])] = copy_entry(computed[week_key])
+        if use_full_weeks:
+            # 기사가 없는 주차도 캐시해 다음 요청에서 다시 조회하지 않음
+            # (스트림이 끝까지 성공한 경우에만 여기까지 오므로 weekly에 없는 주차는 실제로 기사가 없는 주차)
+            for week in candidate_weeks:
+                if week not in cached and week not in new_cache_entries and week not in unresolved_weeks:
+                    new_cache_entries[week] = EMPTY_WEEK
+            cache_weeks(symbol, new_cache_entries, dict_version)
+        for week, entry in cached.items():
+            if entry is not EMPTY_WEEK:
+                computed[week.strftime('%Y-%m-%d')] = copy_entry(entry)
+
+        weekly_scores = {}
         weekly_top3_articles = {}
-        for week in weekly_scores:
-            top3 = get_top3_articles_closest_to_weekly_score_from_list(
-                weekly_articles[week], weekly_scores[week]
-            )
-            weekly_top3_articles[week] = top3
-        print(f"[DEBUG] {stock_symbol}의 주차별 감성점수: {weekly_scores}")
+        for week in sorted(computed):
+            weekly_scores[week] = computed[week]['weekly_score']
+            weekly_top3_articles[week] = computed[week]['top3_articles']
+        print("주차별 평균 감성점수:", weekly_scores)
+        print(f"[DEBUG] {stock_symbol}의 주차별 감성점수: {weekly_scores} (캐시 {len(cached)}주, 롤업 {len(rollups)}주)")
         print(f"[DEBUG] {stock_symbol}의 주차별 top3 기사: {weekly_top3_articles}")
         return {"weekly_scores": weekly_scores, "weekly_top3_articles": weekly_top3_articles}
     except Exception as e:
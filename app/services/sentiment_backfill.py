@@ -0,0 +1,241 @@
+"""
+article_sentiment 전체 백필 (멀티프로세스)
+
+사전 갱신 후 kb_enterprise_dataset 전체(모든 종목/주차)를 다시 점수화하는 배치 작업입니다.
+기사 테이블을 id 범위 또는 종목 단위 파티션으로 나눠 프로세스 풀에서 계산하고,
+COPY(기본) 또는 executemany로 저장합니다. 완료된 파티션은 체크포인트 파일에 기록되어
+중단 후 다시 실행하면 남은 파티션만 처리합니다. (파티션 내부도 이미 저장된 배치는 다시 계산하지 않음)
+
+사용법:
+    python -m app.services.sentiment_backfill [--workers 4] [--partition-by id|ticker]
+        [--partition-size 50000] [--batch-size 1000] [--write-mode copy|executemany] [--restart]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.services.article_sentiment import (
+    BACKFILL_BATCH_SIZE,
+    _pending_articles_query,
+    build_record,
+    copy_article_sentiments,
+    ensure_article_sentiment_table,
+    upsert_article_sentiments,
+)
+from app.services.cache_manager import CACHE_DIR, get_mcdonald_dictionary_version
+from app.services.weekly_sentiment import invalidate_weekly_rollups
+
+DEFAULT_PARTITION_SIZE = 50000
+DEFAULT_CHECKPOINT_FILE = os.path.join(CACHE_DIR, "sentiment_backfill_checkpoint.json")
+WRITE_MODES = ("copy", "executemany")
+
+
+def list_partitions(partition_by: str, partition_size: int = DEFAULT_PARTITION_SIZE) -> List[Dict]:
+    """
+    백필 파티션 목록
+    - id: [id_start, id_end) 범위 (partition_size 단위)
+    - ticker: 종목 단위
+    """
+    with get_sqlalchemy_engine().connect() as conn:
+        if partition_by == "ticker":
+            rows = conn.execute(text("""
+                SELECT DISTINCT stock_symbol FROM kb_enterprise_dataset
+                WHERE stock_symbol IS NOT NULL ORDER BY stock_symbol
+            """)).fetchall()
+            return [{"key": f"ticker:{row[0]}", "stock_symbol": row[0]} for row in rows]
+
+        min_id, max_id = conn.execute(text("SELECT min(id), max(id) FROM kb_enterprise_dataset")).fetchone()
+    if min_id is None:
+        return []
+    return [
+        {"key": f"id:{start}-{start + partition_size}", "id_start": start, "id_end": start + partition_size}
+        for start in range(min_id, max_id + 1, partition_size)
+    ]
+
+
+def load_checkpoint(path: str, dict_version: str, partition_by: str, partition_size: int) -> Dict:
+    """같은 사전 버전/파티션 설정의 체크포인트만 이어서 사용합니다."""
+    fresh = {
+        "dict_version": dict_version,
+        "partition_by": partition_by,
+        "partition_size": partition_size,
+        "completed": [],
+        "processed": 0,
+    }
+    if not os.path.exists(path):
+        return fresh
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except Exception as e:
+        print(f"[WARNING] 체크포인트 읽기 실패, 처음부터 시작합니다: {e}")
+        return fresh
+    if (checkpoint.get("dict_version"), checkpoint.get("partition_by"), checkpoint.get("partition_size")) != (
+        dict_version, partition_by, partition_size
+    ):
+        print("[INFO] 사전 버전 또는 파티션 설정이 달라 체크포인트를 새로 시작합니다.")
+        return fresh
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: Dict):
+    checkpoint["updated_at"] = datetime.now().isoformat()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _init_worker():
+    # 워커마다 사전(mmap)과 계산기를 미리 준비
+    from app.services.sentiment_scorer import get_mcdonald_scorer
+    get_mcdonald_scorer()
+
+
+def score_partition(partition: Dict, dict_version: str, batch_size: int, write_mode: str) -> Tuple[str, int, float]:
+    """
+    파티션 1개의 미계산/변경 기사를 점수화해 저장합니다. (워커 프로세스에서 실행)
+    반환: (파티션 key, 처리한 기사 수, 소요 시간 초)
+    """
+    from app.services.sentiment_scorer import get_mcdonald_scorer
+
+    scorer = get_mcdonald_scorer()
+    if scorer.version != dict_version:
+        raise RuntimeError(f"사전 버전 불일치 (worker={scorer.version}, job={dict_version})")
+
+    stock_symbol = partition.get("stock_symbol")
+    params = {"dict_version": dict_version}
+    if stock_symbol:
+        params["stock_symbol"] = stock_symbol
+    if "id_start" in partition:
+        params["id_start"] = partition["id_start"]
+        params["id_end"] = partition["id_end"]
+
+    start = time.time()
+    processed = 0
+    engine = get_sqlalchemy_engine()
+    with engine.connect() as read_conn:
+        result = read_conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            _pending_articles_query(stock_symbol, id_range="id_start" in partition), params
+        )
+        for rows in result.partitions():
+            details = scorer.score_batch([row[4] for row in rows])
+            records = [
+                build_record(article_id, symbol, date, week_start, content_hash, dict_version, detail)
+                for (article_id, symbol, date, week_start, _, content_hash), detail in zip(rows, details)
+            ]
+            # 배치마다 커밋 (중단되어도 저장된 배치는 다음 실행에서 제외됨)
+            with engine.begin() as write_conn:
+                if write_mode == "copy":
+                    copy_article_sentiments(records, write_conn)
+                else:
+                    upsert_article_sentiments(records, write_conn)
+            # 점수가 바뀐 주차의 롤업은 다음 조회/refresh 때 다시 계산
+            invalidate_weekly_rollups((r['stock_symbol'], r['weekstart_sunday']) for r in records)
+            processed += len(records)
+    return partition["key"], processed, time.time() - start
+
+
+def run_backfill(
+    workers: int = 4,
+    partition_by: str = "id",
+    partition_size: int = DEFAULT_PARTITION_SIZE,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    write_mode: str = "copy",
+    checkpoint_path: str = DEFAULT_CHECKPOINT_FILE,
+    restart: bool = False,
+) -> int:
+    """
+    전체 기사 백필을 실행합니다. 반환: 이번 실행에서 처리한 기사 수
+    """
+    if not ensure_article_sentiment_table():
+        return 0
+
+    dict_version = get_mcdonald_dictionary_version()
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = load_checkpoint(checkpoint_path, dict_version, partition_by, partition_size)
+    completed = set(checkpoint["completed"])
+
+    partitions = list_partitions(partition_by, partition_size)
+    pending = [p for p in partitions if p["key"] not in completed]
+    print(
+        f"[INFO] 감성점수 백필 시작 (dict_version={dict_version}, partition_by={partition_by}, "
+        f"파티션 {len(pending)}/{len(partitions)}개 남음, workers={workers}, write_mode={write_mode})"
+    )
+
+    start = time.time()
+    processed = 0
+    # spawn: 부모의 DB 커넥션/스레드를 물려받지 않도록 워커를 새로 시작
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(score_partition, partition, dict_version, batch_size, write_mode): partition["key"]
+            for partition in pending
+        }
+        try:
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    _, count, elapsed = future.result()
+                except Exception as e:
+                    # 실패한 파티션은 체크포인트에 남기지 않음 (다음 실행에서 재시도)
+                    print(f"[ERROR] 파티션 {key} 실패: {e}")
+                    continue
+
+                processed += count
+                completed.add(key)
+                checkpoint["completed"] = sorted(completed)
+                checkpoint["processed"] = checkpoint.get("processed", 0) + count
+                save_checkpoint(checkpoint_path, checkpoint)
+
+                total_elapsed = time.time() - start
+                print(
+                    f"[INFO] [{len(completed)}/{len(partitions)}] {key}: {count:,}건 "
+                    f"({count / elapsed if elapsed else 0:.1f} articles/sec) | "
+                    f"누적 {processed:,}건, {processed / total_elapsed:.1f} articles/sec"
+                )
+        except KeyboardInterrupt:
+            print("[WARNING] 중단됨. 완료된 파티션은 체크포인트에 저장되어 있습니다.")
+            for future in futures:
+                future.cancel()
+            raise
+
+    total_elapsed = time.time() - start
+    print(
+        f"[INFO] 감성점수 백필 완료: {processed:,}건, {total_elapsed:.1f}s "
+        f"({processed / total_elapsed if total_elapsed else 0:.1f} articles/sec), "
+        f"남은 파티션 {len(partitions) - len(completed)}개"
+    )
+    return processed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="article_sentiment 전체 백필 (멀티프로세스, 체크포인트)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--partition-by", choices=("id", "ticker"), default="id")
+    parser.add_argument("--partition-size", type=int, default=DEFAULT_PARTITION_SIZE, help="id 파티션 크기")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="커밋 단위 기사 수")
+    parser.add_argument("--write-mode", choices=WRITE_MODES, default="copy")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT_FILE, help="체크포인트 파일 경로")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 실행")
+    args = parser.parse_args()
+
+    run_backfill(
+        workers=args.workers,
+        partition_by=args.partition_by,
+        partition_size=args.partition_size,
+        batch_size=args.batch_size,
+        write_mode=args.write_mode,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+    )
@@ -0,0 +1,109 @@
+"""
+McDonald 감성점수 벡터화 계산기
+
+기사마다 토큰화를 1회만 수행한 뒤 여러 기사의 토큰을 이어붙여 mmap 사전(McDonaldDictionary)에서
+한 번에 이진 탐색하고, 5개 카테고리의 count/sum을 NumPy 연산으로 계산합니다.
+결과는 기존 단어별 get_mcdonald_word_info 조회 방식과 동일합니다. (benchmarks/sentiment_scorer_benchmark.py로 검증)
+"""
+import re
+import threading
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.services.cache_manager import (
+    McDonaldDictionary,
+    get_mcdonald_dictionary_version,
+    load_mcdonald_dictionary,
+)
+
+# 사전의 카테고리 키와 결과 필드 접두어 (MCDONALD_CATEGORIES와 같은 순서)
+CATEGORIES = (
+    ('positive', 'pos'),
+    ('negative', 'neg'),
+    ('uncertainty', 'uncertainty'),
+    ('litigious', 'litigious'),
+    ('constraining', 'constraining'),
+)
+
+# 가중치 (sentiment.get_sentiment_score_for_article과 동일)
+ALPHA = 1.0
+BETA = 1.0
+GAMMA = 1.0
+
+_NON_WORD = re.compile(r'[^A-Z0-9\s]')
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def tokenize(article: str) -> List[str]:
+    """sentiment.preprocess_text와 동일한 토큰화 (대문자화, 영문/숫자/공백 외 제거)"""
+    return _NON_WORD.sub('', article.upper()).split()
+
+
+class McDonaldScorer:
+    """mmap McDonald 사전(단어 테이블 + 카테고리 비트마스크/값)으로 기사 묶음을 한 번에 점수화합니다."""
+
+    def __init__(self, dictionary: McDonaldDictionary, version: str = None):
+        self.version = version
+        self.dictionary = dictionary
+        self._bits = np.arange(len(CATEGORIES), dtype=np.uint8)
+
+    def score_batch(self, articles: Sequence[str]) -> List[Dict]:
+        """
+        기사 목록의 감성점수와 카테고리별 count/sum을 반환합니다.
+        반환 dict 키: score, {pos,neg,uncertainty,litigious,constraining}_cnt, {...}_sum
+        """
+        n = len(articles)
+        if n == 0:
+            return []
+
+        tokens_per_article = [tokenize(article) for article in articles]
+        lengths = np.fromiter((len(tokens) for tokens in tokens_per_article), dtype=np.int64, count=n)
+        tokens = [token for article_tokens in tokens_per_article for token in article_tokens]
+        owner = np.repeat(np.arange(n), lengths)
+
+        # 사전에 있는 토큰만 남김
+        idx = self.dictionary.lookup(tokens)
+        hit = idx >= 0
+        idx, owner = idx[hit], owner[hit]
+
+        # 양수인 값만 count/sum에 반영 (flags 비트 j = 카테고리 j 값이 양수)
+        matched = (self.dictionary.flags[idx, None] >> self._bits) & 1
+        weights = np.where(matched, self.dictionary.values[idx], 0.0)
+        counts = np.empty((n, len(CATEGORIES)), dtype=np.int64)
+        sums = np.empty((n, len(CATEGORIES)), dtype=np.float64)
+        for j in range(len(CATEGORIES)):
+            counts[:, j] = np.bincount(owner, weights=matched[:, j], minlength=n)
+            sums[:, j] = np.bincount(owner, weights=weights[:, j], minlength=n)
+
+        pos, neg, unc, lit, con = counts.T
+        total = counts.sum(axis=1)
+        numerator = pos - neg - ALPHA * unc - BETA * lit - GAMMA * con
+
+        results = []
+        for i in range(n):
+            score = round(float(numerator[i]) / int(total[i]), 3) if total[i] else 0.0
+            detail = {'score': score}
+            for j, (_, prefix) in enumerate(CATEGORIES):
+                detail[f"{prefix}_cnt"] = int(counts[i, j])
+            for j, (_, prefix) in enumerate(CATEGORIES):
+                detail[f"{prefix}_sum"] = float(sums[i, j])
+            results.append(detail)
+        return results
+
+    def score(self, article: str) -> Dict:
+        return self.score_batch([article])[0]
+
+
+def get_mcdonald_scorer() -> McDonaldScorer:
+    """현재 사전 버전의 McDonaldScorer (사전이 갱신되면 다시 생성)"""
+    global _scorer
+    version = get_mcdonald_dictionary_version()
+    if _scorer is not None and _scorer.version == version:
+        return _scorer
+    with _scorer_lock:
+        if _scorer is None or _scorer.version != version:
+            _scorer = McDonaldScorer(load_mcdonald_dictionary(), version)
+    return _scorer
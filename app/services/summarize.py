@@ -1,40 +1,33 @@
 import pandas as pd
-from transformers import pipeline, AutoTokenizer
-import torch
 from app.db.connection import get_sqlalchemy_engine
 from app.services.sentiment import get_weekly_sentiment_scores_by_stock_symbol, get_weekly_top3_articles_by_stock_symbol
+from app.core.config import settings
+from app.services.inference_backend import model_variant, summarizer_backend
+from app.services.nlp_models import BART_MODEL_NAME, get_bart_tokenizer, get_summarizer
+from app.services.summary_cache import article_hash, get_cached_summaries, save_summaries
 from dotenv import load_dotenv
 import openai
 import os
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from summa.summarizer import summarize as extractive_summarize
 from sqlalchemy import text 
 
-CACHE_DIR = os.getenv("HF_HOME")
-
 # .env에서 OPENAI_API_KEY 불러오기
 load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
-try:
-    model_name = "facebook/bart-large-cnn"
-    
-    tokenizer = AutoTokenizer.from_pretrained(
-        model_name,
-        cache_dir=CACHE_DIR
-    )
-    
-    device = 0 if torch.cuda.is_available() else -1
-    summarizer = pipeline(
-        "summarization",
-        model=model_name,
-        tokenizer=tokenizer, 
-        device=device
-    )
-except Exception as e:
-    print(f"Summarization 모델 또는 토크나이저 로딩 중 오류 발생: {e}")
-    tokenizer = None
-    summarizer = None
-    raise
+# BART 요약 파이프라인/토크나이저는 nlp_models의 레지스트리에서 처음 요약할 때 로드됩니다.
+
+# 기사 요약문 번역(OpenAI) 동시 호출 수 (요청 1건 기준)
+TRANSLATION_MAX_WORKERS = 8
+TRANSLATION_MODEL = "gpt-3.5-turbo"
+
+# 요약 캐시 키 버전: kor_summary 프롬프트나 길이 분류/max_length 계산을 바꾸면 올려야 기존 캐시를 쓰지 않음
+TRANSLATION_PROMPT_VERSION = "v1"
+SUMMARY_PARAMS_VERSION = "v1"
 
 ratio_map = {
     "medium": 0.7,
@@ -62,7 +55,7 @@ def kor_summary(text: str) -> str:
         f"{text}"
     )
     response = openai.chat.completions.create(
-        model="gpt-3.5-turbo",
+        model=TRANSLATION_MODEL,
         messages=[
             {"role": "system", "content": system_msg},
             {"role": "user",   "content": user_msg},
@@ -74,6 +67,141 @@ def kor_summary(text: str) -> str:
     return kor_final_summary
 
 
+def summarizer_cache_key() -> str:
+    """요약 모델(백엔드 포함) + 요약 파라미터 (summary_cache 키)"""
+    params = {
+        "version": SUMMARY_PARAMS_VERSION,
+        "ratio_map": ratio_map,
+        "max_length_bucket": settings.SUMMARY_MAX_LENGTH_BUCKET,
+    }
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return f"{model_variant(BART_MODEL_NAME, summarizer_backend())}:{digest}"
+
+
+def translation_cache_key() -> str:
+    """번역 모델 + 프롬프트 버전 (summary_cache 키)"""
+    return f"{TRANSLATION_MODEL}:{TRANSLATION_PROMPT_VERSION}"
+
+
+def classify_length(token_count):
+    if token_count <= 200:
+        return "short"
+    elif token_count <= 700:
+        return "medium"
+    elif token_count <= 1000:
+        return "long"
+    else:
+        return "very_long"
+
+
+def _bucket_max_length(max_len):
+    """SUMMARY_MAX_LENGTH_BUCKET 단위로 max_length를 올림 (같은 배치로 묶일 기사를 늘림, 0이면 그대로)"""
+    bucket = settings.SUMMARY_MAX_LENGTH_BUCKET
+    if bucket <= 0:
+        return max_len
+    return -(-max_len // bucket) * bucket
+
+
+def run_summarizer_jobs(jobs, batch_size=None, summarizer=None):
+    """
+    BART 요약 작업 목록을 배치로 실행합니다.
+    jobs: [(text, max_length, min_length), ...] -> [summary_text, ...] (같은 순서)
+    (max_length, min_length)가 같은 작업끼리 토큰 길이순으로 정렬해 배치를 만들어 패딩을 최소화합니다.
+    summarizer를 넘기면 레지스트리 모델 대신 사용합니다. (백엔드 비교 벤치마크용)
+    """
+    if not jobs:
+        return []
+    tokenizer = get_bart_tokenizer()
+    summarizer = summarizer or get_summarizer()
+    batch_size = batch_size or settings.SUMMARY_BATCH_SIZE
+
+    groups = defaultdict(list)
+    for i, (_, max_len, min_len) in enumerate(jobs):
+        groups[(max_len, min_len)].append(i)
+
+    results = [None] * len(jobs)
+    for (max_len, min_len), idxs in groups.items():
+        # 입력은 truncation=True로 잘리므로 정렬 기준도 잘린 길이
+        lengths = {i: len(tokenizer.encode(jobs[i][0], truncation=True)) for i in idxs}
+        idxs.sort(key=lengths.get)
+        for start in range(0, len(idxs), batch_size):
+            batch = idxs[start:start + batch_size]
+            outputs = summarizer(
+                [jobs[i][0] for i in batch],
+                max_length=max_len,
+                min_length=min_len,
+                truncation=True,
+                batch_size=len(batch)
+            )
+            for i, output in zip(batch, outputs):
+                if isinstance(output, list):
+                    output = output[0]
+                results[i] = output["summary_text"]
+    return results
+
+
+def english_summaries(texts, batch_size=None, on_ready=None, summarizer=None):
+    """
+    기사 목록의 영문 요약을 반환합니다.
+    1) 기사별 길이 분류 + 추출 요약(summa)
+    2) medium/long 기사와 very_long 기사의 1000토큰 청크를 한 번에 배치 요약
+    3) very_long 기사의 청크 요약을 합쳐 최종 요약 (배치)
+    on_ready(i, summary): 기사 i의 요약이 확정되는 즉시 호출 (번역을 먼저 시작하기 위함)
+    """
+    tokenizer = get_bart_tokenizer()
+    texts = list(texts)
+    summaries = [None] * len(texts)
+
+    def finish(i, summary):
+        summaries[i] = summary
+        if on_ready is not None:
+            on_ready(i, summary)
+
+    def count_tokens(text):
+        if pd.isnull(text) or not isinstance(text, str) or not tokenizer:
+            return 0
+        return len(tokenizer.encode(text, truncation=False))
+
+    jobs, owners = [], []
+    very_long_chunks = defaultdict(list)
+    for i, text in enumerate(texts):
+        tokens = count_tokens(text)
+        cls    = classify_length(tokens)
+
+        if cls == "short":
+            finish(i, text)
+            continue
+
+        extract_text = extractive_summarize(text, ratio=ratio_map[cls])
+        if cls in ("medium", "long"):
+            max_len = max(50, int(tokens * 0.2)) if cls == "medium" else max(75, int(tokens * 0.15))
+            jobs.append((extract_text, _bucket_max_length(max_len), 50))
+            owners.append(i)
+        else:  # very_long
+            token_ids = tokenizer.encode(extract_text, truncation=False)
+            chunk_size = 1000
+            for j in range(0, len(token_ids), chunk_size):
+                jobs.append((tokenizer.decode(token_ids[j:j+chunk_size]), 200, 75))
+                owners.append(i)
+                very_long_chunks[i].append(len(jobs) - 1)
+
+    outputs = run_summarizer_jobs(jobs, batch_size, summarizer)
+
+    final_jobs, final_owners = [], []
+    for i in sorted(set(owners)):
+        if i in very_long_chunks:
+            combined = " ".join(outputs[j] for j in very_long_chunks[i])
+            final_jobs.append((combined, 200, 75))
+            final_owners.append(i)
+    for i, output in zip(owners, outputs):
+        if i not in very_long_chunks:
+            finish(i, output)
+
+    for i, output in zip(final_owners, run_summarizer_jobs(final_jobs, batch_size, summarizer)):
+        finish(i, output)
+    return summaries
+
+
 def summarize_top3_articles(top3_articles):
     """
     top3_articles: [(article, date, weekstart_sunday, article_score, pos_cnt, neg_cnt), ...]
@@ -89,76 +217,55 @@ def summarize_top3_articles(top3_articles):
             'summary': summary
         }, ...
     ]
+    영문 요약은 english_summaries에서 길이별 배치로 만들고, 요약이 끝난 기사부터 번역(OpenAI 호출)을 병렬로 진행합니다.
+    요약 결과는 summary_cache에 저장되어 같은 기사는 다시 요약/번역하지 않습니다.
     """
-    
-    def count_tokens(text):
-        if pd.isnull(text) or not isinstance(text, str) or not tokenizer:
-            return 0
-        return len(tokenizer.encode(text, truncation=False))
+    if not top3_articles:
+        return []
 
-    def classify_length(token_count):
-        if token_count <= 200:
-            return "short"
-        elif token_count <= 700:
-            return "medium"
-        elif token_count <= 1000:
-            return "long"
-        else:
-            return "very_long"
+    # 1) 요약 캐시 조회 (한국어 요약까지 있으면 모델/OpenAI 호출 없이 반환)
+    summarizer_key, translation_key = summarizer_cache_key(), translation_cache_key()
+    hashes = [article_hash(item['article'] or '') for item in top3_articles]
+    cached_kor, cached_eng = get_cached_summaries(hashes, summarizer_key, translation_key)
+    summaries = [cached_kor.get(h) for h in hashes]
+    pending = [i for i, summary in enumerate(summaries) if summary is None]
+    if not pending:
+        print(f"[INFO] 요약 캐시 사용: {len(top3_articles)}건")
+        return [{**item, 'summary': summary} for item, summary in zip(top3_articles, summaries)]
 
-    def summarize_by_length(text):
-        if not summarizer:
-            return "요약 모델을 로드할 수 없어 요약을 생성할 수 없습니다."
+    # 2) 영문 요약이 없는 기사만 BART로 요약 (번역 설정만 바뀐 기사는 저장된 영문 요약을 번역)
+    need_bart = [i for i in pending if hashes[i] not in cached_eng]
+    if need_bart and not get_summarizer():
+        for i in need_bart:
+            summaries[i] = "요약 모델을 로드할 수 없어 요약을 생성할 수 없습니다."
+        need_bart = []
 
-        tokens = count_tokens(text)
-        cls    = classify_length(tokens)
+    eng_by_index, futures = {}, {}
+    with ThreadPoolExecutor(max_workers=min(len(pending), TRANSLATION_MAX_WORKERS),
+                            thread_name_prefix="kor-summary") as pool:
+        def translate(i, eng_summary):
+            eng_by_index[i] = eng_summary
+            futures[i] = pool.submit(kor_summary, eng_summary)
 
-        if cls == "short":
-            eng_summary = text
-        else:
-            ratio = ratio_map[cls]
-            extract_text = extractive_summarize(text, ratio=ratio)
-
-            if cls in ("medium", "long"):
-                max_len = max(50, int(tokens * 0.2)) if cls == "medium" else max(75, int(tokens * 0.15))
-                eng_summary = summarizer(
-                    extract_text,
-                    max_length=max_len,
-                    min_length=50,
-                    truncation=True
-                )[0]["summary_text"]
-            else:  # very_long
-                token_ids = tokenizer.encode(extract_text, truncation=False)
-                chunk_size = 1000
-                chunks = [
-                    tokenizer.decode(token_ids[i:i+chunk_size])
-                    for i in range(0, len(token_ids), chunk_size)
-                ]
-                interim = [
-                    summarizer(
-                        chunk,
-                        max_length=200,
-                        min_length=75,
-                        truncation=True
-                    )[0]["summary_text"]
-                    for chunk in chunks
-                ]
-                combined = " ".join(interim)
-                eng_summary = summarizer(
-                    combined,
-                    max_length=200,
-                    min_length=75,
-                    truncation=True
-                )[0]["summary_text"]
-        
-        return kor_summary(eng_summary)
+        for i in pending:
+            if hashes[i] in cached_eng:
+                translate(i, cached_eng[hashes[i]])
+        if need_bart:
+            english_summaries(
+                [top3_articles[i]['article'] for i in need_bart],
+                on_ready=lambda j, eng_summary: translate(need_bart[j], eng_summary)
+            )
+        for i, future in futures.items():
+            summaries[i] = future.result()
+
+    # 3) 새로 만든 요약 저장
+    save_summaries([
+        {"article_hash": hashes[i], "eng_summary": eng_by_index[i], "kor_summary": summaries[i]}
+        for i in futures
+    ], summarizer_key, translation_key)
 
     results = []
-    for item in top3_articles:
-        article = item['article']
-        
-        summary = summarize_by_length(article)
-        
+    for item, summary in zip(top3_articles, summaries):
         new_item = item.copy()
         new_item['summary'] = summary
         results.append(new_item)
@@ -168,13 +275,16 @@ def summarize_top3_articles(top3_articles):
 def get_weekly_top3_summaries(stock_symbol: str, start_date: str, end_date: str):
     """
     주어진 기간 동안의 주차별 상위 3개 기사와 요약을 반환합니다.
+    (모든 주차의 기사를 한 번에 요약해 번역 호출이 주차를 넘어 병렬로 진행됨)
     """
     weekly_top3_articles = get_weekly_top3_articles_by_stock_symbol(stock_symbol, start_date, end_date)
-    
+
+    all_articles = [article for articles in weekly_top3_articles.values() for article in articles]
+    summarized = iter(summarize_top3_articles(all_articles))
+
     summarized_weekly_articles = {}
     for week, articles in weekly_top3_articles.items():
-        summarized_articles = summarize_top3_articles(articles)
-        summarized_weekly_articles[week] = summarized_articles
+        summarized_weekly_articles[week] = [next(summarized) for _ in articles]
         
     return summarized_weekly_articles
 
@@ -0,0 +1,90 @@
+"""
+기사 요약 영구 캐시 (article_summary_cache 테이블)
+
+(기사 본문 해시, 요약 설정 키, 번역 설정 키)별로 BART 영문 요약과 한국어 번역 요약을 저장합니다.
+- 요약 설정 키: 요약 모델 이름 + 길이 분류/비율/max_length 파라미터 해시 (summarize.summarizer_cache_key)
+- 번역 설정 키: 번역 모델 + 프롬프트 버전 (summarize.translation_cache_key)
+번역 프롬프트만 바뀐 경우 저장된 영문 요약을 재사용해 번역만 다시 합니다.
+"""
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
+from app.db.table_setup import ensure_table
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS article_summary_cache (
+        article_hash TEXT NOT NULL,
+        summarizer_key TEXT NOT NULL,
+        translation_key TEXT NOT NULL,
+        eng_summary TEXT NOT NULL,
+        kor_summary TEXT NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (article_hash, summarizer_key, translation_key)
+    )
+"""
+
+UPSERT_SQL = text("""
+    INSERT INTO article_summary_cache (article_hash, summarizer_key, translation_key, eng_summary, kor_summary)
+    VALUES (:article_hash, :summarizer_key, :translation_key, :eng_summary, :kor_summary)
+    ON CONFLICT (article_hash, summarizer_key, translation_key) DO UPDATE SET
+        eng_summary = EXCLUDED.eng_summary,
+        kor_summary = EXCLUDED.kor_summary,
+        created_at = now()
+""")
+
+
+def article_hash(article: str) -> str:
+    return hashlib.sha256(article.encode('utf-8')).hexdigest()
+
+
+def ensure_summary_cache_table() -> bool:
+    """article_summary_cache 테이블이 없으면 생성합니다. 실패하거나 비활성화되어 있으면 False (항상 새로 요약)"""
+    if not settings.SUMMARY_CACHE_ENABLED:
+        return False
+    return ensure_table("article_summary_cache", CREATE_TABLE_SQL)
+
+
+def get_cached_summaries(hashes: Iterable[str], summarizer_key: str,
+                         translation_key: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    저장된 요약 조회
+    반환: ({해시: 한국어 요약} (번역 설정까지 일치), {해시: 영문 요약} (요약 설정만 일치))
+    """
+    hashes = list(set(hashes))
+    if not hashes or not ensure_summary_cache_table():
+        return {}, {}
+    try:
+        with get_sqlalchemy_engine().connect() as conn:
+            rows = conn.execute(text("""
+                SELECT article_hash, translation_key, eng_summary, kor_summary
+                FROM article_summary_cache
+                WHERE article_hash = ANY(:hashes) AND summarizer_key = :summarizer_key
+            """), {"hashes": hashes, "summarizer_key": summarizer_key}).fetchall()
+    except Exception as e:
+        print(f"[WARNING] 요약 캐시 조회 실패: {e}")
+        return {}, {}
+
+    korean, english = {}, {}
+    for hash_, row_translation_key, eng_summary, kor_summary in rows:
+        english[hash_] = eng_summary
+        if row_translation_key == translation_key:
+            korean[hash_] = kor_summary
+    return korean, english
+
+
+def save_summaries(records: List[Dict], summarizer_key: str, translation_key: str):
+    """records: [{'article_hash', 'eng_summary', 'kor_summary'}, ...] 저장 (실패해도 응답에는 영향 없음)"""
+    if not records or not ensure_summary_cache_table():
+        return
+    try:
+        with get_sqlalchemy_engine().begin() as conn:
+            conn.execute(UPSERT_SQL, [
+                {**record, "summarizer_key": summarizer_key, "translation_key": translation_key}
+                for record in records
+            ])
+    except Exception as e:
+        print(f"[WARNING] 요약 캐시 저장 실패 ({len(records)}건): {e}")
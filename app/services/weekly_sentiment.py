@@ -0,0 +1,185 @@
+"""
+주차별 감성점수 롤업 (weekly_sentiment_rollup 테이블)
+
+(stock_symbol, weekstart_sunday)별 평균 감성점수, 기사 수, 평균에 가장 가까운 top3 기사 id를 저장합니다.
+get_weekly_sentiment_scores_by_stock_symbol은 조회 구간에 완전히 포함된 주차를 이 테이블에서 읽고,
+나머지 주차(구간 경계 주차, 아직 롤업이 없는 주차)만 기사 단위로 계산합니다.
+계산한 완전한 주차는 그 자리에서 롤업에 저장됩니다.
+
+점수가 다시 계산된 주차(백필)는 롤업에서 삭제되어 다음 조회/refresh 때 다시 만들어지고,
+새 기사가 들어온 주차는 refresh 명령이 기사 수 비교로 찾아 갱신합니다.
+
+사용법:
+    python -m app.services.weekly_sentiment refresh [--symbol GS]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.db.table_setup import ensure_table
+from app.services.weekly_sentiment_cache import weekly_sentiment_cache
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS weekly_sentiment_rollup (
+        stock_symbol TEXT NOT NULL,
+        weekstart_sunday DATE NOT NULL,
+        avg_score DOUBLE PRECISION NOT NULL,
+        article_count INTEGER NOT NULL,
+        top3_article_ids BIGINT[] NOT NULL,
+        dict_version TEXT NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        PRIMARY KEY (stock_symbol, weekstart_sunday)
+    )
+"""
+
+UPSERT_SQL = text("""
+    INSERT INTO weekly_sentiment_rollup
+        (stock_symbol, weekstart_sunday, avg_score, article_count, top3_article_ids, dict_version, updated_at)
+    VALUES (:stock_symbol, :weekstart_sunday, :avg_score, :article_count, :top3_article_ids, :dict_version, now())
+    ON CONFLICT (stock_symbol, weekstart_sunday) DO UPDATE SET
+        avg_score = EXCLUDED.avg_score,
+        article_count = EXCLUDED.article_count,
+        top3_article_ids = EXCLUDED.top3_article_ids,
+        dict_version = EXCLUDED.dict_version,
+        updated_at = now()
+""")
+
+# 롤업이 없거나, 사전 버전이 다르거나, 기사 수가 달라진 주차
+STALE_WEEKS_SQL = """
+    SELECT c.stock_symbol, c.weekstart_sunday
+    FROM (
+        SELECT stock_symbol, weekstart_sunday, count(*) AS article_count
+        FROM kb_enterprise_dataset
+        WHERE article IS NOT NULL AND article != '' AND weekstart_sunday IS NOT NULL
+          {conditions}
+        GROUP BY stock_symbol, weekstart_sunday
+    ) c
+    LEFT JOIN weekly_sentiment_rollup r
+      ON r.stock_symbol = c.stock_symbol AND r.weekstart_sunday = c.weekstart_sunday
+    WHERE r.stock_symbol IS NULL OR r.dict_version <> :dict_version OR r.article_count <> c.article_count
+    ORDER BY c.stock_symbol, c.weekstart_sunday
+"""
+
+
+def ensure_weekly_rollup_table() -> bool:
+    """weekly_sentiment_rollup 테이블이 없으면 생성합니다. 실패 시 False (조회는 실시간 계산으로 동작)"""
+    return ensure_table("weekly_sentiment_rollup", CREATE_TABLE_SQL)
+
+
+def get_weekly_rollups(stock_symbol: str, dict_version: str, first_week=None, last_week=None) -> Dict:
+    """
+    현재 사전 버전의 롤업 조회 (first_week <= weekstart_sunday <= last_week, None이면 제한 없음)
+    반환: {weekstart_sunday(date): {'avg_score', 'article_count', 'top3_article_ids'}}
+    """
+    conditions = ["stock_symbol = :stock_symbol", "dict_version = :dict_version"]
+    params = {"stock_symbol": stock_symbol, "dict_version": dict_version}
+    if first_week is not None:
+        conditions.append("weekstart_sunday >= :first_week")
+        params["first_week"] = first_week
+    if last_week is not None:
+        conditions.append("weekstart_sunday <= :last_week")
+        params["last_week"] = last_week
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text(f"""
+            SELECT weekstart_sunday, avg_score, article_count, top3_article_ids
+            FROM weekly_sentiment_rollup
+            WHERE {" AND ".join(conditions)}
+            ORDER BY weekstart_sunday
+        """), params).fetchall()
+    return {
+        week: {"avg_score": avg_score, "article_count": article_count, "top3_article_ids": list(top3_ids)}
+        for week, avg_score, article_count, top3_ids in rows
+    }
+
+
+def build_rollup_record(stock_symbol: str, weekstart_sunday, avg_score: float, article_count: int,
+                        top3_article_ids: List[int], dict_version: str) -> Dict:
+    return {
+        "stock_symbol": stock_symbol,
+        "weekstart_sunday": weekstart_sunday,
+        "avg_score": avg_score,
+        "article_count": article_count,
+        "top3_article_ids": list(top3_article_ids),
+        "dict_version": dict_version,
+    }
+
+
+def upsert_weekly_rollups(records: List[Dict]):
+    if not records:
+        return
+    with get_sqlalchemy_engine().begin() as conn:
+        conn.execute(UPSERT_SQL, records)
+
+
+def invalidate_weekly_rollups(weeks: Iterable[Tuple[str, object]]):
+    """점수가 바뀐 (stock_symbol, weekstart_sunday) 주차의 롤업과 주차 캐시 항목을 삭제합니다."""
+    weeks = sorted({(symbol, week) for symbol, week in weeks if week is not None})
+    weekly_sentiment_cache.invalidate(
+        (symbol, week.date() if isinstance(week, datetime) else week) for symbol, week in weeks
+    )
+    if not weeks or not ensure_weekly_rollup_table():
+        return
+    with get_sqlalchemy_engine().begin() as conn:
+        conn.execute(
+            text("""
+                DELETE FROM weekly_sentiment_rollup r
+                USING unnest(CAST(:symbols AS TEXT[]), CAST(:weeks AS DATE[])) AS w(stock_symbol, weekstart_sunday)
+                WHERE r.stock_symbol = w.stock_symbol AND r.weekstart_sunday = w.weekstart_sunday
+            """),
+            {"symbols": [symbol for symbol, _ in weeks], "weeks": [week for _, week in weeks]}
+        )
+
+
+def refresh_weekly_rollups(stock_symbol: Optional[str] = None) -> int:
+    """
+    롤업이 없거나 오래된 주차만 다시 계산합니다. (기사 점수는 article_sentiment 재사용, 없는 기사만 계산)
+    반환: 갱신한 주차 수
+    """
+    from app.services.cache_manager import get_mcdonald_dictionary_version
+    from app.services.sentiment import aggregate_weekly_sentiment, iter_scored_articles
+
+    if not ensure_weekly_rollup_table():
+        return 0
+
+    dict_version = get_mcdonald_dictionary_version()
+    params = {"dict_version": dict_version}
+    conditions = ""
+    if stock_symbol:
+        conditions = "AND stock_symbol = :stock_symbol"
+        params["stock_symbol"] = stock_symbol
+    with get_sqlalchemy_engine().connect() as conn:
+        stale = conn.execute(text(STALE_WEEKS_SQL.format(conditions=conditions)), params).fetchall()
+
+    print(f"[INFO] 주차별 감성 롤업 갱신 대상: {len(stale)}주 (stock_symbol={stock_symbol or 'ALL'})")
+    start = time.time()
+    refreshed = 0
+    for symbol, week in stale:
+        week_end = week + timedelta(days=6)
+        weekly = aggregate_weekly_sentiment(
+            iter_scored_articles(symbol, week.strftime('%Y-%m-%d'), week_end.strftime('%Y-%m-%d'))
+        )
+        records = [
+            build_rollup_record(symbol, week, item['weekly_score'], item['article_count'],
+                                [a['row_id'] for a in item['top3']], dict_version)
+            for item in weekly.values() if item['weekstart'] == week
+        ]
+        upsert_weekly_rollups(records)
+        refreshed += len(records)
+    print(f"[INFO] 주차별 감성 롤업 갱신 완료: {refreshed}주, {time.time() - start:.1f}s")
+    return refreshed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="weekly_sentiment_rollup 테이블 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = subparsers.add_parser("refresh", help="없거나 오래된 주차 롤업 갱신")
+    refresh_parser.add_argument("--symbol", default=None, help="특정 종목만 처리")
+
+    args = parser.parse_args()
+    if args.command == "refresh":
+        refresh_weekly_rollups(args.symbol)
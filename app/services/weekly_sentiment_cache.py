@@ -0,0 +1,117 @@
+"""
+주차 단위 감성 결과 인메모리 캐시 (LRU)
+
+(stock_symbol, weekstart_sunday)별 주차 평균 감성점수와 top3 기사(본문 포함)를 보관합니다.
+get_weekly_sentiment_scores_by_stock_symbol은 조회 구간에 완전히 포함된 주차를 먼저 이 캐시에서 찾고,
+없는 주차만 롤업/기사 단위로 계산합니다. 기사가 없는 주차도 빈 항목으로 캐시해 다시 조회하지 않습니다.
+McDonald 사전 버전이 바뀌면 전체를 비웁니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+# 기사가 없는 주차 표시
+EMPTY_WEEK = {}
+
+
+class WeeklySentimentCache:
+    """(stock_symbol, weekstart) -> {'weekly_score', 'top3_articles'} 를 보관하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_weeks: int):
+        self.max_weeks = max_weeks
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, object], Dict]" = OrderedDict()
+        self.dict_version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, dict_version: str):
+        # 사전 버전이 바뀌면 이전 버전으로 계산한 결과는 모두 무효 (lock 안에서 호출)
+        if self.dict_version != dict_version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.dict_version = dict_version
+
+    def get_many(self, stock_symbol: str, weeks: Iterable, dict_version: str) -> Dict:
+        """캐시된 주차만 {weekstart: entry}로 반환합니다. (빈 주차는 EMPTY_WEEK, 주차마다 hit/miss 집계)"""
+        found = {}
+        with self._lock:
+            self._check_version(dict_version)
+            for week in weeks:
+                key = (stock_symbol, week)
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[week] = entry
+        return found
+
+    def put_many(self, stock_symbol: str, entries: Dict, dict_version: str):
+        """{weekstart: entry} 저장 (max_weeks를 넘으면 LRU 순서로 제거)"""
+        with self._lock:
+            self._check_version(dict_version)
+            for week, entry in entries.items():
+                key = (stock_symbol, week)
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_weeks:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, weeks: Iterable[Tuple[str, object]]):
+        """점수가 바뀐 (stock_symbol, weekstart) 주차 제거"""
+        with self._lock:
+            for key in weeks:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.dict_version = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.WEEKLY_SENTIMENT_CACHE_ENABLED,
+                "weeks": len(self._entries),
+                "max_weeks": self.max_weeks,
+                "dict_version": self.dict_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# 프로세스 공용 캐시 인스턴스
+weekly_sentiment_cache = WeeklySentimentCache(settings.WEEKLY_SENTIMENT_CACHE_MAX_WEEKS)
+
+
+def get_cached_weeks(stock_symbol: str, weeks, dict_version: str) -> Dict:
+    if not settings.WEEKLY_SENTIMENT_CACHE_ENABLED or not weeks:
+        return {}
+    return weekly_sentiment_cache.get_many(stock_symbol, weeks, dict_version)
+
+
+def cache_weeks(stock_symbol: str, entries: Dict, dict_version: str):
+    if settings.WEEKLY_SENTIMENT_CACHE_ENABLED and entries:
+        weekly_sentiment_cache.put_many(stock_symbol, entries, dict_version)
+
+
+def copy_entry(entry: Optional[Dict]) -> Optional[Dict]:
+    """호출자가 결과를 수정해도 캐시가 바뀌지 않도록 top3 dict를 복사"""
+    if not entry:
+        return entry
+    return {
+        "weekly_score": entry["weekly_score"],
+        "top3_articles": [dict(article) for article in entry["top3_articles"]],
+    }
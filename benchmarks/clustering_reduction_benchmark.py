@@ -0,0 +1,111 @@
+"""
+클러스터링 차원 축소 벤치마크: 원본 768차원 HDBSCAN vs PCA / UMAP 축소 후 HDBSCAN
+
+기사가 많은 주차(기본: 시장 전체 주차)를 골라 제목 임베딩은 한 번만 계산하고,
+방식별로 클러스터링 시간과 원본 방식 대비 top3 대표 기사 일치 수, 라벨 ARI를 비교합니다.
+(UMAP은 시드를 바꿔 반복 실행했을 때 자기 자신과의 top3 일치 수도 함께 출력)
+
+사용법:
+    python -m benchmarks.clustering_reduction_benchmark                      # 기사 수 상위 5개 시장 주차
+    python -m benchmarks.clustering_reduction_benchmark --sector Technology  # 특정 섹터 주차
+    python -m benchmarks.clustering_reduction_benchmark --weeks 10 --dim 10 --methods pca,umap
+"""
+import argparse
+import time
+
+from sklearn.metrics import adjusted_rand_score
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.connection import get_sqlalchemy_engine
+from app.services.clustering import (
+    _extract_valid_articles,
+    cluster_embeddings,
+    get_articles_by_sector,
+    get_hot_articles_by_date,
+)
+from app.services.embedding_service import embed_article_titles
+
+
+def busiest_weeks(sector: str, limit: int) -> list:
+    """기사 수가 많은 주차 목록 (weekstart_sunday 문자열)"""
+    condition = "AND sector = :sector" if sector else ""
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text(f"""
+            SELECT weekstart_sunday, COUNT(*) AS n FROM kb_enterprise_dataset
+            WHERE weekstart_sunday IS NOT NULL AND article IS NOT NULL AND article != ''
+              AND article_title IS NOT NULL AND article_title != '' {condition}
+            GROUP BY weekstart_sunday ORDER BY n DESC LIMIT :limit
+        """), {"sector": sector, "limit": limit}).fetchall()
+    return [row[0].strftime('%Y-%m-%d') for row in rows]
+
+
+def top3_ids(article_ids, medoid_positions) -> list:
+    return [article_ids[i] for i in medoid_positions[:3]]
+
+
+def time_clustering(embeddings, method: str, dim: int):
+    start = time.perf_counter()
+    labels, medoid_positions = cluster_embeddings(embeddings, method, dim)
+    return time.perf_counter() - start, labels, medoid_positions
+
+
+def run(sector: str, weeks: list, methods: list, dim: int, seeds: int):
+    # 벤치마크에서는 기사 수와 무관하게 축소 적용
+    settings.CLUSTER_REDUCTION_MIN_ARTICLES = 0
+    totals = {method: 0.0 for method in ["none"] + methods}
+
+    for week in weeks:
+        rows = get_articles_by_sector(sector, week) if sector else get_hot_articles_by_date(week)
+        _, titles, article_ids = _extract_valid_articles(rows)
+        if len(titles) < 3:
+            continue
+        embeddings = embed_article_titles(article_ids, titles)
+        print(f"\n[{week}] 기사 {len(titles):,}건, 임베딩 {embeddings.shape[1]}차원")
+
+        base_sec, base_labels, base_medoids = time_clustering(embeddings, "none", dim)
+        base_top3 = top3_ids(article_ids, base_medoids)
+        totals["none"] += base_sec
+        print(f"  none : {base_sec:7.3f}s, 클러스터 {len(base_medoids)}개")
+
+        for method in methods:
+            sec, labels, medoids = time_clustering(embeddings, method, dim)
+            totals[method] += sec
+            overlap = len(set(base_top3) & set(top3_ids(article_ids, medoids)))
+            ari = adjusted_rand_score(base_labels, labels)
+            print(f"  {method:5s}: {sec:7.3f}s, 클러스터 {len(medoids)}개, "
+                  f"top3 일치 {overlap}/3, ARI {ari:.3f}, x{base_sec / sec:.1f}")
+
+            if method == "umap" and seeds > 1:
+                # 시드에 따른 UMAP 결과 흔들림 (첫 실행 top3 대비)
+                first_top3 = set(top3_ids(article_ids, medoids))
+                original_seed = settings.CLUSTER_REDUCTION_SEED
+                overlaps = []
+                for seed in range(1, seeds):
+                    settings.CLUSTER_REDUCTION_SEED = original_seed + seed
+                    _, _, seed_medoids = time_clustering(embeddings, method, dim)
+                    overlaps.append(len(first_top3 & set(top3_ids(article_ids, seed_medoids))))
+                settings.CLUSTER_REDUCTION_SEED = original_seed
+                print(f"         시드 변경 시 top3 일치: {overlaps}")
+
+    print("\n=== 전체 클러스터링 시간 ===")
+    for method, sec in totals.items():
+        print(f"{method:5s}: {sec:.3f}s" + (f" (x{totals['none'] / sec:.1f})" if method != "none" and sec else ""))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="클러스터링 차원 축소 벤치마크")
+    parser.add_argument("--sector", default=None, help="섹터 주차 사용 (없으면 시장 전체 주차)")
+    parser.add_argument("--weeks", type=int, default=5, help="기사 수 상위 주차 수")
+    parser.add_argument("--methods", default="pca,umap", help="비교할 축소 방식 (쉼표 구분)")
+    parser.add_argument("--dim", type=int, default=settings.CLUSTER_REDUCTION_DIM)
+    parser.add_argument("--seeds", type=int, default=3, help="UMAP 시드 안정성 확인 실행 횟수")
+    args = parser.parse_args()
+
+    run(
+        args.sector,
+        busiest_weeks(args.sector, args.weeks),
+        [m.strip() for m in args.methods.split(",") if m.strip()],
+        args.dim,
+        args.seeds
+    )
@@ -0,0 +1,164 @@
+"""
+추론 백엔드 벤치마크 + 정확도 차이 확인: fp32 torch vs int8 / onnx
+
+- embeddings: 제목/키워드 임베딩 모델을 fp32와 int8로 각각 로드해 같은 텍스트를 임베딩하고
+  행별 cosine 유사도(평균/최소/하위 1%)와 최근접 이웃 일치율, 처리 속도, 로드 시 RSS 증가량을 비교합니다.
+- summaries: BART를 fp32와 int8/onnx로 각각 로드해 같은 기사를 요약하고
+  fp32 요약 대비 ROUGE-1 / ROUGE-L F1, 처리 속도, 로드 시 RSS 증가량을 비교합니다.
+
+사용법:
+    python -m benchmarks.inference_backend_benchmark embeddings --model title --count 2000
+    python -m benchmarks.inference_backend_benchmark embeddings --model keyword --count 500
+    python -m benchmarks.inference_backend_benchmark summaries --symbol AAPL --count 16 --backends int8,onnx
+"""
+import argparse
+import gc
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from app.core.model_registry import _current_rss_bytes
+from app.db.connection import get_sqlalchemy_engine
+from app.services.nlp_models import load_bart_summarizer, load_keyword_embedding, load_title_embedding
+from app.services.summarize import english_summaries
+
+EMBEDDING_LOADERS = {"title": load_title_embedding, "keyword": load_keyword_embedding}
+
+
+def load_texts(column: str, symbol: str, limit: int) -> list:
+    condition = "AND stock_symbol = :symbol" if symbol else ""
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text(f"""
+            SELECT {column} FROM kb_enterprise_dataset
+            WHERE {column} IS NOT NULL AND {column} != '' AND article IS NOT NULL AND article != '' {condition}
+            ORDER BY date DESC
+            LIMIT :limit
+        """), {"symbol": symbol, "limit": limit}).fetchall()
+    return [row[0].strip() for row in rows]
+
+
+def timed_load(loader, backend: str):
+    gc.collect()
+    rss_before = _current_rss_bytes()
+    start = time.perf_counter()
+    model = loader(backend)
+    load_sec = time.perf_counter() - start
+    rss_after = _current_rss_bytes()
+    rss_mb = (rss_after - rss_before) / (1024 * 1024) if rss_before is not None and rss_after is not None else float("nan")
+    return model, load_sec, rss_mb
+
+
+def _tokens(summary: str) -> list:
+    return summary.lower().split()
+
+
+def rouge_1_f1(reference: str, candidate: str) -> float:
+    ref, cand = _tokens(reference), _tokens(candidate)
+    if not ref or not cand:
+        return 0.0
+    ref_counts, cand_counts = {}, {}
+    for token in ref:
+        ref_counts[token] = ref_counts.get(token, 0) + 1
+    for token in cand:
+        cand_counts[token] = cand_counts.get(token, 0) + 1
+    overlap = sum(min(count, ref_counts.get(token, 0)) for token, count in cand_counts.items())
+    if overlap == 0:
+        return 0.0
+    precision, recall = overlap / len(cand), overlap / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_l_f1(reference: str, candidate: str) -> float:
+    ref, cand = _tokens(reference), _tokens(candidate)
+    if not ref or not cand:
+        return 0.0
+    # 최장 공통 부분 수열 (LCS) 길이
+    prev = [0] * (len(cand) + 1)
+    for r in ref:
+        curr = [0] * (len(cand) + 1)
+        for j, c in enumerate(cand, 1):
+            curr[j] = prev[j - 1] + 1 if r == c else max(prev[j], curr[j - 1])
+        prev = curr
+    lcs = prev[-1]
+    if lcs == 0:
+        return 0.0
+    precision, recall = lcs / len(cand), lcs / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def run_embeddings(model_key: str, texts: list, backends: list, batch_size: int):
+    loader = EMBEDDING_LOADERS[model_key]
+    print(f"[{model_key} 임베딩] 텍스트 {len(texts):,}건")
+
+    results = {}
+    for backend in ["torch"] + backends:
+        model, load_sec, rss_mb = timed_load(loader, backend)
+        model.encode(texts[:batch_size], batch_size=batch_size, show_progress_bar=False)  # warm-up
+        start = time.perf_counter()
+        vectors = model.encode(texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True)
+        encode_sec = time.perf_counter() - start
+        results[backend] = vectors
+        print(f"  {backend:5s}: 로드 {load_sec:.1f}s (RSS +{rss_mb:.0f}MB), "
+              f"encode {encode_sec:.2f}s ({len(texts) / encode_sec:.1f} texts/sec)")
+        del model
+        gc.collect()
+
+    base = results["torch"]
+    base_norm = base / np.linalg.norm(base, axis=1, keepdims=True)
+    base_nn = np.argsort(base_norm @ base_norm.T, axis=1)[:, -2]
+    for backend in backends:
+        other = results[backend]
+        other_norm = other / np.linalg.norm(other, axis=1, keepdims=True)
+        cosine = np.sum(base_norm * other_norm, axis=1)
+        other_nn = np.argsort(other_norm @ other_norm.T, axis=1)[:, -2]
+        print(f"  {backend:5s} vs fp32: cosine 평균 {cosine.mean():.4f}, 최소 {cosine.min():.4f}, "
+              f"하위 1% {np.percentile(cosine, 1):.4f}, 최근접 이웃 일치 {np.mean(base_nn == other_nn):.3f}")
+
+
+def run_summaries(articles: list, backends: list, batch_size: int):
+    print(f"[BART 요약] 기사 {len(articles):,}건")
+
+    results = {}
+    for backend in ["torch"] + backends:
+        summarizer, load_sec, rss_mb = timed_load(load_bart_summarizer, backend)
+        start = time.perf_counter()
+        results[backend] = english_summaries(articles, batch_size=batch_size, summarizer=summarizer)
+        summarize_sec = time.perf_counter() - start
+        print(f"  {backend:5s}: 로드 {load_sec:.1f}s (RSS +{rss_mb:.0f}MB), "
+              f"요약 {summarize_sec:.1f}s ({len(articles) / summarize_sec:.2f} articles/sec)")
+        del summarizer
+        gc.collect()
+
+    for backend in backends:
+        pairs = list(zip(results["torch"], results[backend]))
+        rouge_1 = [rouge_1_f1(ref, cand) for ref, cand in pairs]
+        rouge_l = [rouge_l_f1(ref, cand) for ref, cand in pairs]
+        identical = sum(ref == cand for ref, cand in pairs)
+        print(f"  {backend:5s} vs fp32: ROUGE-1 F1 {np.mean(rouge_1):.4f}, ROUGE-L F1 {np.mean(rouge_l):.4f} "
+              f"(최소 {np.min(rouge_l):.4f}), 동일 요약 {identical}/{len(pairs)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="추론 백엔드 벤치마크 및 정확도 차이 확인")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embeddings_parser = subparsers.add_parser("embeddings", help="임베딩 모델 fp32 vs int8")
+    embeddings_parser.add_argument("--model", choices=tuple(EMBEDDING_LOADERS), default="title")
+    embeddings_parser.add_argument("--symbol", default=None, help="해당 종목 기사만 사용 (없으면 최근 기사)")
+    embeddings_parser.add_argument("--count", type=int, default=2000)
+    embeddings_parser.add_argument("--batch-size", type=int, default=64)
+
+    summaries_parser = subparsers.add_parser("summaries", help="BART fp32 vs int8/onnx")
+    summaries_parser.add_argument("--symbol", default=None, help="해당 종목 기사만 사용 (없으면 최근 기사)")
+    summaries_parser.add_argument("--count", type=int, default=16)
+    summaries_parser.add_argument("--backends", default="int8", help="비교할 백엔드 (쉼표 구분: int8,onnx)")
+    summaries_parser.add_argument("--batch-size", type=int, default=4)
+
+    args = parser.parse_args()
+    if args.command == "embeddings":
+        column = "article_title" if args.model == "title" else "article"
+        run_embeddings(args.model, load_texts(column, args.symbol, args.count), ["int8"], args.batch_size)
+    elif args.command == "summaries":
+        backends = [b.strip() for b in args.backends.split(",") if b.strip() and b.strip() != "torch"]
+        run_summaries(load_texts("article", args.symbol, args.count), backends, args.batch_size)
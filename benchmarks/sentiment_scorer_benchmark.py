@@ -0,0 +1,119 @@
+"""
+McDonald 감성점수 계산 벤치마크: 기존 단어별 dict 조회 방식 vs 벡터화 계산기(McDonaldScorer)
+
+두 방식의 결과가 모든 기사에서 일치하는지 확인한 뒤 처리 속도를 비교합니다.
+
+사용법:
+    python -m benchmarks.sentiment_scorer_benchmark                    # 사전 단어로 만든 합성 기사
+    python -m benchmarks.sentiment_scorer_benchmark --symbol AAPL      # DB의 실제 기사
+"""
+import argparse
+import random
+import time
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.services.cache_manager import get_mcdonald_word_info, load_mcdonald_dictionary
+from app.services.sentiment import preprocess_text
+from app.services.sentiment_scorer import get_mcdonald_scorer
+
+
+def reference_sentiment_detail(article: str) -> dict:
+    """기존 get_sentiment_score_for_article + pos/neg 집계 루프와 같은 방식 (단어마다 dict 조회)"""
+    words = preprocess_text(article)
+    counts = {'positive': 0, 'negative': 0, 'uncertainty': 0, 'litigious': 0, 'constraining': 0}
+    sums = {'positive': 0.0, 'negative': 0.0, 'uncertainty': 0.0, 'litigious': 0.0, 'constraining': 0.0}
+    for word in words:
+        word_info = get_mcdonald_word_info(word)
+        if word_info:
+            for category in counts:
+                if word_info[category] > 0:
+                    counts[category] += 1
+                    sums[category] += word_info[category]
+
+    total_count = sum(counts.values())
+    if total_count == 0:
+        score = 0.0
+    else:
+        score = round((
+            counts['positive'] - counts['negative']
+            - 1.0 * counts['uncertainty']
+            - 1.0 * counts['litigious']
+            - 1.0 * counts['constraining']
+        ) / total_count, 3)
+
+    prefixes = {'positive': 'pos', 'negative': 'neg'}
+    detail = {'score': score}
+    for category in counts:
+        detail[f"{prefixes.get(category, category)}_cnt"] = counts[category]
+    for category in sums:
+        detail[f"{prefixes.get(category, category)}_sum"] = sums[category]
+    return detail
+
+
+def load_articles(symbol: str, limit: int) -> list:
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text("""
+            SELECT article FROM kb_enterprise_dataset
+            WHERE stock_symbol = :symbol AND article IS NOT NULL AND article != ''
+            LIMIT :limit
+        """), {"symbol": symbol, "limit": limit}).fetchall()
+    return [row[0] for row in rows]
+
+
+def synthetic_articles(count: int, words_per_article: int, seed: int = 42) -> list:
+    """사전 단어(약 5%)와 일반 단어를 섞은 합성 기사"""
+    rng = random.Random(seed)
+    vocabulary = list(load_mcdonald_dictionary().iter_words())
+    filler = ["the", "company", "said", "quarter", "market", "shares", "revenue", "2023", "Inc.", "analysts,"]
+    articles = []
+    for _ in range(count):
+        tokens = [
+            rng.choice(vocabulary).lower() if rng.random() < 0.05 else rng.choice(filler)
+            for _ in range(words_per_article)
+        ]
+        articles.append(" ".join(tokens))
+    return articles
+
+
+def run(articles: list, batch_size: int):
+    scorer = get_mcdonald_scorer()
+    total_words = sum(len(preprocess_text(a)) for a in articles)
+    print(f"기사 {len(articles):,}건, 단어 {total_words:,}개")
+
+    start = time.perf_counter()
+    expected = [reference_sentiment_detail(a) for a in articles]
+    reference_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = []
+    for i in range(0, len(articles), batch_size):
+        actual.extend(scorer.score_batch(articles[i:i + batch_size]))
+    vectorized_sec = time.perf_counter() - start
+
+    mismatches = [i for i, (e, a) in enumerate(zip(expected, actual)) if e != a]
+    print(f"결과 일치: {len(articles) - len(mismatches):,}/{len(articles):,}")
+    if mismatches:
+        i = mismatches[0]
+        print(f"  첫 불일치 #{i}: expected={expected[i]} actual={actual[i]}")
+
+    print(f"기존 방식 : {reference_sec:.3f}s ({len(articles) / reference_sec:,.0f} articles/sec)")
+    print(f"벡터화    : {vectorized_sec:.3f}s ({len(articles) / vectorized_sec:,.0f} articles/sec, batch={batch_size})")
+    print(f"속도 향상 : x{reference_sec / vectorized_sec:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="McDonald 감성점수 계산 벤치마크")
+    parser.add_argument("--symbol", default=None, help="DB에서 해당 종목 기사 사용 (없으면 합성 기사)")
+    parser.add_argument("--count", type=int, default=2000, help="기사 수")
+    parser.add_argument("--words", type=int, default=600, help="합성 기사당 단어 수")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    load_mcdonald_dictionary()
+    if args.symbol:
+        articles = load_articles(args.symbol, args.count)
+    else:
+        articles = synthetic_articles(args.count, args.words)
+    run(articles, args.batch_size)
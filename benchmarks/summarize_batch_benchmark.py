@@ -0,0 +1,85 @@
+"""
+BART 요약 벤치마크: 기존 기사별 summarizer 호출 루프 vs 길이별 배치 요약(english_summaries)
+
+번역(OpenAI)은 제외하고 영문 요약 단계만 비교합니다. 두 방식의 요약문 일치 수와 처리 속도(articles/sec)를 출력합니다.
+(배치 패딩으로 인해 부동소수점 차이가 생기면 일부 요약문이 다를 수 있음)
+
+사용법:
+    python -m benchmarks.summarize_batch_benchmark --symbol AAPL --count 24
+    python -m benchmarks.summarize_batch_benchmark --symbol AAPL --batch-sizes 2,4,8
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.db.connection import get_sqlalchemy_engine
+from app.services.nlp_models import get_bart_tokenizer, get_summarizer
+from app.services.summarize import classify_length, english_summaries, extractive_summarize, ratio_map
+
+
+def reference_english_summary(article: str) -> str:
+    """기존 summarize_top3_articles의 summarize_by_length와 같은 방식 (기사/청크마다 summarizer 1회 호출)"""
+    tokenizer = get_bart_tokenizer()
+    summarizer = get_summarizer()
+    tokens = len(tokenizer.encode(article, truncation=False))
+    cls = classify_length(tokens)
+    if cls == "short":
+        return article
+
+    extract_text = extractive_summarize(article, ratio=ratio_map[cls])
+    if cls in ("medium", "long"):
+        max_len = max(50, int(tokens * 0.2)) if cls == "medium" else max(75, int(tokens * 0.15))
+        return summarizer(extract_text, max_length=max_len, min_length=50, truncation=True)[0]["summary_text"]
+
+    token_ids = tokenizer.encode(extract_text, truncation=False)
+    chunks = [tokenizer.decode(token_ids[i:i + 1000]) for i in range(0, len(token_ids), 1000)]
+    interim = [
+        summarizer(chunk, max_length=200, min_length=75, truncation=True)[0]["summary_text"]
+        for chunk in chunks
+    ]
+    return summarizer(" ".join(interim), max_length=200, min_length=75, truncation=True)[0]["summary_text"]
+
+
+def load_articles(symbol: str, limit: int) -> list:
+    with get_sqlalchemy_engine().connect() as conn:
+        rows = conn.execute(text("""
+            SELECT article FROM kb_enterprise_dataset
+            WHERE stock_symbol = :symbol AND article IS NOT NULL AND article != ''
+            ORDER BY date DESC
+            LIMIT :limit
+        """), {"symbol": symbol, "limit": limit}).fetchall()
+    return [row[0] for row in rows]
+
+
+def run(articles: list, batch_sizes: list):
+    tokenizer = get_bart_tokenizer()
+    get_summarizer()
+    classes = {}
+    for article in articles:
+        cls = classify_length(len(tokenizer.encode(article, truncation=False)))
+        classes[cls] = classes.get(cls, 0) + 1
+    print(f"기사 {len(articles):,}건, 길이 분포: {classes}")
+
+    start = time.perf_counter()
+    expected = [reference_english_summary(a) for a in articles]
+    reference_sec = time.perf_counter() - start
+    print(f"기존 루프     : {reference_sec:.2f}s ({len(articles) / reference_sec:.2f} articles/sec)")
+
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        actual = english_summaries(articles, batch_size=batch_size)
+        batched_sec = time.perf_counter() - start
+        matches = sum(e == a for e, a in zip(expected, actual))
+        print(f"배치 (size={batch_size:2d}): {batched_sec:.2f}s ({len(articles) / batched_sec:.2f} articles/sec, "
+              f"x{reference_sec / batched_sec:.2f}), 요약문 일치 {matches}/{len(articles)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BART 요약 배치 벤치마크")
+    parser.add_argument("--symbol", required=True, help="DB에서 해당 종목의 최근 기사 사용")
+    parser.add_argument("--count", type=int, default=24, help="기사 수")
+    parser.add_argument("--batch-sizes", default="1,4,8", help="비교할 배치 크기 (쉼표 구분)")
+    args = parser.parse_args()
+
+    run(load_articles(args.symbol, args.count), [int(b) for b in args.batch_sizes.split(",")])